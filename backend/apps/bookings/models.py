@@ -41,6 +41,9 @@ class Booking(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'updated_at'], name='booking_user_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.facility.name} - {self.user.full_name} ({self.start_datetime.date()})"
\ No newline at end of file
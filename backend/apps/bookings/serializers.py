@@ -1,13 +1,14 @@
 from rest_framework import serializers
 from .models import Facility, Booking
+from apps.core.dynamic_fields import DynamicFieldsMixin
 
-class FacilitySerializer(serializers.ModelSerializer):
+class FacilitySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Facility
         fields = ['id', 'name', 'description', 'capacity', 'hourly_rate', 
                  'is_active', 'rules', 'created_at']
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     facility_name = serializers.CharField(source='facility.name', read_only=True)
     user_name = serializers.CharField(source='user.full_name', read_only=True)
     
@@ -16,4 +17,5 @@ class BookingSerializer(serializers.ModelSerializer):
         fields = ['id', 'facility', 'facility_name', 'user', 'user_name',
                  'start_datetime', 'end_datetime', 'purpose', 'expected_guests',
                  'special_requests', 'status', 'admin_notes', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        expandable_fields = {'facility': FacilitySerializer, 'user': 'apps.users.serializers.UserSummarySerializer'}
\ No newline at end of file
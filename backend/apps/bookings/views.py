@@ -1,38 +1,48 @@
 from rest_framework import generics, permissions
 from django.shortcuts import render
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
 # Only include these if you have the Facility and Booking models:
 from .models import Facility, Booking
 from .serializers import FacilitySerializer, BookingSerializer
 
-class FacilityListView(generics.ListAPIView):
+class FacilityListView(OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = Facility.objects.filter(is_active=True)
     serializer_class = FacilitySerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class FacilityDetailView(generics.RetrieveAPIView):
+class FacilityDetailView(OptimizedQuerysetMixin, generics.RetrieveAPIView):
     queryset = Facility.objects.filter(is_active=True)
     serializer_class = FacilitySerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
 
-class BookingListView(generics.ListAPIView):
+class BookingListView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = BookingSerializer
     permission_classes = [IsResident]
+    query_budget = 2
     
     def get_queryset(self):
+        queryset = Booking.objects.all()
         if self.request.user.role == 'admin':
-            return Booking.objects.all()
-        return Booking.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
-class BookingDetailView(generics.RetrieveAPIView):
+class BookingDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = BookingSerializer
     permission_classes = [IsResident]
+    query_budget = 2
     
     def get_queryset(self):
+        queryset = Booking.objects.all()
         if self.request.user.role == 'admin':
-            return Booking.objects.all()
-        return Booking.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
 class BookingCreateView(generics.CreateAPIView):
     queryset = Booking.objects.all()
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:46
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardMember',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('position', models.CharField(max_length=100)),
+                ('bio', models.TextField(blank=True)),
+                ('photo', models.ImageField(blank=True, null=True, upload_to='board/')),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ContactInfo',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('title', models.CharField(blank=True, max_length=100)),
+                ('phone', models.CharField(max_length=20)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('is_emergency', models.BooleanField(default=False)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name': 'Contact Information',
+                'verbose_name_plural': 'Contact Information',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Page',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('slug', models.SlugField(unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('content', models.TextField()),
+                ('is_published', models.BooleanField(default=True)),
+                ('meta_description', models.TextField(blank=True, max_length=160)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
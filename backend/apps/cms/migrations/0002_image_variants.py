@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:39
+
+import apps.core.images
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardmember',
+            name='photo_variants',
+            field=apps.core.images.ImageVariantsField(blank=True, default=dict, editable=False, source='photo'),
+        ),
+        migrations.AlterField(
+            model_name='boardmember',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, upload_to='board/', validators=[apps.core.images.validate_image_pixels]),
+        ),
+    ]
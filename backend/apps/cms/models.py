@@ -2,6 +2,8 @@ import uuid
 from django.db import models
 from django.conf import settings
 
+from apps.core.images import ImageVariantsField, validate_image_pixels
+
 class Page(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     slug = models.SlugField(unique=True)
@@ -38,7 +40,8 @@ class BoardMember(models.Model):
     name = models.CharField(max_length=100)
     position = models.CharField(max_length=100)
     bio = models.TextField(blank=True)
-    photo = models.ImageField(upload_to='board/', blank=True, null=True)
+    photo = models.ImageField(upload_to='board/', blank=True, null=True, validators=[validate_image_pixels])
+    photo_variants = ImageVariantsField(source='photo')
     email = models.EmailField(blank=True)
     order = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
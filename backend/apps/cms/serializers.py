@@ -1,21 +1,27 @@
 from rest_framework import serializers
 from .models import Page, ContactInfo, BoardMember
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.fragments import FragmentCacheMixin, FragmentListSerializer
+from apps.core.images import ResponsiveImageField
 
-class PageSerializer(serializers.ModelSerializer):
+class PageSerializer(FragmentCacheMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Page
         fields = ['id', 'slug', 'title', 'content', 'is_published', 
                  'meta_description', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
+        list_serializer_class = FragmentListSerializer
 
-class ContactInfoSerializer(serializers.ModelSerializer):
+class ContactInfoSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ContactInfo
         fields = ['id', 'name', 'title', 'phone', 'email', 'is_emergency', 
                  'order', 'is_active']
 
-class BoardMemberSerializer(serializers.ModelSerializer):
+class BoardMemberSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    photo_srcset = ResponsiveImageField(source='photo_variants')
+
     class Meta:
         model = BoardMember
-        fields = ['id', 'name', 'position', 'bio', 'photo', 'email', 
+        fields = ['id', 'name', 'position', 'bio', 'photo', 'photo_srcset', 'email', 
                  'order', 'is_active']
\ No newline at end of file
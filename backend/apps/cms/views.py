@@ -3,16 +3,22 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import Page, ContactInfo, BoardMember
 from .serializers import PageSerializer, ContactInfoSerializer, BoardMemberSerializer
 from apps.users.permissions import IsAdmin
+from apps.core.cache import PublicCacheMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
-class PageListView(generics.ListAPIView):
+class PageListView(PublicCacheMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = Page.objects.filter(is_published=True)
     serializer_class = PageSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class PageDetailView(generics.RetrieveAPIView):
+class PageDetailView(PublicCacheMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     queryset = Page.objects.filter(is_published=True)
     serializer_class = PageSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
     lookup_field = 'slug'
 
 class PageCreateView(generics.CreateAPIView):
@@ -31,15 +37,18 @@ class PageDeleteView(generics.DestroyAPIView):
     permission_classes = [IsAdmin]
     lookup_field = 'slug'
 
-class ContactInfoListView(generics.ListAPIView):
+class ContactInfoListView(PublicCacheMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = ContactInfo.objects.filter(is_active=True)
     serializer_class = ContactInfoSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class ContactInfoDetailView(generics.RetrieveAPIView):
+class ContactInfoDetailView(OptimizedQuerysetMixin, generics.RetrieveAPIView):
     queryset = ContactInfo.objects.filter(is_active=True)
     serializer_class = ContactInfoSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
 
 class ContactInfoCreateView(generics.CreateAPIView):
     queryset = ContactInfo.objects.all()
@@ -55,15 +64,18 @@ class ContactInfoDeleteView(generics.DestroyAPIView):
     queryset = ContactInfo.objects.all()
     permission_classes = [IsAdmin]
 
-class BoardMemberListView(generics.ListAPIView):
+class BoardMemberListView(PublicCacheMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = BoardMember.objects.filter(is_active=True)
     serializer_class = BoardMemberSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class BoardMemberDetailView(generics.RetrieveAPIView):
+class BoardMemberDetailView(OptimizedQuerysetMixin, generics.RetrieveAPIView):
     queryset = BoardMember.objects.filter(is_active=True)
     serializer_class = BoardMemberSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
 
 class BoardMemberCreateView(generics.CreateAPIView):
     queryset = BoardMember.objects.all()
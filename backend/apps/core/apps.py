@@ -0,0 +1,27 @@
+from django.apps import AppConfig
+from django.core import checks
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+
+    def ready(self):
+        from .cache import invalidate_public_cache
+        from .db import check_persistent_connections, count_connection, count_request
+        from .db import slow_queries
+        from .metrics import install_query_counter, instrument_serializers
+        from .sync import track_deletions
+
+        post_save.connect(invalidate_public_cache, dispatch_uid='core.invalidate_public_cache.save')
+        post_delete.connect(invalidate_public_cache, dispatch_uid='core.invalidate_public_cache.delete')
+        connection_created.connect(count_connection, dispatch_uid='core.count_connection')
+        request_finished.connect(count_request, dispatch_uid='core.count_request')
+        connection_created.connect(install_query_counter, dispatch_uid='core.install_query_counter')
+        connection_created.connect(slow_queries.install, dispatch_uid='core.install_slow_query_log')
+        instrument_serializers()
+        track_deletions()
+        checks.register(check_persistent_connections)
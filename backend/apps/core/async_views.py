@@ -0,0 +1,141 @@
+"""
+Native async variants of DRF list/detail views for the ASGI deployment.
+
+``read_view(NewsListView)`` returns the usual ``as_view()`` callable, or,
+with ``ASYNC_READ_VIEWS`` on (the default under ``hoa_backend.asgi``), an
+``async def`` view built from the same class: same queryset, filters,
+permissions, serializer, pagination, ETags and public cache, but with the
+JWT user lookup and the queries awaited through Django's async ORM instead
+of holding a worker thread for the whole request.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.mixins import ListModelMixin
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+User = get_user_model()
+
+
+def read_view(view_class, **initkwargs):
+    if getattr(settings, 'ASYNC_READ_VIEWS', False):
+        return async_read_view(view_class, **initkwargs)
+    return view_class.as_view(**initkwargs)
+
+
+def async_read_view(view_class, **initkwargs):
+    # AsyncReadMixin goes last in the MRO so mixins such as PublicCacheMixin
+    # and ConditionalGetMixin wrap its aget() like they wrap get().
+    async_class = type('Async' + view_class.__name__, (view_class, AsyncReadMixin), {
+        '__module__': view_class.__module__,
+    })
+    return async_class.as_async_view(**initkwargs)
+
+
+class AsyncReadMixin:
+    """GET-only async request handling for a DRF ``GenericAPIView``."""
+
+    @classmethod
+    def as_async_view(cls, **initkwargs):
+        async def view(request, *args, **kwargs):
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)
+            return await self.adispatch(request, *args, **kwargs)
+
+        view.view_class = cls
+        view.view_initkwargs = initkwargs
+        view.csrf_exempt = True
+        return view
+
+    async def adispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            if request.method not in ('GET', 'HEAD'):
+                raise exceptions.MethodNotAllowed(request.method)
+            request.user, request.auth = await self.aauthenticate(request)
+            self.initial(request, *args, **kwargs)
+            response = await self.aget(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        if hasattr(self.response, 'render'):
+            self.response.render()
+        return self.response
+
+    async def aauthenticate(self, request):
+        for authenticator in request.authenticators:
+            if isinstance(authenticator, JWTAuthentication):
+                result = await self.aauthenticate_jwt(authenticator, request)
+            else:
+                result = await sync_to_async(authenticator.authenticate)(request)
+            if result is not None:
+                request._authenticator = authenticator
+                return result
+        return AnonymousUser(), None
+
+    async def aauthenticate_jwt(self, authenticator, request):
+        header = authenticator.get_header(request)
+        if header is None:
+            return None
+        raw_token = authenticator.get_raw_token(header)
+        if raw_token is None:
+            return None
+        token = authenticator.get_validated_token(raw_token)
+        try:
+            user_id = token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        user = await User.objects.filter(**{jwt_settings.USER_ID_FIELD: user_id}).afirst()
+        if user is None:
+            raise exceptions.AuthenticationFailed('User not found', code='user_not_found')
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed('User is inactive', code='user_inactive')
+        return user, token
+
+    async def aget(self, request, *args, **kwargs):
+        if isinstance(self, ListModelMixin):
+            return await self.alist(request)
+        return await self.aretrieve(request)
+
+    async def afilter_queryset(self, queryset):
+        if not self.request.query_params:
+            return self.filter_queryset(queryset)
+        # Filter validation may look up related rows (e.g. ?category=<pk>).
+        return await sync_to_async(self.filter_queryset)(queryset)
+
+    async def alist(self, request):
+        queryset = await self.afilter_queryset(self.get_queryset())
+        is_requested = getattr(self.paginator, 'is_requested', None)
+        if self.paginator is not None and (is_requested is None or is_requested(request)):
+            page = await sync_to_async(self.paginate_queryset)(queryset)
+            if page is not None:
+                return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        rows = [obj async for obj in queryset]
+        return Response(self.get_serializer(rows, many=True).data)
+
+    async def aretrieve(self, request):
+        queryset = await self.afilter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).afirst()
+        except (TypeError, ValueError, ValidationError):
+            obj = None
+        if obj is None:
+            raise Http404
+        self.check_object_permissions(request, obj)
+        return Response(self.get_serializer(obj).data)
@@ -0,0 +1,169 @@
+"""
+Several GET requests in one round trip.
+
+``POST /api/batch/`` with::
+
+    {"requests": ["/api/users/profile/",
+                  {"path": "/api/news/?limit=5", "headers": {"If-None-Match": "\\"...\\""}}],
+     "concurrent": true}
+
+resolves each path against the URLconf and calls its view in-process with
+the batch's authenticated user, so the token is decoded and the user looked
+up once, and the middleware stack runs once. Each sub-request reads from a
+replica the way ``ReplicaMiddleware`` would pick for it. The answer lists
+the responses in request order::
+
+    {"responses": [{"path": ..., "status": 200, "headers": {"ETag": ...}, "body": ...}, ...]}
+
+With ``"concurrent": true`` the sub-requests run on up to
+``BATCH_MAX_CONCURRENCY`` threads, each on its own database connections.
+A batch takes at most ``BATCH_MAX_REQUESTS`` paths under ``/api/``, and
+sub-requests still unanswered after ``BATCH_TIMEOUT`` seconds come back as
+504s.
+"""
+import logging
+import time
+from concurrent import futures
+from urllib.parse import urlsplit
+
+import orjson
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework.response import Response
+
+from .db import routers
+
+logger = logging.getLogger(__name__)
+
+PATH_PREFIX = '/api/'
+# Request headers a sub-request may set, and response headers passed back.
+REQUEST_HEADERS = {'If-None-Match', 'If-Modified-Since'}
+RESPONSE_HEADERS = ('Cache-Control', 'ETag', 'Last-Modified')
+# The body of the batch request is not the sub-requests' to read.
+DROPPED_META = ('CONTENT_LENGTH', 'CONTENT_TYPE', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+
+
+class InvalidBatch(ValueError):
+    """The batch request is malformed or over a limit."""
+
+
+def parse_batch(data):
+    """``(requests, concurrent)`` from a batch request body, where each request is ``(path, headers)``."""
+    if not isinstance(data, dict) or not isinstance(data.get('requests'), list) or not data['requests']:
+        raise InvalidBatch('Send a non-empty list of requests')
+    limit = settings.BATCH_MAX_REQUESTS
+    if len(data['requests']) > limit:
+        raise InvalidBatch('A batch takes at most %d requests' % limit)
+
+    requests = []
+    for item in data['requests']:
+        if isinstance(item, str):
+            item = {'path': item}
+        if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+            raise InvalidBatch('Each request is a path or an object with a path')
+        path = item['path']
+        if not path.startswith(PATH_PREFIX):
+            raise InvalidBatch('Only %s paths can be batched: %s' % (PATH_PREFIX, path))
+        headers = item.get('headers') or {}
+        if not isinstance(headers, dict) or not all(isinstance(value, str) for value in headers.values()):
+            raise InvalidBatch('Request headers are an object of strings')
+        unknown = set(headers) - REQUEST_HEADERS
+        if unknown:
+            raise InvalidBatch('Unsupported request headers: %s' % ', '.join(sorted(unknown)))
+        requests.append((path, headers))
+    return requests, bool(data.get('concurrent', False))
+
+
+def run_batch(request, requests, concurrent=False):
+    """The response entries of ``requests`` (from ``parse_batch``), made as ``request``'s user."""
+    deadline = time.monotonic() + settings.BATCH_TIMEOUT if settings.BATCH_TIMEOUT else None
+    workers = min(settings.BATCH_MAX_CONCURRENCY, len(requests)) if concurrent else 1
+    if workers <= 1:
+        entries = []
+        for path, headers in requests:
+            if deadline is not None and time.monotonic() > deadline:
+                entries.append(_timed_out(path))
+            else:
+                entries.append(run_one(request, path, headers))
+        return entries
+
+    executor = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch')
+    try:
+        submitted = [executor.submit(_run_in_thread, request, path, headers) for path, headers in requests]
+        futures.wait(submitted, timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [
+        future.result() if future.done() and not future.cancelled() else _timed_out(path)
+        for future, (path, _) in zip(submitted, requests)
+    ]
+
+
+def run_one(request, path, headers=None):
+    """Call the view behind ``path`` with a GET made by ``request``'s user; its response entry."""
+    parts = urlsplit(path)
+    try:
+        match = resolve(parts.path)
+    except Resolver404:
+        return _entry(path, 404, body={'error': 'Not found'})
+
+    subrequest = HttpRequest()
+    subrequest.method = 'GET'
+    subrequest.path = subrequest.path_info = parts.path
+    subrequest.META = {key: value for key, value in request.META.items() if key not in DROPPED_META}
+    subrequest.META.update(REQUEST_METHOD='GET', PATH_INFO=parts.path, QUERY_STRING=parts.query)
+    for name, value in (headers or {}).items():
+        subrequest.META['HTTP_' + name.upper().replace('-', '_')] = value
+    subrequest.GET = QueryDict(parts.query)
+    subrequest.COOKIES = request.COOKIES
+    subrequest.resolver_match = match
+    # DRF's Request takes these instead of authenticating again.
+    subrequest._force_auth_user = request.user
+    subrequest._force_auth_token = request.auth
+
+    view = match.func
+    if iscoroutinefunction(view):
+        view = async_to_sync(view)
+    try:
+        with routers.read_from(routers.choose_read_alias(match.func, request.user.pk)):
+            response = view(subrequest, *match.args, **match.kwargs)
+            if hasattr(response, 'render') and not isinstance(response, Response):
+                # A DRF response goes back as its data, rendered with the batch.
+                response.render()
+    except Exception:
+        logger.exception('Batched request to %s failed', path)
+        return _entry(path, 500, body={'error': 'Internal server error'})
+    return _entry(
+        path, response.status_code,
+        headers={name: response[name] for name in RESPONSE_HEADERS if response.has_header(name)},
+        body=_body(response),
+    )
+
+
+def _run_in_thread(request, path, headers):
+    try:
+        return run_one(request, path, headers)
+    finally:
+        # Connections are per thread; this one is done with its own.
+        connections.close_all()
+
+
+def _body(response):
+    if isinstance(response, Response):
+        return response.data
+    if response.streaming or not response.content:
+        return None
+    if response.get('Content-Type', '').startswith('application/json'):
+        return orjson.loads(response.content)
+    return response.content.decode(response.charset)
+
+
+def _entry(path, status, headers=None, body=None):
+    return {'path': path, 'status': status, 'headers': headers or {}, 'body': body}
+
+
+def _timed_out(path):
+    return _entry(path, 504, body={'error': 'Batch timed out'})
@@ -0,0 +1,144 @@
+import datetime
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from .conditional import is_not_modified
+
+GENERATION_KEY = 'public:gen:%s'
+
+# Response headers stored with the cached data and replayed on hits
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Vary')
+
+
+def model_label(model):
+    return model.lower() if isinstance(model, str) else model._meta.label_lower
+
+
+def get_generations(models):
+    """
+    Current generation number of each model label. Every save or delete of a
+    model bumps its generation, so cache keys built from these numbers go
+    stale exactly when one of the models they depend on changes.
+    """
+    keys = {GENERATION_KEY % label: label for label in models}
+    found = cache.get_many(list(keys))
+    generations = {}
+    for key, label in keys.items():
+        if key not in found:
+            # add() so concurrent first hits agree on the starting value
+            cache.add(key, 1, timeout=None)
+            found[key] = cache.get(key, 1)
+        generations[label] = found[key]
+    return generations
+
+
+def bump_generation(label):
+    key = GENERATION_KEY % label
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Nothing cached for this model yet (or the entry was evicted).
+        cache.set(key, 2, timeout=None)
+
+
+def invalidate_public_cache(sender, **kwargs):
+    """``post_save`` / ``post_delete`` receiver, connected in ``CoreConfig.ready``."""
+    if kwargs.get('raw'):
+        return
+    bump_generation(sender._meta.label_lower)
+
+
+class PublicCacheMixin:
+    """
+    Read-through cache for GET responses served to guests (anonymous users
+    and the ``guest`` role), who all see the same data.
+
+    ``cache_models`` lists every model the response is built from, including
+    related models the serializer reads (e.g. ``users.User`` for author
+    names). A save or delete of any of them invalidates the cached responses;
+    ``QuerySet.update()`` sends no signals and is not picked up.
+
+    Put it before ``ConditionalGetMixin`` so a hit answers ``If-None-Match``
+    from the cached ETag without touching the database.
+    """
+
+    cache_models = ()
+    cache_timeout = None
+
+    def get(self, request, *args, **kwargs):
+        key, timeout = self.get_cache_settings(request)
+        if key is None:
+            return super().get(request, *args, **kwargs)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return self.cached_response(request, cached)
+        return self.store_response(key, timeout, super().get(request, *args, **kwargs))
+
+    async def aget(self, request, *args, **kwargs):
+        key, timeout = await sync_to_async(self.get_cache_settings)(request)
+        if key is None:
+            return await super().aget(request, *args, **kwargs)
+
+        cached = await cache.aget(key)
+        if cached is not None:
+            return self.cached_response(request, cached)
+        response = await super().aget(request, *args, **kwargs)
+        await sync_to_async(self.store_response)(key, timeout, response)
+        return response
+
+    def get_cache_settings(self, request):
+        """``(key, timeout)`` for a cacheable request, ``(None, None)`` otherwise."""
+        timeout = self.cache_timeout if self.cache_timeout is not None else settings.PUBLIC_CACHE_TIMEOUT
+        if not timeout or not self.is_public_request(request):
+            return None, None
+        return self.get_cache_key(request), timeout
+
+    def cached_response(self, request, cached):
+        data, headers = cached
+        etag = headers.get('ETag')
+        last_modified = parse_http_date_safe(headers.get('Last-Modified', ''))
+        if etag and is_not_modified(request, etag, _fromtimestamp(last_modified)):
+            response = HttpResponseNotModified()
+        else:
+            response = Response(data)
+        for header, value in headers.items():
+            response[header] = value
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def store_response(self, key, timeout, response):
+        if response.status_code == 200:
+            headers = {header: response[header] for header in CACHED_HEADERS if response.has_header(header)}
+            cache.set(key, (response.data, headers), timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def is_public_request(self, request):
+        user = request.user
+        return not user.is_authenticated or user.role == 'guest'
+
+    def get_cache_key(self, request):
+        labels = sorted({model_label(model) for model in self.cache_models} | {self.get_model_label()})
+        generations = get_generations(labels)
+        parts = [request.build_absolute_uri()] + ['%s:%s' % (label, generations[label]) for label in labels]
+        digest = hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+        return 'public:view:%s.%s:%s' % (type(self).__module__, type(self).__name__, digest)
+
+    def get_model_label(self):
+        queryset = getattr(self, 'queryset', None)
+        if queryset is not None:
+            return queryset.model._meta.label_lower
+        return self.get_serializer_class().Meta.model._meta.label_lower
+
+
+def _fromtimestamp(timestamp):
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
@@ -0,0 +1,131 @@
+"""
+Response body compression.
+
+gzip is always available; brotli and zstd are used when the ``brotli`` and
+``zstandard`` packages are installed and the client asks for them. The best
+coding the client accepts wins (highest q-value, then zstd > br > gzip).
+
+Per worker process, the bytes going in and out of every coding are counted
+so the compression ratio can be reported (``compression_stats()``).
+"""
+import gzip
+import threading
+from collections import Counter
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+# Levels picked for speed: API bodies are compressed on every request.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+_zstd = threading.local()
+
+
+def _gzip(data):
+    # mtime=0 keeps the output, and so any ETag derived from it, stable.
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli(data):
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def _zstd_compress(data):
+    # ZstdCompressor isn't thread-safe; keep one per thread.
+    compressor = getattr(_zstd, 'compressor', None)
+    if compressor is None:
+        compressor = _zstd.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor.compress(data)
+
+
+def available_codings():
+    """Supported codings, most preferred first."""
+    codings = {}
+    if zstandard is not None:
+        codings['zstd'] = _zstd_compress
+    if brotli is not None:
+        codings['br'] = _brotli
+    codings['gzip'] = _gzip
+    return codings
+
+
+CODINGS = available_codings()
+
+
+def parse_accept_encoding(header):
+    """``{coding: q}`` from an ``Accept-Encoding`` header."""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(header, codings=None):
+    """The coding to use for a request's ``Accept-Encoding``, or ``None``."""
+    codings = CODINGS if codings is None else codings
+    accepted = parse_accept_encoding(header or '')
+    best, best_q = None, 0.0
+    for coding in codings:
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(coding, data):
+    return CODINGS[coding](data)
+
+
+_lock = threading.Lock()
+_responses = Counter()
+_bytes_in = Counter()
+_bytes_out = Counter()
+
+
+def record(coding, size, compressed_size):
+    with _lock:
+        _responses[coding] += 1
+        _bytes_in[coding] += size
+        _bytes_out[coding] += compressed_size
+
+
+def reset_stats():
+    with _lock:
+        _responses.clear()
+        _bytes_in.clear()
+        _bytes_out.clear()
+
+
+def compression_stats():
+    """Per coding: responses compressed, bytes in and out and the overall ratio."""
+    with _lock:
+        return {
+            coding: {
+                'responses': _responses[coding],
+                'bytes_in': _bytes_in[coding],
+                'bytes_out': _bytes_out[coding],
+                'ratio': round(_bytes_in[coding] / _bytes_out[coding], 2) if _bytes_out[coding] else None,
+            }
+            for coding in _responses
+        }
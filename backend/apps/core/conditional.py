@@ -0,0 +1,116 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+TIMESTAMP_FIELDS = ('updated_at', 'created_at', 'uploaded_at')
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for generic list and detail views of models
+    with an ``updated_at`` column.
+
+    One aggregate query over the filtered queryset (``MAX(updated_at)`` and
+    ``COUNT(*)``, plus the same for each relation in ``conditional_related``)
+    yields the validators. A matching ``If-None-Match`` or, on detail views,
+    ``If-Modified-Since`` is answered with 304 before the list query and the
+    serializers run.
+
+    Related rows only count through ``conditional_related``; edits to other
+    related objects (e.g. an author's name) do not change the validators.
+    Keyset-paginated requests are served without validators, since the
+    ``COUNT`` over the whole list is exactly what that paginator avoids.
+    """
+
+    conditional_related = ()
+    last_modified_field = 'updated_at'
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators(request)
+        if validators is not None and is_not_modified(request, *validators):
+            return self.add_validators(HttpResponseNotModified(), validators)
+        return self.add_validators(super().get(request, *args, **kwargs), validators)
+
+    async def aget(self, request, *args, **kwargs):
+        validators = await sync_to_async(self.get_validators)(request)
+        if validators is not None and is_not_modified(request, *validators):
+            return self.add_validators(HttpResponseNotModified(), validators)
+        return self.add_validators(await super().aget(request, *args, **kwargs), validators)
+
+    def add_validators(self, response, validators):
+        if validators is None or response.status_code not in (200, 304):
+            return response
+        etag, last_modified = validators
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        # Let browsers keep the body but revalidate it on every use.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ('Authorization',))
+        return response
+
+    def is_detail(self):
+        return (self.lookup_url_kwarg or self.lookup_field) in self.kwargs
+
+    def get_validators(self, request):
+        detail = self.is_detail()
+        is_requested = getattr(self.paginator, 'is_requested', None)
+        if not detail and is_requested is not None and is_requested(request):
+            return None
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if detail:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+
+        aggregates = {
+            'count': Count('pk', distinct=bool(self.conditional_related)),
+            'modified': Max(self.last_modified_field),
+        }
+        for relation in self.conditional_related:
+            aggregates['%s_count' % relation] = Count(relation, distinct=True)
+            timestamp = _timestamp_field(queryset.model, relation)
+            if timestamp:
+                aggregates['%s_modified' % relation] = Max('%s__%s' % (relation, timestamp))
+        values = queryset.order_by().aggregate(**aggregates)
+
+        if detail and not values['count']:
+            # Let the normal lookup raise the 404.
+            return None
+
+        parts = [request.get_full_path(), str(getattr(request.user, 'pk', None))]
+        parts += ['%s=%s' % (key, values[key]) for key in sorted(values)]
+        etag = 'W/"%s"' % hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+        return etag, values['modified'] if detail else None
+
+
+def is_not_modified(request, etag, last_modified=None):
+    """Whether the request's preconditions match the given validators."""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        # Weak comparison (RFC 9110 8.8.3.2)
+        tags = [_opaque(tag) for tag in parse_etags(if_none_match)]
+        return '*' in tags or _opaque(etag) in tags
+
+    if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+    if if_modified_since and last_modified is not None:
+        since = parse_http_date_safe(if_modified_since)
+        return since is not None and int(last_modified.timestamp()) <= since
+    return False
+
+
+def _opaque(tag):
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def _timestamp_field(model, relation):
+    related_model = model._meta.get_field(relation).related_model
+    names = {field.name for field in related_model._meta.get_fields()}
+    for name in TIMESTAMP_FIELDS:
+        if name in names:
+            return name
+    return None
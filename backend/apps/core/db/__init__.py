@@ -0,0 +1,84 @@
+"""
+Database connection diagnostics.
+
+Counts, per worker process, how many requests were served and how many
+database connections had to be opened for them. With persistent connections
+(``CONN_MAX_AGE``) or the pool most requests reuse one, so the reuse rate
+should stay close to 1. The counters are logged when a gunicorn worker exits
+and reported by ``manage.py db_diagnostics``.
+"""
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.checks import Warning
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_opened = Counter()
+_requests = 0
+
+
+def count_connection(sender, connection, **kwargs):
+    """``connection_created`` receiver."""
+    with _lock:
+        _opened[connection.alias] += 1
+
+
+def count_request(sender, **kwargs):
+    """``request_finished`` receiver."""
+    global _requests
+    with _lock:
+        _requests += 1
+
+
+def reset_stats():
+    global _requests
+    with _lock:
+        _opened.clear()
+        _requests = 0
+
+
+def connection_stats():
+    from .backends.postgresql_pool.base import get_pool
+
+    with _lock:
+        requests, opened = _requests, dict(_opened)
+    stats = {}
+    for alias in connections:
+        count = opened.get(alias, 0)
+        stats[alias] = {
+            'requests': requests,
+            'connections_opened': count,
+            'reuse_rate': round(1 - count / requests, 3) if requests and count <= requests else None,
+        }
+        pool = get_pool(alias)
+        if pool is not None:
+            stats[alias]['pool'] = pool.status()
+    return stats
+
+
+def log_connection_stats():
+    for alias, stats in connection_stats().items():
+        logger.info(
+            'Database %s: %d connections opened for %d requests (reuse rate %s)%s',
+            alias, stats['connections_opened'], stats['requests'], stats['reuse_rate'],
+            ', pool %s' % stats['pool'] if 'pool' in stats else '',
+        )
+
+
+def check_persistent_connections(app_configs, **kwargs):
+    """System check: a PostgreSQL database that reconnects on every request."""
+    warnings = []
+    for alias, database in settings.DATABASES.items():
+        if database['ENGINE'] != 'django.db.backends.postgresql' or database.get('CONN_MAX_AGE'):
+            continue
+        warnings.append(Warning(
+            'Database %r opens a new connection for every request.' % alias,
+            hint='Set DB_CONN_MAX_AGE, or DB_POOL_SIZE to use the pooled backend.',
+            id='core.W001',
+        ))
+    return warnings
@@ -0,0 +1,62 @@
+"""
+PostgreSQL backend that keeps connections in a per-process pool.
+
+Configured through ``OPTIONS['pool']`` (the same key Django 5.1's native
+pool uses), e.g. ``{'max_size': 10, 'timeout': 10}``; see ``DB_POOL_SIZE`` in
+settings. Django still "closes" the connection at the end of each request
+(``CONN_MAX_AGE = 0``), which hands it back to the pool instead.
+"""
+import os
+import threading
+
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from apps.core.db.pool import ConnectionPool
+
+POOL_OPTIONS = ('max_size', 'timeout', 'max_idle', 'max_lifetime', 'check_after')
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias):
+    return _pools.get((os.getpid(), alias))
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        options = self.settings_dict['OPTIONS']
+        pool_options = options.pop('pool', None)
+        try:
+            return super().get_connection_params()
+        finally:
+            if pool_options is not None:
+                options['pool'] = pool_options
+
+    def get_pool(self, conn_params):
+        # Keyed by pid as well: a pool must never cross a fork.
+        key = (os.getpid(), self.alias)
+        with _pools_lock:
+            if key not in _pools:
+                options = self.settings_dict['OPTIONS'].get('pool') or {}
+                _pools[key] = ConnectionPool(
+                    lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+                    **{name: options[name] for name in POOL_OPTIONS if name in options}
+                )
+            return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        connection = self.get_pool(conn_params).acquire()
+        # The parent sets this only when it opens a connection.
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = (
+            IsolationLevel(isolation_level) if isolation_level is not None
+            else IsolationLevel.READ_COMMITTED
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                get_pool(self.alias).release(self.connection)
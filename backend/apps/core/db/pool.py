@@ -0,0 +1,133 @@
+"""
+A small thread-safe connection pool for one worker process.
+
+Django 4.2 has no built-in pooling, so the ``postgresql_pool`` backend keeps
+its raw psycopg2 connections here: ``acquire()`` hands out an idle connection
+(or opens a new one while fewer than ``max_size`` are checked out) and
+``release()`` takes it back once Django "closes" it at the end of a request.
+"""
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    """
+    ``connect`` opens a new raw connection. Idle connections are re-checked
+    with ``SELECT 1`` when they sat unused for more than ``check_after``
+    seconds, and dropped after ``max_idle`` seconds idle or ``max_lifetime``
+    seconds in total.
+    """
+
+    def __init__(self, connect, max_size=10, timeout=10.0, max_idle=300.0, max_lifetime=3600.0, check_after=30.0):
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = deque()
+        self._opened_at = {}
+        self.stats = {'opened': 0, 'reused': 0, 'discarded': 0, 'waited': 0, 'timeouts': 0}
+
+    def acquire(self):
+        if not self._slots.acquire(blocking=False):
+            self._count('waited')
+            if not self._slots.acquire(timeout=self.timeout):
+                self._count('timeouts')
+                raise PoolTimeout('No database connection available after %ss (pool size %d)' % (self.timeout, self.max_size))
+        try:
+            connection = self._take_idle()
+            if connection is not None:
+                self._count('reused')
+                return connection
+            connection = self.connect()
+            with self._lock:
+                self._opened_at[id(connection)] = time.monotonic()
+                self.stats['opened'] += 1
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection):
+        try:
+            if self._reset(connection):
+                with self._lock:
+                    # Most recently used first, so the rest can age out.
+                    self._idle.append((connection, time.monotonic()))
+            else:
+                self._discard(connection)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def status(self):
+        with self._lock:
+            return dict(self.stats, idle=len(self._idle), size=len(self._opened_at), max_size=self.max_size)
+
+    def _take_idle(self):
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                connection, returned_at = self._idle.pop()
+            if self._is_expired(connection, returned_at, now) or not self._is_healthy(connection, returned_at, now):
+                self._discard(connection)
+                continue
+            return connection
+
+    def _is_expired(self, connection, returned_at, now):
+        opened_at = self._opened_at.get(id(connection), now)
+        return now - returned_at > self.max_idle or now - opened_at > self.max_lifetime
+
+    def _is_healthy(self, connection, returned_at, now):
+        if connection.closed:
+            return False
+        if now - returned_at <= self.check_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            connection.rollback()
+        except Exception:
+            return False
+        return True
+
+    def _reset(self, connection):
+        """Roll back anything left open; False if the connection is unusable."""
+        if connection.closed:
+            return False
+        try:
+            if not connection.autocommit:
+                connection.rollback()
+        except Exception:
+            return False
+        return True
+
+    def _discard(self, connection):
+        with self._lock:
+            self._opened_at.pop(id(connection), None)
+            self.stats['discarded'] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
@@ -0,0 +1,96 @@
+"""
+Send reads to the replica databases.
+
+``ReplicaMiddleware`` picks one of ``DATABASE_REPLICAS`` for every GET, HEAD
+and OPTIONS request and ``ReplicaRouter`` sends that request's reads to it.
+Everything else, and every write, goes to ``default``. A user who has just
+written something is pinned to ``default`` for ``REPLICA_PIN_SECONDS`` so
+they always read their own writes despite replication lag; views that must
+never read stale data opt out with ``apps.core.decorators.use_primary``.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_KEY = 'replica:pin:%s'
+
+_read_alias = ContextVar('read_alias', default=None)
+
+
+def get_replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', ()))
+
+
+def choose_replica():
+    replicas = get_replicas()
+    return random.choice(replicas) if replicas else None
+
+
+@contextmanager
+def read_from(alias):
+    """Route reads inside the block to ``alias`` (``None`` for the primary)."""
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def get_read_alias():
+    return _read_alias.get()
+
+
+def set_read_alias(alias):
+    return _read_alias.set(alias)
+
+
+def reset_read_alias(token):
+    _read_alias.reset(token)
+
+
+def pin_to_primary(user_id):
+    timeout = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+    if user_id is not None and timeout:
+        cache.set(PIN_KEY % user_id, True, timeout)
+
+
+def is_pinned(user_id):
+    return user_id is not None and cache.get(PIN_KEY % user_id) is not None
+
+
+def choose_read_alias(view_func, user_id):
+    """
+    The replica a safe-method request by ``user_id`` to ``view_func`` reads
+    from, or ``None`` for the primary.
+    """
+    if not get_replicas():
+        return None
+    view_class = getattr(view_func, 'view_class', None)
+    if getattr(view_func, 'use_primary', False) or getattr(view_class, 'use_primary', False):
+        return None
+    if is_pinned(user_id):
+        return None
+    return choose_replica()
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = get_read_alias()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Reads inside a transaction must see its writes.
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in get_replicas()
@@ -0,0 +1,227 @@
+"""
+Slow-query log.
+
+Every connection runs its statements through ``log_slow_query``. A statement
+that takes longer than ``SLOW_QUERY_THRESHOLD_MS`` is written, as one JSON
+object per line, to ``SLOW_QUERY_LOG`` (rotated at
+``SLOW_QUERY_LOG_MAX_BYTES``) with:
+
+    view      URL name of the view being served (``polls-list``), if any
+    origin    innermost project frame, e.g. ``PollOptionSerializer.get_vote_count``
+    sql, params, duration_ms, alias
+    plan      EXPLAIN of SELECT/UPDATE/DELETE statements (the plan only; the
+              statement is not run again)
+
+``manage.py slow_queries`` summarizes the log by total time per statement.
+"""
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+
+IN_LIST = re.compile(r'\bIN \((?:%s, )*%s\)')
+
+LIBRARY_PATHS = (os.sep + 'site-packages' + os.sep, os.sep + 'dist-packages' + os.sep)
+
+# Request instrumentation is never where a query comes from.
+INSTRUMENTATION = tuple(
+    os.path.join('apps', 'core', name) for name in ('metrics.py', 'middleware.py', 'profiling.py')
+)
+
+
+def log_slow_query(execute, sql, params, many, context):
+    threshold = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 0)
+    if not threshold or getattr(_state, 'active', False):
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms >= threshold:
+        _state.active = True
+        try:
+            record(context['connection'], sql, params, many, duration_ms)
+        except Exception:
+            # The query worked; never fail the request over its log entry.
+            logger.debug('Could not log a slow query', exc_info=True)
+        finally:
+            _state.active = False
+    return result
+
+
+def install(sender, connection, **kwargs):
+    """``connection_created`` receiver."""
+    if log_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_query)
+
+
+def record(connection, sql, params, many, duration_ms):
+    view, origin = inspect_stack(sys._getframe(2), connection)
+    entry = {
+        'time': timezone.now().isoformat(),
+        'duration_ms': round(duration_ms, 3),
+        'alias': connection.alias,
+        'view': view,
+        'origin': origin,
+        'sql': sql,
+        'params': None if many else _jsonable(params),
+        'plan': None,
+    }
+    if not many and getattr(settings, 'SLOW_QUERY_EXPLAIN', True) and _is_explainable(sql):
+        try:
+            entry['plan'] = explain(connection, sql, params)
+        except Exception as exc:
+            entry['plan'] = ['EXPLAIN failed: %s' % exc]
+    logger.warning('Slow query (%.1f ms) in %s', duration_ms, view or origin, extra={'entry': entry})
+
+
+def inspect_stack(frame, connection):
+    """
+    ``(view, origin)``: the URL name of the DRF/Django view being served
+    (found through its ``self.request``) and the innermost project frame,
+    as ``Class.method (file:line)``, not counting request instrumentation
+    or the connection's other execute wrappers.
+    """
+    view = origin = None
+    root = str(settings.BASE_DIR) + os.sep
+    wrappers = {getattr(wrapper, '__code__', None) for wrapper in connection.execute_wrappers}
+    while frame is not None and (view is None or origin is None):
+        filename = frame.f_code.co_filename
+        if origin is None and filename.startswith(root) and frame.f_code not in wrappers \
+                and not filename.endswith(INSTRUMENTATION) \
+                and not any(path in filename for path in LIBRARY_PATHS):
+            origin = '%s (%s:%d)' % (frame.f_code.co_qualname, os.path.relpath(filename, root), frame.f_lineno)
+        if view is None:
+            request = getattr(frame.f_locals.get('self'), 'request', None)
+            match = getattr(request, 'resolver_match', None)
+            if match is not None:
+                view = match.view_name or match.route
+        frame = frame.f_back
+    return view, origin
+
+
+def explain(connection, sql, params):
+    """The plan of ``sql`` on ``connection`` as a list of lines (PostgreSQL and SQLite)."""
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        rows = cursor.fetchall()
+    if connection.vendor == 'sqlite':
+        # (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def _is_explainable(sql):
+    return sql.lstrip()[:6].upper() in ('SELECT', 'UPDATE', 'DELETE')
+
+
+def _jsonable(params, limit=200):
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: _jsonable(value, limit) for key, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [_jsonable(value, limit) for value in params]
+    if params is True or params is False or isinstance(params, (int, float)):
+        return params
+    value = str(params)
+    return value if len(value) <= limit else value[:limit] + '...'
+
+
+class JSONLineFormatter(logging.Formatter):
+    """Formats the ``entry`` of a slow-query record as one line of JSON."""
+
+    def format(self, record):
+        entry = getattr(record, 'entry', None)
+        if entry is None:
+            entry = {'time': timezone.now().isoformat(), 'message': record.getMessage()}
+        return json.dumps(entry, default=str)
+
+
+class SlowQueryFileHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` on ``SLOW_QUERY_LOG``; creates the directory on first write."""
+
+    def __init__(self, filename=None, maxBytes=None, backupCount=None, **kwargs):
+        kwargs.setdefault('delay', True)
+        super().__init__(
+            filename or settings.SLOW_QUERY_LOG,
+            maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES if maxBytes is None else maxBytes,
+            backupCount=settings.SLOW_QUERY_LOG_BACKUPS if backupCount is None else backupCount,
+            **kwargs
+        )
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+def log_files(path=None):
+    """The log and its rotated backups, oldest first."""
+    path = path or settings.SLOW_QUERY_LOG
+    directory, name = os.path.split(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        return []
+    backups = []
+    for filename in os.listdir(directory):
+        suffix = filename[len(name) + 1:]
+        if filename.startswith(name + '.') and suffix.isdigit():
+            backups.append((int(suffix), os.path.join(directory, filename)))
+    files = [filename for _, filename in sorted(backups, reverse=True)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_entries(path=None):
+    for filename in log_files(path):
+        with open(filename) as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if 'sql' in entry:
+                    yield entry
+
+
+def fingerprint(sql):
+    """``sql`` with whitespace normalized and ``IN (%s, %s, ...)`` lists collapsed."""
+    return IN_LIST.sub('IN (...)', ' '.join(sql.split()))
+
+
+def summarize(entries):
+    """Group log entries by statement, slowest total first."""
+    groups = {}
+    for entry in entries:
+        key = fingerprint(entry['sql'])
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                'sql': key, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'views': {}, 'origins': {}, 'plan': None, 'example_params': None,
+            }
+        duration = entry['duration_ms']
+        group['count'] += 1
+        group['total_ms'] += duration
+        if duration >= group['max_ms']:
+            group['max_ms'] = duration
+            group['example_params'] = entry.get('params')
+            group['plan'] = entry.get('plan') or group['plan']
+        for key, value in (('views', entry.get('view')), ('origins', entry.get('origin'))):
+            if value:
+                group[key][value] = group[key].get(value, 0) + 1
+    for group in groups.values():
+        group['total_ms'] = round(group['total_ms'], 3)
+        group['mean_ms'] = round(group['total_ms'] / group['count'], 3)
+    return sorted(groups.values(), key=lambda group: group['total_ms'], reverse=True)
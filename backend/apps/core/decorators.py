@@ -0,0 +1,20 @@
+def query_budget(count):
+    """
+    Declare the maximum number of SQL queries a GET on a function-based view
+    may issue. Class-based views set a ``query_budget`` attribute instead.
+    Enforced by ``apps.core.tests.test_query_budget``.
+    """
+    def decorator(view):
+        view.query_budget = count
+        return view
+    return decorator
+
+
+def use_primary(view):
+    """
+    Serve every request to the view from the primary database, even GETs
+    that would otherwise read from a replica (see ``apps.core.db.routers``).
+    Class-based views set ``use_primary = True`` instead.
+    """
+    view.use_primary = True
+    return view
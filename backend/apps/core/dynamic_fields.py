@@ -0,0 +1,96 @@
+"""
+Sparse fieldsets and expansion for GET requests.
+
+    ?fields=id,title,rsvps.status    only these fields (dotted paths reach
+                                     into nested serializers)
+    ?omit=content,attachments        every field except these
+    ?expand=organizer                replace the ``organizer`` id with the
+                                     object, for fields the serializer lists
+                                     in ``Meta.expandable_fields``
+
+Serializers opt in with ``DynamicFieldsMixin``; unknown names are ignored.
+Views with ``apps.core.optimizer.OptimizedQuerysetMixin`` shape their
+queryset after the remaining fields, so relations that are no longer
+serialized are not fetched (and expanded ones are joined in).
+"""
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+QUERY_PARAMS = ('fields', 'omit', 'expand')
+
+
+def parse_paths(value):
+    """``'id,rsvps.status'`` -> ``{'id': {}, 'rsvps': {'status': {}}}``."""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+def get_options(request):
+    """The parsed ``fields``/``omit``/``expand`` of a request, or ``None``."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    params = getattr(request, 'query_params', request.GET)
+    if not any(params.get(name) for name in QUERY_PARAMS):
+        return None
+    only = parse_paths(params['fields']) if params.get('fields') else None
+    return only, parse_paths(params.get('omit', '')), parse_paths(params.get('expand', ''))
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin for ``?fields=``, ``?omit=`` and ``?expand=``.
+
+    ``Meta.expandable_fields`` maps a field name to the serializer class (or
+    its dotted path) that replaces it on ``?expand=``, e.g.
+    ``{'organizer': 'apps.users.serializers.UserSummarySerializer'}``; the
+    field's ``source`` is kept. Only the outermost serializer reads the query
+    string; it hands each nested serializer its part of the paths.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        options = self.get_dynamic_options()
+        if options is None:
+            return fields
+        only, omit, expand = options
+
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in expand:
+            if name in expandable and name in fields:
+                serializer_class = expandable[name]
+                if isinstance(serializer_class, str):
+                    serializer_class = import_string(serializer_class)
+                source = fields[name].source
+                kwargs = {'source': source} if source and source != name else {}
+                fields[name] = serializer_class(read_only=True, **kwargs)
+
+        for name in list(fields):
+            if (only is not None and name not in only) or omit.get(name) == {}:
+                del fields[name]
+                continue
+            nested = fields[name]
+            nested = getattr(nested, 'child', nested)
+            if isinstance(nested, DynamicFieldsMixin):
+                nested._dynamic_options = (
+                    only.get(name) or None if only is not None else None,
+                    omit.get(name, {}),
+                    expand.get(name, {}),
+                )
+        return fields
+
+    def get_dynamic_options(self):
+        if hasattr(self, '_dynamic_options'):
+            return self._dynamic_options
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+        return get_options(self.context.get('request'))
+
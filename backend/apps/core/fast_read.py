@@ -0,0 +1,319 @@
+"""
+Render list responses straight from ``.values()`` rows.
+
+``ValuesReader(serializer)`` works out once which ``values()`` lookup and
+which converter produce each of the serializer's fields, then renders rows
+to exactly the dicts ``serializer.data`` would hold, without building
+model instances or calling each field's ``to_representation``. It handles
+model columns, keys of forward relations, dotted sources through forward
+relations (``user.full_name``), nested serializers of forward relations and
+``many=True`` serializers of reverse foreign keys (one extra query each,
+like a prefetch). Anything else (method fields, properties, files, custom
+fields) raises ``Unsupported``.
+
+List views add ``FastReadMixin``; a view whose serializer is not supported
+keeps serving through the serializer.
+"""
+import datetime
+import decimal
+import operator
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, fields, relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .dynamic_fields import get_options
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+# Entry kinds
+VALUE, ONE, MANY = 'value', 'one', 'many'
+# What a VALUE entry does when a relation on its path is null (as DRF does
+# for the field: allow_null -> None, not required -> leave the key out)
+NULL, SKIP = 'null', 'skip'
+
+# Serializer class -> ValuesReader (or None), for requests without ?fields/?omit/?expand.
+_readers = {}
+
+
+class Unsupported(Exception):
+    """The serializer has a field that cannot be rendered from ``.values()`` rows."""
+
+
+def _text(field):
+    return str
+
+
+def _integer(field):
+    return int
+
+
+def _boolean(field):
+    return bool
+
+
+def _uuid(field):
+    if field.uuid_format == 'hex_verbose':
+        return str
+    return operator.attrgetter(field.uuid_format)
+
+
+def _decimal(field):
+    if field.localize or field.decimal_places is None:
+        return field.to_representation
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def convert(value):
+        quantized = value.quantize(exponent, rounding=rounding, context=context)
+        return '{:f}'.format(quantized) if coerce_to_string else quantized
+    return convert
+
+
+def _datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    return convert
+
+
+def _date(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    return datetime.date.isoformat
+
+
+def _choice(field):
+    choices = field.choice_strings_to_values
+    if all(key == value for key, value in choices.items()):
+        return None
+    return lambda value: choices.get(str(value), value)
+
+
+def _primary_key(field):
+    return field.pk_field.to_representation if field.pk_field is not None else None
+
+
+# A field's to_representation -> builder of the equivalent converter for
+# raw column values (None: the value is used as is). Keyed on the method so
+# a subclass that overrides it is not mistaken for its base class.
+CONVERTERS = {
+    fields.CharField.to_representation: _text,
+    fields.IntegerField.to_representation: _integer,
+    fields.BooleanField.to_representation: _boolean,
+    fields.UUIDField.to_representation: _uuid,
+    fields.DecimalField.to_representation: _decimal,
+    fields.DateTimeField.to_representation: _datetime,
+    fields.DateField.to_representation: _date,
+    fields.ChoiceField.to_representation: _choice,
+    relations.PrimaryKeyRelatedField.to_representation: _primary_key,
+}
+
+
+class ValuesReader:
+    """The ``values()`` lookups and converters that render ``serializer``'s fields."""
+
+    def __init__(self, serializer, model=None, prefix=''):
+        self.model = model or serializer.Meta.model
+        self.prefix = prefix
+        self.pk = prefix + self.model._meta.pk.name
+        self.columns = [self.pk]
+        self.entries = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == '*':
+                raise Unsupported('%s.%s reads the whole object' % (type(serializer).__name__, name))
+            if isinstance(field, serializers.ListSerializer):
+                self.entries.append(self._many(name, field))
+            elif isinstance(field, serializers.BaseSerializer):
+                self.entries.append(self._one(name, field))
+            else:
+                self.entries.append(self._value(name, field))
+
+    def _value(self, name, field):
+        builder = CONVERTERS.get(type(field).to_representation)
+        if builder is None:
+            raise Unsupported('%s (%s) has no values() converter' % (name, type(field).__name__))
+        lookup, guards, last = self._resolve(field.source_attrs)
+        if last.is_relation and not isinstance(field, relations.PrimaryKeyRelatedField):
+            raise Unsupported('%s renders a related object' % name)
+        missing = None
+        if guards:
+            if field.default is not fields.empty:
+                raise Unsupported('%s has a default for missing relations' % name)
+            if field.allow_null:
+                missing = NULL
+            elif not field.required:
+                missing = SKIP
+            else:
+                raise Unsupported('%s requires its relations' % name)
+        return (VALUE, name, lookup, guards, missing, builder, field)
+
+    def _one(self, name, field):
+        if len(field.source_attrs) != 1:
+            raise Unsupported('%s is nested through more than one relation' % name)
+        lookup, _, relation = self._resolve(field.source_attrs)
+        if not (relation.many_to_one or relation.one_to_one) or not relation.concrete:
+            raise Unsupported('%s is not a forward relation' % name)
+        return (ONE, name, lookup, ValuesReader(field, relation.related_model, lookup + '__'))
+
+    def _many(self, name, field):
+        if self.prefix or len(field.source_attrs) != 1:
+            raise Unsupported('%s is a list nested in a nested object' % name)
+        try:
+            relation = self.model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            raise Unsupported('%s is not a model relation' % name)
+        if not relation.one_to_many:
+            raise Unsupported('%s is not a reverse foreign key' % name)
+        reader = ValuesReader(field.child, relation.related_model)
+        foreign_key = relation.field.name
+        reader.add_column(foreign_key)
+        return (MANY, name, foreign_key, reader)
+
+    def _resolve(self, attrs):
+        """``(lookup, guards, model field)`` for a source through forward relations."""
+        model, parts, guards = self.model, [], []
+        for index, attr in enumerate(attrs):
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                raise Unsupported('%s is not a model field' % '.'.join(attrs))
+            if model_field.many_to_many or model_field.one_to_many:
+                raise Unsupported('%s is a many-valued relation' % '.'.join(attrs))
+            parts.append(attr)
+            if index == len(attrs) - 1:
+                break
+            if not model_field.is_relation or not model_field.concrete:
+                raise Unsupported('%s does not go through forward relations' % '.'.join(attrs))
+            if model_field.null:
+                guards.append(self.add_column('__'.join(parts)))
+            model = model_field.related_model
+        return self.add_column('__'.join(parts)), guards, model_field
+
+    def add_column(self, lookup):
+        lookup = self.prefix + lookup
+        if lookup not in self.columns:
+            self.columns.append(lookup)
+        return lookup
+
+    def all_columns(self):
+        columns = list(self.columns)
+        for entry in self.entries:
+            if entry[0] == ONE:
+                columns += [column for column in entry[3].all_columns() if column not in columns]
+        return columns
+
+    def values(self, queryset, extra=()):
+        """``queryset`` as the ``values()`` rows ``render`` reads (plus ``extra`` lookups)."""
+        columns = self.all_columns()
+        columns += [lookup for lookup in extra if lookup not in columns]
+        return queryset.prefetch_related(None).values(*columns)
+
+    def converters(self):
+        converters = []
+        for entry in self.entries:
+            if entry[0] == VALUE:
+                converters.append(entry[5](entry[6]))
+            elif entry[0] == ONE:
+                converters.append(entry[3].converters())
+            else:
+                converters.append(None)
+        return converters
+
+    def render(self, rows):
+        """The serializer's representation of each of ``rows``."""
+        rows = list(rows)
+        converters = self.converters()
+        children = {}
+        if rows:
+            for entry in self.entries:
+                if entry[0] == MANY:
+                    children[entry[1]] = entry[3].render_grouped(entry[2], [row[self.pk] for row in rows])
+        return [self.render_row(row, converters, children) for row in rows]
+
+    def render_grouped(self, foreign_key, parents):
+        """Representations of the rows pointing at ``parents``, by parent key."""
+        rows = list(self.values(self.model._default_manager.filter(**{'%s__in' % foreign_key: parents})))
+        grouped = {}
+        for row, data in zip(rows, self.render(rows)):
+            grouped.setdefault(row[foreign_key], []).append(data)
+        return grouped
+
+    def render_row(self, row, converters, children):
+        data = {}
+        for entry, convert in zip(self.entries, converters):
+            kind, name = entry[0], entry[1]
+            if kind == VALUE:
+                guards = entry[3]
+                if guards and any(row[guard] is None for guard in guards):
+                    if entry[4] == NULL:
+                        data[name] = None
+                    continue
+                value = row[entry[2]]
+                data[name] = value if value is None or convert is None else convert(value)
+            elif kind == ONE:
+                data[name] = None if row[entry[2]] is None else entry[3].render_row(row, convert, {})
+            else:
+                data[name] = children[name].get(row[self.pk], [])
+        return data
+
+
+def get_reader(serializer):
+    """A ``ValuesReader`` for ``serializer``, or ``None`` if it is not supported."""
+    try:
+        return ValuesReader(serializer)
+    except Unsupported:
+        return None
+
+
+class FastReadMixin:
+    """
+    Serve GET lists from ``.values()`` rows rendered by a ``ValuesReader``
+    of the view's serializer. Filtering, pagination and the response shape
+    are unchanged; detail views and writes still use the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if reader is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = reader.values(queryset, self.get_ordering_lookups(queryset))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.render(page))
+        return Response(reader.render(queryset))
+
+    def get_values_reader(self):
+        if self.request.method not in SAFE_METHODS:
+            return None
+        serializer_class = self.get_serializer_class()
+        if get_options(self.request) is not None:
+            return get_reader(self.get_serializer())
+        if serializer_class not in _readers:
+            _readers[serializer_class] = get_reader(self.get_serializer())
+        return _readers[serializer_class]
+
+    def get_ordering_lookups(self, queryset):
+        """The ordering columns, which keyset pagination reads from the rows."""
+        ordering = (
+            getattr(self, 'pagination_ordering', None)
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+        )
+        pk_name = queryset.model._meta.pk.name
+        return [pk_name if name.lstrip('-') == 'pk' else name.lstrip('-') for name in ordering]
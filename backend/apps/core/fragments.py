@@ -0,0 +1,149 @@
+"""
+Cached representations of single objects.
+
+A serializer with ``FragmentCacheMixin`` (and, for lists,
+``Meta.list_serializer_class = FragmentListSerializer``) stores what it
+renders for each object on GET, keyed by model, primary key,
+``updated_at``, the requesting user's role and the shape of the output
+(the serializer, its fields and ``?fields``/``?omit``/``?expand``). A list
+fetches the fragments of the whole page with one ``get_many`` and only
+serializes the objects that missed.
+
+An object's fragments go stale when its ``updated_at`` moves, so nested
+rows it renders (replies, RSVPs, attachments) call ``touch_parent`` to move
+their parent's. Every other model the serializer reads (say, ``users.User``
+for author names) is part of the key through its ``apps.core.cache``
+generation, so any save or delete of one of those starts new fragments.
+Like the generations, this does not see ``QuerySet.update()``; such changes
+show after ``FRAGMENT_CACHE_TIMEOUT`` seconds.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from rest_framework import serializers
+
+from .cache import get_generations
+from .dynamic_fields import QUERY_PARAMS
+from .optimizer import build_plan
+
+SAFE_METHODS = ('GET', 'HEAD')
+FRAGMENT_KEY = 'fragment:%s:%s:%s:%s:%s'
+
+# Model label -> labels of the parents ``touch_parent`` keeps up to date
+_touched_parents = {}
+
+
+class FragmentCacheMixin:
+    """Serializer mixin that caches ``to_representation`` per object on GET."""
+
+    fragment_timestamp_field = 'updated_at'
+
+    def to_representation(self, instance):
+        if self.parent is not None:
+            # Cached by the list (or not at all when nested in another object).
+            return super().to_representation(instance)
+        key = self.get_fragment_key(instance)
+        if key is None:
+            return super().to_representation(instance)
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache.set(key, data, settings.FRAGMENT_CACHE_TIMEOUT)
+        return data
+
+    def get_fragment_key(self, instance):
+        """The cache key of ``instance``'s representation, or ``None`` to not cache it."""
+        signature = self.get_fragment_signature()
+        # Read from __dict__ so a deferred timestamp is not fetched row by row.
+        timestamp = instance.__dict__.get(self.fragment_timestamp_field)
+        if signature is None or timestamp is None:
+            return None
+        return FRAGMENT_KEY % (
+            instance._meta.label_lower, instance.pk, timestamp.timestamp(), signature[0], signature[1],
+        )
+
+    def get_fragment_signature(self):
+        """``(role, digest of the output's shape)`` for this request, computed once."""
+        if not hasattr(self, '_fragment_signature'):
+            self._fragment_signature = _signature(self)
+        return self._fragment_signature
+
+
+class FragmentListSerializer(serializers.ListSerializer):
+    """Assembles a list from the child's cached fragments, serializing only the misses."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        items = list(iterable)
+        if self.parent is not None or not settings.FRAGMENT_CACHE_TIMEOUT:
+            return [self.child.to_representation(item) for item in items]
+
+        keys = [self.child.get_fragment_key(item) for item in items]
+        cached = cache.get_many([key for key in keys if key is not None])
+        representation, missed = [], {}
+        for item, key in zip(items, keys):
+            if key in cached:
+                representation.append(cached[key])
+                continue
+            data = self.child.to_representation(item)
+            representation.append(data)
+            if key is not None:
+                missed[key] = data
+        if missed:
+            cache.set_many(missed, settings.FRAGMENT_CACHE_TIMEOUT)
+        return representation
+
+
+def _signature(serializer):
+    request = serializer.context.get('request')
+    if not settings.FRAGMENT_CACHE_TIMEOUT or request is None or request.method not in SAFE_METHODS:
+        return None
+    user = request.user
+    role = user.role if user.is_authenticated else 'anonymous'
+    params = getattr(request, 'query_params', request.GET)
+    label = serializer.Meta.model._meta.label_lower
+    related = sorted({
+        other for other in _related_labels(build_plan(serializer))
+        if other != label and label not in _touched_parents.get(other, ())
+    })
+    generations = get_generations(related)
+    parts = [
+        '%s.%s' % (type(serializer).__module__, type(serializer).__qualname__),
+        ','.join(serializer.fields),
+        # File and image URLs are absolute.
+        request.build_absolute_uri('/'),
+    ] + ['%s=%s' % (name, params.get(name, '')) for name in QUERY_PARAMS]
+    parts += ['%s:%s' % (other, generations[other]) for other in related]
+    return role, hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _related_labels(plan):
+    for related in list(plan.select.values()) + list(plan.prefetch.values()):
+        yield related.model._meta.label_lower
+        yield from _related_labels(related)
+
+
+def touch_parent(model, field_name):
+    """
+    Move the ``updated_at`` of the row ``model.<field_name>`` points to
+    whenever a ``model`` row is saved or deleted, so the parent's cached
+    fragments (and conditional GET validators and sync changes) follow its
+    nested rows.
+    Call it from the ``AppConfig.ready`` of ``model``'s app.
+    """
+    field = model._meta.get_field(field_name)
+    _touched_parents.setdefault(model._meta.label_lower, set()).add(field.related_model._meta.label_lower)
+
+    def touch(sender, instance, raw=False, **kwargs):
+        parent_id = getattr(instance, field.attname)
+        if raw or parent_id is None:
+            return
+        field.related_model._default_manager.filter(pk=parent_id).update(updated_at=timezone.now())
+
+    uid = 'core.touch_parent.%s.%s' % (model._meta.label_lower, field_name)
+    post_save.connect(touch, sender=model, weak=False, dispatch_uid=uid + '.save')
+    post_delete.connect(touch, sender=model, weak=False, dispatch_uid=uid + '.delete')
@@ -0,0 +1,194 @@
+"""
+Resized variants of uploaded images.
+
+A model declares an ``ImageVariantsField`` next to each ``ImageField``::
+
+    photo = models.ImageField(upload_to='pet_photos/', validators=[validate_image_pixels], ...)
+    photo_variants = ImageVariantsField(source='photo')
+
+Whenever a save leaves the image and its variants out of step (a new upload,
+a replaced or cleared image), ``apps.core.tasks.generate_image_variants`` is
+queued once the transaction commits. It decodes the original once, applies
+its EXIF orientation, and writes a WebP and a JPEG copy at each of the
+``IMAGE_VARIANT_WIDTHS`` narrower than the original, without EXIF or other
+metadata, next to the original in ``<dir>/variants/``. The variants field
+then holds::
+
+    {'source': 'pet_photos/rex.jpg', 'width': 4032, 'height': 3024,
+     'formats': {'webp': [{'width': 320, 'height': 240, 'name': ..., 'url': ...}, ...],
+                 'jpeg': [...]}}
+
+and serializers expose it through ``ResponsiveImageField`` as ``srcset``
+strings. Images over ``IMAGE_MAX_PIXELS`` are rejected on upload by
+``validate_image_pixels`` (which only reads the header) and never decoded.
+
+Pillow is imported only where an image is actually read, so importing the
+models does not load it.
+"""
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from django.db.models.signals import post_save
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+# format: (Pillow format, extension, save options)
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'optimize': True, 'progressive': True}),
+}
+
+
+class UnsafeImage(ValueError):
+    """The file is not an image we are willing to decode."""
+
+
+def validate_image_pixels(file):
+    """Reject images over ``IMAGE_MAX_PIXELS`` (decompression bombs) from their header."""
+    from django.core.files.images import get_image_dimensions
+
+    width, height = get_image_dimensions(file)
+    if width and height and width * height > settings.IMAGE_MAX_PIXELS:
+        raise ValidationError(
+            'Image is %(width)d x %(height)d pixels; the limit is %(limit)d megapixels.',
+            code='too_many_pixels',
+            params={'width': width, 'height': height, 'limit': settings.IMAGE_MAX_PIXELS // 1000000},
+        )
+
+
+class ImageVariantsField(models.JSONField):
+    """The variants of the model's ``source`` image, kept up to date in the background."""
+
+    def __init__(self, source=None, **kwargs):
+        self.source = source
+        kwargs.setdefault('default', dict)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(**kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if not cls._meta.abstract:
+            post_save.connect(
+                self.schedule, sender=cls, weak=False,
+                dispatch_uid='core.image_variants.%s.%s' % (cls._meta.label_lower, name),
+            )
+
+    def schedule(self, sender, instance, raw=False, using=None, **kwargs):
+        if raw or not is_stale(instance, self):
+            return
+        from .tasks import generate_image_variants
+
+        args = (sender._meta.label, str(instance.pk), self.name)
+        transaction.on_commit(lambda: generate_image_variants.delay(*args), using=using)
+
+
+def is_stale(instance, field):
+    """Whether the variants in ``field`` are not those of the current image."""
+    name = getattr(instance, field.source).name or ''
+    variants = getattr(instance, field.attname) or {}
+    return name != variants.get('source', '')
+
+
+def generate(storage, name):
+    """Write the variants of the image ``name`` in ``storage``; returns the variants data."""
+    from PIL import Image, ImageOps
+
+    widths = sorted(settings.IMAGE_VARIANT_WIDTHS)
+    with storage.open(name) as source:
+        try:
+            image = Image.open(source)
+        except (Image.DecompressionBombError, Image.UnidentifiedImageError) as exc:
+            raise UnsafeImage(str(exc)) from exc
+        if image.width * image.height > settings.IMAGE_MAX_PIXELS:
+            raise UnsafeImage('%d x %d pixels is over IMAGE_MAX_PIXELS' % image.size)
+        # Let the JPEG decoder scale down by up to 8x while decoding (either
+        # side may become the width once the orientation is applied).
+        image.draft('RGB', (widths[-1], widths[-1]))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    stem = os.path.splitext(os.path.basename(name))[0]
+    directory = os.path.join(os.path.dirname(name), 'variants')
+    quality = settings.IMAGE_VARIANT_QUALITY
+
+    variants = {'source': name, 'width': image.width, 'height': image.height, 'formats': {}}
+    for width in [width for width in widths if width < image.width] or [image.width]:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for key in settings.IMAGE_VARIANT_FORMATS:
+            pillow_format, extension, options = FORMATS[key]
+            output = resized
+            if pillow_format == 'JPEG' and has_alpha:
+                output = Image.new('RGB', resized.size, 'white')
+                output.paste(resized, mask=resized.getchannel('A'))
+            buffer = io.BytesIO()
+            # No exif= or icc_profile= argument: the metadata is dropped.
+            output.save(buffer, pillow_format, quality=quality, **options)
+            saved = storage.save(
+                os.path.join(directory, '%s-%dw.%s' % (stem, width, extension)), ContentFile(buffer.getvalue()),
+            )
+            variants['formats'].setdefault(key, []).append({
+                'width': width, 'height': height, 'name': saved, 'url': storage.url(saved),
+            })
+    return variants
+
+
+def variant_names(variants):
+    return [variant['name'] for files in (variants or {}).get('formats', {}).values() for variant in files]
+
+
+def delete_variants(storage, names):
+    for name in names:
+        try:
+            storage.delete(name)
+        except OSError:
+            logger.warning('Could not delete image variant %s', name, exc_info=True)
+
+
+class ResponsiveImageField(serializers.Field):
+    """
+    Read-only representation of an ``ImageVariantsField``::
+
+        {"width": 4032, "height": 3024, "src": <widest JPEG>,
+         "srcset": {"webp": "<url> 320w, <url> 640w, ...", "jpeg": "..."}}
+
+    or ``null`` while the variants are being generated (or if there is no image).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        formats = (value or {}).get('formats')
+        if not formats:
+            return None
+        request = self.context.get('request')
+
+        def url(variant):
+            return request.build_absolute_uri(variant['url']) if request is not None else variant['url']
+
+        fallback = formats.get('jpeg') or next(iter(formats.values()))
+        return {
+            'width': value['width'],
+            'height': value['height'],
+            'src': url(fallback[-1]),
+            'srcset': {
+                key: ', '.join('%s %dw' % (url(variant), variant['width']) for variant in variants)
+                for key, variants in formats.items()
+            },
+        }
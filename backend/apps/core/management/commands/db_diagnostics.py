@@ -0,0 +1,81 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+
+from apps.core.db import connection_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports how each database connection is managed (persistent, pooled "
+        "or per request), the cost of opening a connection versus reusing one, "
+        "and the connection reuse rate over a number of simulated requests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Number of request cycles to simulate.')
+        parser.add_argument('--database', action='append', help='Only check this alias (repeatable).')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+
+    def handle(self, *args, **options):
+        aliases = options['database'] or list(connections)
+        report = {alias: self.diagnose(alias, options['requests']) for alias in aliases}
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        for alias, result in report.items():
+            self.stdout.write(self.style.MIGRATE_HEADING('%s (%s)' % (alias, result['engine'])))
+            for key, value in result.items():
+                if key != 'engine':
+                    self.stdout.write('  %-22s %s' % (key, value))
+            if result['reuse_rate'] is not None and result['reuse_rate'] < 0.5:
+                self.stdout.write(self.style.WARNING(
+                    '  Most requests open a new connection; set DB_CONN_MAX_AGE or DB_POOL_SIZE.'
+                ))
+
+    def diagnose(self, alias, requests):
+        connection = connections[alias]
+        settings_dict = connection.settings_dict
+        result = {
+            'engine': settings_dict['ENGINE'],
+            'conn_max_age': settings_dict['CONN_MAX_AGE'],
+            'conn_health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+            'pool': settings_dict['OPTIONS'].get('pool'),
+        }
+
+        connection.close()
+        started = time.perf_counter()
+        connection.ensure_connection()
+        result['connect_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        started = time.perf_counter()
+        self.ping(connection)
+        result['query_ms'] = round((time.perf_counter() - started) * 1000, 3)
+
+        # Each cycle runs one query between the signals Django sends around
+        # a request, which is where connections are closed or kept.
+        reset_stats()
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started.send(sender=self.__class__)
+            self.ping(connection)
+            request_finished.send(sender=self.__class__)
+        elapsed = time.perf_counter() - started
+        stats = connection_stats()[alias]
+        result.update({
+            'requests': stats['requests'],
+            'connections_opened': stats['connections_opened'],
+            'reuse_rate': stats['reuse_rate'],
+            'avg_request_ms': round(elapsed * 1000 / requests, 3) if requests else None,
+        })
+        if 'pool' in stats:
+            result['pool_status'] = stats['pool']
+        return result
+
+    def ping(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
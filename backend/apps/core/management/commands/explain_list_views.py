@@ -0,0 +1,145 @@
+import re
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.mixins import ListModelMixin
+from rest_framework.test import force_authenticate
+
+from apps.core.db.slow_queries import explain
+
+User = get_user_model()
+
+POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?!.*USING (?:COVERING )?INDEX)')
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs every list endpoint as an admin, a member and a guest, EXPLAINs "
+        "each SELECT it issues and reports sequential scans."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--role', action='append', choices=['admin', 'member', 'guest'],
+            help='Only run as the given role (repeatable). Defaults to all roles.',
+        )
+        parser.add_argument(
+            '--ignore-table', action='append', default=[],
+            help='Do not report sequential scans on this table (e.g. small lookup tables).',
+        )
+        parser.add_argument(
+            '--unpaginated', action='store_true',
+            help='Explain the plain list instead of the first keyset page.',
+        )
+        parser.add_argument('--show-plans', action='store_true', help='Print every query plan.')
+        parser.add_argument(
+            '--fail-on-seq-scan', action='store_true',
+            help='Exit with an error if any sequential scan is found.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            raise CommandError('EXPLAIN parsing is only implemented for PostgreSQL and SQLite.')
+
+        roles = options['role'] or ['admin', 'member', 'guest']
+        ignored = set(options['ignore_table'])
+        params = {} if options['unpaginated'] else {'page_size': 25}
+        factory = RequestFactory(HTTP_HOST=_request_host())
+        findings = 0
+
+        for path, name, view in _list_endpoints():
+            for role in roles:
+                user = _user_for_role(role)
+                if user is None:
+                    self.stdout.write(self.style.WARNING('%s [%s]: no %s user in the database, skipped' % (name, role, role)))
+                    continue
+
+                statements = []
+                request = factory.get(path, params)
+                force_authenticate(request, user=user)
+                with connection.execute_wrapper(_capture(statements)):
+                    response = view(request)
+                if response.status_code != 200:
+                    self.stdout.write('%s [%s]: HTTP %s, skipped' % (name, role, response.status_code))
+                    continue
+
+                scans = []
+                for sql, sql_params in _unique_selects(statements):
+                    plan = explain(connection, sql, sql_params)
+                    tables = [table for table in _sequential_scans(plan) if table not in ignored]
+                    if tables:
+                        scans.append((tables, sql))
+                    if options['show_plans']:
+                        self.stdout.write('    %s\n%s' % (sql, '\n'.join('      ' + line for line in plan)))
+
+                summary = '%s [%s]: %d queries' % (name, role, len(statements))
+                if scans:
+                    findings += len(scans)
+                    self.stdout.write(self.style.ERROR('%s, %d with sequential scans' % (summary, len(scans))))
+                    for tables, sql in scans:
+                        self.stdout.write('    seq scan on %s: %s' % (', '.join(tables), _shorten(sql)))
+                else:
+                    self.stdout.write(self.style.SUCCESS(summary))
+
+        if findings and options['fail_on_seq_scan']:
+            raise CommandError('%d queries use sequential scans.' % findings)
+
+
+def _list_endpoints(resolver=None, prefix='/'):
+    resolver = resolver or get_resolver()
+    for pattern in resolver.url_patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from _list_endpoints(pattern, route)
+        elif isinstance(pattern, URLPattern) and not pattern.pattern.converters:
+            view_class = getattr(pattern.callback, 'view_class', None) or getattr(pattern.callback, 'cls', None)
+            if view_class and issubclass(view_class, ListModelMixin):
+                yield route.replace('^', '').replace('$', ''), pattern.name or route, pattern.callback
+
+
+def _user_for_role(role):
+    if role == 'guest':
+        return AnonymousUser()
+    return User.objects.filter(role=role, is_active=True).first()
+
+
+def _request_host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host and '*' not in host]
+    return hosts[0].lstrip('.') if hosts else 'localhost'
+
+
+def _capture(statements):
+    def wrapper(execute, sql, params, many, context):
+        statements.append((sql, params))
+        return execute(sql, params, many, context)
+    return wrapper
+
+
+def _unique_selects(statements):
+    seen = set()
+    for sql, params in statements:
+        if not sql.lstrip().upper().startswith('SELECT') or sql in seen:
+            continue
+        seen.add(sql)
+        yield sql, params
+
+
+def _sequential_scans(plan):
+    pattern = SQLITE_FULL_SCAN if connection.vendor == 'sqlite' else POSTGRES_SEQ_SCAN
+    tables = []
+    for line in plan:
+        match = pattern.search(line.strip())
+        if match and match.group(1) not in tables:
+            tables.append(match.group(1))
+    return tables
+
+
+def _shorten(sql, length=160):
+    sql = ' '.join(sql.split())
+    return sql if len(sql) <= length else sql[:length - 3] + '...'
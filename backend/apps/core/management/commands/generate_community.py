@@ -0,0 +1,401 @@
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.bookings.models import Booking, Facility
+from apps.core.cache import bump_generation
+from apps.events.models import Event, EventRSVP
+from apps.forum.models import ForumCategory, ForumPost, ForumReply
+from apps.news.models import News
+from apps.payments.models import Payment, PaymentType
+from apps.polls.models import Poll, PollOption, PollVote
+from apps.tickets.models import Ticket, TicketCategory, TicketComment
+from apps.users.models import HouseholdMember, Pet, Vehicle
+
+User = get_user_model()
+
+FIRST_NAMES = [
+    'James', 'Mary', 'Robert', 'Patricia', 'John', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+    'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Carlos', 'Maria',
+    'Wei', 'Mei', 'Ahmed', 'Fatima', 'Hiroshi', 'Yuki', 'Olga', 'Ivan', 'Priya', 'Arjun',
+]
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Lee', 'Chen', 'Kim',
+    'Nguyen', 'Patel', 'Khan', 'Tanaka', 'Ivanova', 'Santos', 'Reyes', 'Cruz', 'Bautista', 'Mendoza',
+]
+PET_NAMES = ['Max', 'Bella', 'Charlie', 'Luna', 'Lucy', 'Cooper', 'Daisy', 'Milo', 'Bailey', 'Coco']
+CAR_MAKES = [('Toyota', 'Camry'), ('Honda', 'Civic'), ('Ford', 'F-150'), ('Tesla', 'Model 3'), ('Subaru', 'Outback')]
+COLORS = ['Black', 'White', 'Silver', 'Blue', 'Red', 'Gray']
+LOREM = (
+    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et '
+    'dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip. '
+)
+
+
+def choices(field_choices):
+    return [value for value, _ in field_choices]
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Let bulk_create keep the created_at/updated_at values we set, so rows are
+    spread over time like real data instead of all sharing one timestamp.
+    """
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a synthetic community for profiling and load testing: "
+        "residents with households, pets and vehicles, payments, tickets with "
+        "comments, forum threads with replies, polls with votes, news, events "
+        "and bookings. Rows are written with bulk_create in batches; every "
+        "account shares one precomputed password hash."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--residents', type=int, default=20000)
+        parser.add_argument('--admins', type=int, default=10)
+        parser.add_argument('--household-members', type=float, default=1.5, help='Average per resident.')
+        parser.add_argument('--pets', type=float, default=0.6, help='Average per resident.')
+        parser.add_argument('--vehicles', type=float, default=1.4, help='Average per resident.')
+        parser.add_argument('--payments', type=int, default=500000)
+        parser.add_argument('--tickets', type=int, default=100000)
+        parser.add_argument('--comments', type=float, default=3, help='Average comments per ticket.')
+        parser.add_argument('--forum-posts', type=int, default=20000)
+        parser.add_argument('--replies', type=float, default=6, help='Average replies per forum post.')
+        parser.add_argument('--polls', type=int, default=100)
+        parser.add_argument('--turnout', type=float, default=0.3, help='Share of residents voting in each poll.')
+        parser.add_argument('--news', type=int, default=2000)
+        parser.add_argument('--events', type=int, default=1000)
+        parser.add_argument('--bookings', type=int, default=50000)
+        parser.add_argument(
+            '--scale', type=float, default=1.0,
+            help='Multiply every count above, e.g. 0.01 for a quick run.',
+        )
+        parser.add_argument('--days', type=int, default=730, help='Spread timestamps over this many past days.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--domain', default='community.test', help='Email domain of the generated accounts.')
+        parser.add_argument('--password', default='password123')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.rng = random.Random(options['seed'])
+        self.now = timezone.now()
+        self.batch_size = options['batch_size']
+        if User.objects.filter(email__endswith='@' + options['domain']).exists():
+            raise CommandError(
+                'Accounts @%s already exist; pass a different --domain to add another community.' % options['domain']
+            )
+
+        started = time.perf_counter()
+        self.created = {}
+        self.create_users()
+        self.create_households()
+        self.create_payments()
+        self.create_tickets()
+        self.create_forum()
+        self.create_polls()
+        self.create_news_and_events()
+        self.create_bookings()
+
+        # bulk_create sends no post_save, so invalidate the public cache here.
+        for model in self.created:
+            bump_generation(model._meta.label_lower)
+
+        total = sum(self.created.values())
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            'Created %d rows in %.1fs (%d rows/s).' % (total, elapsed, total / elapsed if elapsed else total)
+        ))
+
+    def count(self, name):
+        return int(round(self.options[name] * self.options['scale']))
+
+    def per(self, average):
+        """A count around ``average`` (0 to twice the average)."""
+        return self.rng.randint(0, int(round(2 * average)))
+
+    def timestamp(self, after=None):
+        start = after or self.now - timedelta(days=self.options['days'])
+        return start + (self.now - start) * self.rng.random()
+
+    def bulk(self, model, objects):
+        """``bulk_create`` the (lazy) ``objects`` in batches, one transaction per model."""
+        started = time.perf_counter()
+        count = 0
+        objects = iter(objects)
+        with transaction.atomic(), explicit_timestamps(model):
+            while True:
+                batch = list(islice(objects, self.batch_size))
+                if not batch:
+                    break
+                model.objects.bulk_create(batch, batch_size=self.batch_size)
+                count += len(batch)
+        elapsed = time.perf_counter() - started
+        self.created[model] = self.created.get(model, 0) + count
+        self.stdout.write('  %-16s %9d rows in %6.1fs' % (model.__name__, count, elapsed))
+
+    def create_users(self):
+        self.stdout.write('Users')
+        password = make_password(self.options['password'])
+        domain = self.options['domain']
+        lots_per_block = 40
+        self.admin_ids = []
+        self.resident_ids = []
+
+        def users():
+            for n in range(self.count('admins')):
+                user_id = uuid.uuid4()
+                self.admin_ids.append(user_id)
+                yield self.user(user_id, 'admin%d@%s' % (n, domain), password, role='admin', is_staff=True)
+            for n in range(self.count('residents')):
+                user_id = uuid.uuid4()
+                self.resident_ids.append(user_id)
+                yield self.user(
+                    user_id, 'resident%d@%s' % (n, domain), password, role='member',
+                    block=str(n // lots_per_block + 1), lot=str(n % lots_per_block + 1),
+                )
+
+        self.bulk(User, users())
+        if not self.resident_ids:
+            raise CommandError('At least one resident is needed.')
+        if not self.admin_ids:
+            self.admin_ids = self.resident_ids[:1]
+
+    def user(self, user_id, email, password, **fields):
+        joined = self.timestamp()
+        return User(
+            id=user_id, username=email, email=email, password=password,
+            full_name='%s %s' % (self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)),
+            phone='555-%03d-%04d' % (self.rng.randint(200, 999), self.rng.randint(0, 9999)),
+            date_joined=joined, created_at=joined, updated_at=joined, last_profile_update=joined, **fields
+        )
+
+    def create_households(self):
+        relationships = choices(HouseholdMember.RELATIONSHIP_CHOICES)
+        pet_types = choices(Pet.PET_TYPE_CHOICES)
+        rng = self.rng
+
+        def members():
+            for user_id in self.resident_ids:
+                for n in range(self.per(self.options['household_members'])):
+                    yield HouseholdMember(
+                        user_id=user_id, full_name='%s %s %d' % (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), n),
+                        relationship=rng.choice(relationships),
+                    )
+
+        def pets():
+            for user_id in self.resident_ids:
+                for _ in range(self.per(self.options['pets'])):
+                    yield Pet(user_id=user_id, name=rng.choice(PET_NAMES), pet_type=rng.choice(pet_types))
+
+        def vehicles():
+            for user_id in self.resident_ids:
+                for n in range(self.per(self.options['vehicles'])):
+                    make, model = rng.choice(CAR_MAKES)
+                    yield Vehicle(
+                        user_id=user_id, license_plate='%s%04d' % (uuid.uuid4().hex[:3].upper(), n),
+                        make=make, model=model, year=rng.randint(2005, 2025), color=rng.choice(COLORS),
+                        is_primary=n == 0,
+                    )
+
+        self.bulk(HouseholdMember, self.stamped(members()))
+        self.bulk(Pet, self.stamped(pets()))
+        self.bulk(Vehicle, self.stamped(vehicles()))
+
+    def stamped(self, objects):
+        """Give each object a random ``created_at`` (and ``updated_at``) in the past."""
+        for obj in objects:
+            created = self.timestamp()
+            obj.created_at = created
+            if hasattr(obj, 'updated_at'):
+                obj.updated_at = self.timestamp(after=created)
+            yield obj
+
+    def create_payments(self):
+        self.stdout.write('Payments')
+        self.bulk(PaymentType, self.stamped(
+            PaymentType(name=name, amount=Decimal(amount), description='')
+            for name, amount in [('Monthly dues', '150.00'), ('Special assessment', '500.00'),
+                                 ('Clubhouse rental', '75.00'), ('Late fee', '25.00'), ('Gate remote', '40.00')]
+        ))
+        payment_types = list(PaymentType.objects.values_list('id', 'amount'))
+        statuses = ['completed'] * 8 + ['pending', 'failed']
+        rng = self.rng
+        self.bulk(Payment, self.stamped(
+            Payment(
+                user_id=rng.choice(self.resident_ids), payment_type_id=payment_type_id, amount=amount,
+                status=rng.choice(statuses), payment_method=rng.choice(['card', 'ach', 'check']),
+                transaction_id=uuid.uuid4().hex[:16],
+            )
+            for payment_type_id, amount in (rng.choice(payment_types) for _ in range(self.count('payments')))
+        ))
+
+    def create_tickets(self):
+        self.stdout.write('Tickets')
+        self.bulk(TicketCategory, self.stamped(
+            TicketCategory(name=name, description='')
+            for name in ['Maintenance', 'Landscaping', 'Noise', 'Parking', 'Security', 'Pool', 'Billing', 'Other']
+        ))
+        categories = list(TicketCategory.objects.values_list('id', flat=True))
+        priorities = choices(Ticket.PRIORITY_CHOICES)
+        statuses = choices(Ticket.STATUS_CHOICES)
+        rng = self.rng
+        tickets = []
+
+        def make_tickets():
+            for n in range(self.count('tickets')):
+                ticket = Ticket(
+                    title='Ticket %d' % n, description=LOREM, category_id=rng.choice(categories),
+                    submitted_by_id=rng.choice(self.resident_ids), priority=rng.choice(priorities),
+                    status=rng.choice(statuses),
+                    assigned_to_id=rng.choice(self.admin_ids) if rng.random() < 0.6 else None,
+                )
+                tickets.append((ticket.id, ticket.submitted_by_id))
+                yield ticket
+
+        self.bulk(Ticket, self.stamped(make_tickets()))
+        self.bulk(TicketComment, self.stamped(
+            TicketComment(
+                ticket_id=ticket_id, content=LOREM[:rng.randint(40, 200)],
+                author_id=submitter if rng.random() < 0.5 else rng.choice(self.admin_ids),
+            )
+            for ticket_id, submitter in tickets for _ in range(self.per(self.options['comments']))
+        ))
+
+    def create_forum(self):
+        self.stdout.write('Forum')
+        self.bulk(ForumCategory, self.stamped(
+            ForumCategory(name=name, description='')
+            for name in ['General', 'Announcements', 'Buy & Sell', 'Lost & Found', 'Events', 'Suggestions']
+        ))
+        categories = list(ForumCategory.objects.values_list('id', flat=True))
+        rng = self.rng
+        post_ids = []
+
+        def posts():
+            for n in range(self.count('forum_posts')):
+                post = ForumPost(
+                    title='Thread %d' % n, content=LOREM, category_id=rng.choice(categories),
+                    author_id=rng.choice(self.resident_ids), views=rng.randint(0, 500),
+                    is_pinned=rng.random() < 0.01,
+                )
+                post_ids.append(post.id)
+                yield post
+
+        self.bulk(ForumPost, self.stamped(posts()))
+        self.bulk(ForumReply, self.stamped(
+            ForumReply(post_id=post_id, author_id=rng.choice(self.resident_ids), content=LOREM[:rng.randint(20, 200)])
+            for post_id in post_ids for _ in range(self.per(self.options['replies']))
+        ))
+
+    def create_polls(self):
+        self.stdout.write('Polls')
+        rng = self.rng
+        polls = []
+        options = []
+
+        def make_polls():
+            for n in range(self.count('polls')):
+                start = self.timestamp()
+                poll = Poll(
+                    title='Poll %d' % n, description=LOREM, created_by_id=rng.choice(self.admin_ids),
+                    start_date=start, end_date=start + timedelta(days=14),
+                )
+                polls.append(poll.id)
+                yield poll
+
+        def make_options():
+            for poll_id in polls:
+                ids = []
+                for n in range(rng.randint(2, 5)):
+                    option = PollOption(poll_id=poll_id, text='Option %d' % (n + 1))
+                    ids.append(option.id)
+                    yield option
+                options.append((poll_id, ids))
+
+        self.bulk(Poll, self.stamped(make_polls()))
+        self.bulk(PollOption, make_options())
+        voters = max(1, int(len(self.resident_ids) * self.options['turnout']))
+        self.bulk(PollVote, (
+            PollVote(poll_id=poll_id, option_id=rng.choice(option_ids), user_id=user_id, created_at=self.timestamp())
+            for poll_id, option_ids in options
+            for user_id in rng.sample(self.resident_ids, min(voters, len(self.resident_ids)))
+        ))
+
+    def create_news_and_events(self):
+        self.stdout.write('News and events')
+        rng = self.rng
+        self.bulk(News, self.stamped(
+            News(
+                title='News %d' % n, content=LOREM * 4, excerpt=LOREM[:150], author_id=rng.choice(self.admin_ids),
+                is_public=rng.random() < 0.7, is_featured=rng.random() < 0.05,
+            )
+            for n in range(self.count('news'))
+        ))
+        event_ids = []
+
+        def events():
+            for n in range(self.count('events')):
+                start = self.timestamp() + timedelta(days=rng.randint(0, 90))
+                event = Event(
+                    title='Event %d' % n, description=LOREM, location='Clubhouse',
+                    organizer_id=rng.choice(self.admin_ids), start_date=start, end_date=start + timedelta(hours=2),
+                )
+                event_ids.append(event.id)
+                yield event
+
+        self.bulk(Event, self.stamped(events()))
+        rsvp_statuses = choices(EventRSVP.STATUS_CHOICES)
+        self.bulk(EventRSVP, self.stamped(
+            EventRSVP(event_id=event_id, user_id=user_id, status=rng.choice(rsvp_statuses))
+            for event_id in event_ids
+            for user_id in rng.sample(self.resident_ids, min(rng.randint(0, 40), len(self.resident_ids)))
+        ))
+
+    def create_bookings(self):
+        self.stdout.write('Bookings')
+        self.bulk(Facility, self.stamped(
+            Facility(name=name, description='', capacity=capacity)
+            for name, capacity in [('Clubhouse', 80), ('Pool', 40), ('Tennis court', 4), ('BBQ area', 25),
+                                   ('Gym', 15)]
+        ))
+        facilities = list(Facility.objects.values_list('id', flat=True))
+        statuses = choices(Booking.STATUS_CHOICES)
+        rng = self.rng
+
+        def bookings():
+            for _ in range(self.count('bookings')):
+                start = self.timestamp() + timedelta(days=rng.randint(0, 60), hours=rng.randint(8, 18))
+                yield Booking(
+                    facility_id=rng.choice(facilities), user_id=rng.choice(self.resident_ids),
+                    start_datetime=start, end_datetime=start + timedelta(hours=2), purpose='Private event',
+                    expected_guests=rng.randint(1, 30), status=rng.choice(statuses),
+                )
+
+        self.bulk(Booking, self.stamped(bookings()))
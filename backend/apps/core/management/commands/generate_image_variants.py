@@ -0,0 +1,47 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.images import ImageVariantsField, is_stale
+from apps.core.tasks import generate_image_variants
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the resized variants of every uploaded image whose variants "
+        "are missing or out of date (e.g. images uploaded before variants existed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', action='append', help='Only this model, e.g. users.Pet (repeatable).')
+        parser.add_argument('--force', action='store_true', help='Regenerate up-to-date variants too.')
+        parser.add_argument(
+            '--queue', action='store_true', help='Queue a Celery task per image instead of working inline.',
+        )
+
+    def handle(self, *args, **options):
+        fields = [
+            (model, field) for model in apps.get_models() for field in model._meta.get_fields()
+            if isinstance(field, ImageVariantsField)
+        ]
+        if options['model']:
+            wanted = {label.lower() for label in options['model']}
+            unknown = wanted - {model._meta.label_lower for model, _ in fields}
+            if unknown:
+                raise CommandError('No images to process on %s.' % ', '.join(sorted(unknown)))
+            fields = [(model, field) for model, field in fields if model._meta.label_lower in wanted]
+
+        for model, field in fields:
+            queryset = model._default_manager.only('pk', field.source, field.attname)
+            done = 0
+            for instance in queryset.iterator():
+                if not (options['force'] or is_stale(instance, field)):
+                    continue
+                args = (model._meta.label, str(instance.pk), field.name, options['force'])
+                if options['queue']:
+                    generate_image_variants.delay(*args)
+                else:
+                    generate_image_variants(*args)
+                done += 1
+            self.stdout.write('%s.%s: %d %s' % (
+                model._meta.label, field.source, done, 'queued' if options['queue'] else 'processed',
+            ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the tombstones of rows deleted more than SYNC_TOMBSTONE_DAYS ago, "
+        "which no unexpired sync token can ask for. Run it daily."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Deleted %d tombstones.' % prune_tombstones())
@@ -0,0 +1,54 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.db.slow_queries import log_files, read_entries, summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Summarizes the slow-query log (SLOW_QUERY_LOG and its rotated files): "
+        "statements grouped by their SQL, the slowest in total first, with the "
+        "views and code that ran them and their EXPLAIN plan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help='Number of statements to report.')
+        parser.add_argument('--log', help='Read this log instead of SLOW_QUERY_LOG.')
+        parser.add_argument('--view', help='Only count entries logged while serving this view.')
+        parser.add_argument('--show-plans', action='store_true', help='Print the plan of each statement.')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+
+    def handle(self, *args, **options):
+        path = options['log'] or settings.SLOW_QUERY_LOG
+        if not log_files(path):
+            raise CommandError('No slow-query log at %s.' % path)
+
+        entries = read_entries(path)
+        if options['view']:
+            entries = (entry for entry in entries if entry.get('view') == options['view'])
+        report = summarize(entries)[:options['top']]
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        if not report:
+            self.stdout.write('No slow queries logged.')
+            return
+        for rank, group in enumerate(report, 1):
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                '#%d  %.1f ms total, %d calls, %.1f ms mean, %.1f ms max' % (
+                    rank, group['total_ms'], group['count'], group['mean_ms'], group['max_ms'],
+                )
+            ))
+            self.stdout.write('  %s' % _shorten(group['sql']))
+            for label, key in (('view', 'views'), ('origin', 'origins')):
+                for value, count in sorted(group[key].items(), key=lambda item: -item[1])[:3]:
+                    self.stdout.write('  %-7s%s (%d)' % (label, value, count))
+            if options['show_plans'] and group['plan']:
+                self.stdout.write('\n'.join('    ' + line for line in group['plan']))
+
+
+def _shorten(sql, length=200):
+    return sql if len(sql) <= length else sql[:length - 3] + '...'
@@ -0,0 +1,301 @@
+"""
+Request metrics in the Prometheus text format.
+
+``MetricsMiddleware`` records, per resolved URL name (``users:login``,
+``news-list``, ...): a request counter by method and status, duration and
+response size histograms, database queries and their time, serializer time
+and public cache hits. Queries are counted by an execute wrapper installed on
+every connection, serializer time by timing ``BaseSerializer.data``; both
+only while a request is being measured.
+
+Every process keeps its own numbers. Under gunicorn, each worker writes
+them to a file in ``METRICS_ROOT`` (from a background thread every
+``METRICS_FLUSH_INTERVAL`` seconds, and when it exits) and
+``/api/metrics/`` adds up the files of all workers, so any worker can
+answer a scrape. Without ``METRICS_ROOT`` only the serving process is
+reported.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from rest_framework import serializers
+
+from . import compression
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name: (type, help, buckets)
+METRICS = {
+    'hoa_http_requests_total': ('counter', 'Requests served, by view, method and status.', None),
+    'hoa_http_request_duration_seconds': ('histogram', 'Time to build the response.', DURATION_BUCKETS),
+    'hoa_http_response_size_bytes': ('histogram', 'Response body size as sent.', SIZE_BUCKETS),
+    'hoa_db_queries_total': ('counter', 'Database queries run while serving requests.', None),
+    'hoa_db_query_seconds_total': ('counter', 'Time spent in database queries.', None),
+    'hoa_serializer_seconds_total': ('counter', 'Time spent building serializer data.', None),
+    'hoa_public_cache_requests_total': ('counter', 'Public cache lookups, by result (hit or miss).', None),
+    'hoa_compression_responses_total': ('counter', 'Responses compressed, by coding.', None),
+    'hoa_compression_bytes_in_total': ('counter', 'Response bytes before compression.', None),
+    'hoa_compression_bytes_out_total': ('counter', 'Response bytes after compression.', None),
+}
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('metrics_request', default=None)
+
+
+class RequestMetrics:
+    """What one request spent on queries and serializers."""
+
+    __slots__ = ('queries', 'query_seconds', 'serializer_seconds', 'serializer_depth')
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.serializer_depth = 0
+
+
+class Registry:
+    """Counters and histograms of this process, keyed by name and labels."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.histograms = {}
+        self.started = time.time()
+        self.dirty = False
+        self.flusher = None
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+            self.dirty = True
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                # one count per bucket, then +Inf, sum
+                histogram = self.histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[index] += 1
+                    break
+            else:
+                histogram[len(buckets)] += 1
+            histogram[-1] += value
+            self.dirty = True
+
+    def snapshot(self):
+        with self.lock:
+            self.dirty = False
+            values = [[name, list(labels), value] for (name, labels), value in self.values.items()]
+            histograms = [[name, list(labels), list(data)] for (name, labels), data in self.histograms.items()]
+        for coding, stats in compression.compression_stats().items():
+            for metric, key in (('responses_total', 'responses'), ('bytes_in_total', 'bytes_in'),
+                                ('bytes_out_total', 'bytes_out')):
+                values.append(['hoa_compression_' + metric, [['coding', coding]], stats[key]])
+        return {'values': values, 'histograms': histograms}
+
+    def reset(self):
+        with self.lock:
+            self.values.clear()
+            self.histograms.clear()
+
+
+registry = Registry()
+
+
+def metrics_root():
+    return getattr(settings, 'METRICS_ROOT', '')
+
+
+def process_file(root):
+    # The start time keeps a recycled pid from overwriting a dead worker's file.
+    return os.path.join(root, 'metrics-%d-%d.json' % (os.getpid(), registry.started * 1000))
+
+
+def flush():
+    """Write this process's metrics to ``METRICS_ROOT``."""
+    root = metrics_root()
+    if not root:
+        return
+    os.makedirs(root, exist_ok=True)
+    path = process_file(root)
+    temporary = '%s.%d.tmp' % (path, threading.get_ident())
+    with open(temporary, 'w') as handle:
+        json.dump(registry.snapshot(), handle)
+    os.replace(temporary, path)
+
+
+def start_flusher():
+    """Flush every ``METRICS_FLUSH_INTERVAL`` seconds from a daemon thread, once per process."""
+    if registry.flusher is not None or not metrics_root():
+        return
+    with registry.lock:
+        if registry.flusher is not None:
+            return
+        registry.flusher = threading.Thread(target=_flush_periodically, name='metrics-flusher', daemon=True)
+    registry.flusher.start()
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(getattr(settings, 'METRICS_FLUSH_INTERVAL', 5))
+        if registry.dirty:
+            try:
+                flush()
+            except OSError:
+                logger.exception('Could not write request metrics')
+
+
+def collect():
+    """The snapshots of every process (this one's taken fresh)."""
+    root = metrics_root()
+    if not root:
+        return [registry.snapshot()]
+    flush()
+    snapshots = []
+    for filename in os.listdir(root):
+        if not filename.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(root, filename)) as handle:
+                snapshots.append(json.load(handle))
+        except (OSError, ValueError):
+            # Removed or replaced under us; its worker will write it again.
+            continue
+    return snapshots
+
+
+def render(snapshots):
+    """Add up the snapshots and format them for Prometheus."""
+    values, histograms = {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['values']:
+            key = (name, tuple(tuple(label) for label in labels))
+            values[key] = values.get(key, 0) + value
+        for name, labels, data in snapshot['histograms']:
+            key = (name, tuple(tuple(label) for label in labels))
+            total = histograms.setdefault(key, [0] * len(data))
+            for index, value in enumerate(data):
+                total[index] += value
+
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append('# HELP %s %s' % (name, help_text))
+        lines.append('# TYPE %s %s' % (name, kind))
+        if kind == 'histogram':
+            for (metric, labels), data in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + ('+Inf',), data):
+                    cumulative += count
+                    lines.append('%s_bucket%s %s' % (name, _labels(labels + (('le', _number(bound)),)), cumulative))
+                lines.append('%s_sum%s %s' % (name, _labels(labels), _number(data[-1])))
+                lines.append('%s_count%s %s' % (name, _labels(labels), cumulative))
+        else:
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append('%s%s %s' % (name, _labels(labels), _number(value)))
+    return '\n'.join(lines) + '\n'
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+
+
+def _number(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+def start_request():
+    request_metrics = RequestMetrics()
+    return request_metrics, _current.set(request_metrics)
+
+
+def finish_request(request, response, request_metrics, token, duration):
+    _current.reset(token)
+    view = view_label(request)
+    registry.inc('hoa_http_requests_total', {
+        'view': view, 'method': request.method, 'status': str(response.status_code),
+    })
+    registry.observe('hoa_http_request_duration_seconds', {'view': view, 'method': request.method}, duration)
+    if not response.streaming:
+        registry.observe('hoa_http_response_size_bytes', {'view': view}, len(response.content))
+    if request_metrics.queries:
+        registry.inc('hoa_db_queries_total', {'view': view}, request_metrics.queries)
+        registry.inc('hoa_db_query_seconds_total', {'view': view}, request_metrics.query_seconds)
+    if request_metrics.serializer_seconds:
+        registry.inc('hoa_serializer_seconds_total', {'view': view}, request_metrics.serializer_seconds)
+    cache_result = response.get('X-Cache')
+    if cache_result in ('HIT', 'MISS'):
+        registry.inc('hoa_public_cache_requests_total', {'view': view, 'result': cache_result.lower()})
+    start_flusher()
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    return match.view_name or match.route
+
+
+def count_query(execute, sql, params, many, context):
+    request_metrics = _current.get()
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_metrics.queries += 1
+        request_metrics.query_seconds += time.perf_counter() - start
+
+
+def install_query_counter(sender, connection, **kwargs):
+    """``connection_created`` receiver: count the connection's queries from now on."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def instrument_serializers():
+    """Time ``BaseSerializer.data`` (outermost call only) for the current request."""
+    original = serializers.BaseSerializer.data
+    if getattr(original.fget, 'instrumented', False):
+        return
+
+    def data(self):
+        request_metrics = _current.get()
+        if request_metrics is None:
+            return original.fget(self)
+        request_metrics.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            request_metrics.serializer_depth -= 1
+            if not request_metrics.serializer_depth:
+                request_metrics.serializer_seconds += time.perf_counter() - start
+
+    data.instrumented = True
+    serializers.BaseSerializer.data = property(data, doc=original.__doc__)
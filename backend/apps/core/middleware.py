@@ -0,0 +1,251 @@
+import time
+from types import SimpleNamespace
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.utils.cache import patch_vary_headers
+from rest_framework.exceptions import APIException
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from apps.users.permissions import IsAdmin
+
+from . import compression, metrics
+from .db import routers
+from .profiling import RequestProfiler
+
+
+class MetricsMiddleware:
+    """
+    Record request metrics (see ``apps.core.metrics``). Put it above
+    ``CompressionMiddleware`` so response sizes are the bytes sent.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            return self.get_response(request)
+        request_metrics, token = metrics.start_request()
+        start = time.perf_counter()
+        response = self.get_response(request)
+        metrics.finish_request(request, response, request_metrics, token, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            return await self.get_response(request)
+        request_metrics, token = metrics.start_request()
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        metrics.finish_request(request, response, request_metrics, token, time.perf_counter() - start)
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Profile a single request on demand. Sending ``X-Profile: 1`` or
+    ``?_profile=1`` as an admin stores a cProfile dump and a JSON summary
+    (SQL, serializer and render timings) under ``PROFILING_ROOT``; the id is
+    returned in the ``X-Profile-Id`` header and the files can be fetched from
+    ``/api/profiles/``. Requests from anyone else are served normally.
+    """
+
+    header = 'HTTP_X_PROFILE'
+    query_param = '_profile'
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'PROFILING_ENABLED', True) or not self.is_requested(request):
+            return self.get_response(request)
+        if not self.is_admin(request):
+            return self.get_response(request)
+
+        with RequestProfiler() as profiler:
+            response = self.get_response(request)
+        return self.add_profile(response, profiler.save(request, response))
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'PROFILING_ENABLED', True) or not self.is_requested(request):
+            return await self.get_response(request)
+        if not await sync_to_async(self.is_admin)(request):
+            return await self.get_response(request)
+
+        with RequestProfiler() as profiler:
+            await sync_to_async(profiler.watch_connections)()
+            response = await self.get_response(request)
+        return self.add_profile(response, await sync_to_async(profiler.save)(request, response))
+
+    def add_profile(self, response, saved):
+        profile_id, summary = saved
+        response['X-Profile-Id'] = profile_id
+        response['Server-Timing'] = ', '.join(
+            '%s;dur=%s' % (name, summary[name + '_ms']) for name in ('sql', 'serializer', 'render', 'total')
+        )
+        return response
+
+    def is_requested(self, request):
+        return request.META.get(self.header, '') not in ('', '0') or request.GET.get(self.query_param) not in (None, '', '0')
+
+    def is_admin(self, request):
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            try:
+                result = JWTAuthentication().authenticate(request)
+            except APIException:
+                return False
+            if result is None:
+                return False
+            user = result[0]
+        return IsAdmin().has_permission(SimpleNamespace(user=user), None)
+
+
+class ReplicaMiddleware:
+    """
+    Serve safe-method requests from a read replica (see
+    ``apps.core.db.routers``), unless the view is marked ``use_primary`` or
+    the user made a write within the last ``REPLICA_PIN_SECONDS``. Views
+    that only read whatever their method (``read_only = True``, like the
+    batch endpoint) do not pin the user.
+    """
+
+    safe_methods = ('GET', 'HEAD', 'OPTIONS')
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = routers.set_read_alias(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            routers.reset_read_alias(token)
+        if self.pins(request):
+            routers.pin_to_primary(self.get_user_id(request))
+        return response
+
+    async def __acall__(self, request):
+        token = routers.set_read_alias(None)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routers.reset_read_alias(token)
+        if self.pins(request):
+            await sync_to_async(routers.pin_to_primary)(self.get_user_id(request))
+        return response
+
+    def pins(self, request):
+        return (
+            request.method not in self.safe_methods
+            and routers.get_replicas()
+            and not getattr(request, '_replica_read_only', False)
+        )
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in self.safe_methods:
+            view_class = getattr(view_func, 'view_class', None)
+            request._replica_read_only = getattr(view_class, 'read_only', False)
+            return None
+        if not routers.get_replicas():
+            return None
+        routers.set_read_alias(routers.choose_read_alias(view_func, self.get_user_id(request)))
+        return None
+
+    def get_user_id(self, request):
+        """The requesting user's id, from the JWT or session, without a query."""
+        if hasattr(request, '_replica_user_id'):
+            return request._replica_user_id
+        user_id = None
+        authentication = JWTAuthentication()
+        header = authentication.get_header(request)
+        raw_token = authentication.get_raw_token(header) if header else None
+        if raw_token:
+            try:
+                user_id = authentication.get_validated_token(raw_token).get(jwt_settings.USER_ID_CLAIM)
+            except APIException:
+                pass
+        elif hasattr(request, 'session'):
+            user_id = request.session.get(SESSION_KEY)
+        request._replica_user_id = user_id
+        return user_id
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses (API JSON, HTML, JS, CSS) with the best coding
+    the client accepts; see ``apps.core.compression``. Bodies smaller than
+    ``COMPRESSION_MIN_SIZE``, streaming responses (files, media) and
+    responses that are already encoded are sent as they are.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if not getattr(settings, 'COMPRESSION_ENABLED', True) or not self.is_compressible(response):
+            return response
+        # The body depends on Accept-Encoding from here on, compressed or not.
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = compression.negotiate(request.META.get('HTTP_ACCEPT_ENCODING'))
+        if coding is None:
+            return response
+
+        content = response.content
+        compressed = compression.compress(coding, content)
+        if len(compressed) >= len(content):
+            return response
+        compression.record(coding, len(content), len(compressed))
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = coding
+        # The compressed body is not byte-identical to the original one.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    def is_compressible(self, response):
+        if response.streaming or response.has_header('Content-Encoding') or response.status_code < 200:
+            return False
+        if len(response.content) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+            return False
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        return content_type.startswith(tuple(getattr(settings, 'COMPRESSION_CONTENT_TYPES', ())))
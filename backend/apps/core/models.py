@@ -0,0 +1,20 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """A deleted row of a model clients sync (see ``apps.core.sync``)."""
+
+    model = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=64)
+    # The user a per-user row belonged to; null for rows every resident sees.
+    owner = models.UUIDField(null=True, blank=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id}"
@@ -0,0 +1,222 @@
+"""
+Querysets shaped by the serializer that renders them.
+
+List and detail views add ``OptimizedQuerysetMixin`` and keep
+``get_queryset()`` to plain filters. On GET the mixin walks the fields the
+serializer will send (after ``?fields=``, ``?omit=`` and ``?expand=``):
+
+- a dotted source (``author.full_name``) or a nested serializer of a
+  forward relation is joined with ``select_related``;
+- a nested ``many=True`` serializer (``rsvps``) becomes a ``Prefetch``
+  whose queryset is shaped the same way for the child serializer;
+- the columns the fields read, plus the primary key, the foreign keys and
+  the ordering columns, are loaded with ``only()``.
+
+A field the walk cannot see through (a ``SerializerMethodField``, a model
+property, ``source='*'``) loads every column of its model, unless the
+serializer's ``Meta.relation_dependencies`` lists what it reads, e.g.
+``{'reply_count': ['replies']}``, or ``[]`` for a method that only reads
+annotations. A ``Prefetch`` the view sets up itself (to annotate the
+related rows, say) keeps its queryset; relations the serializer does not
+read are neither joined nor prefetched.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from .dynamic_fields import get_options
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+# Serializer class -> Plan, for requests without ?fields/?omit/?expand.
+_plans = {}
+
+
+class Plan:
+    """The columns, joins and prefetches one serializer reads from ``model``."""
+
+    def __init__(self, model):
+        self.model = model
+        self.columns = set()
+        self.complete = False
+        self.select = {}
+        self.prefetch = {}
+
+    def read(self, attrs, serializer=None, whole=False):
+        """
+        Record that ``attrs`` (a field's ``source_attrs``) is read, rendered
+        by ``serializer`` or, with ``whole``, as the related object itself.
+        """
+        name, rest = attrs[0], attrs[1:]
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # A property or method may read anything.
+            self.complete = True
+            return
+        if not field.is_relation:
+            self.columns.add(name)
+            return
+        if field.related_model is None:
+            self.complete = True
+            return
+        if field.concrete and not field.many_to_many:
+            self.columns.add(name)
+            if not (rest or serializer is not None or whole):
+                # Only the key, which is on this row.
+                return
+
+        if field.one_to_many or field.many_to_many:
+            related = self.prefetch.get(name)
+            if related is None:
+                related = self.prefetch[name] = Plan(field.related_model)
+            if field.one_to_many:
+                # Prefetching matches the rows to their parent on this key.
+                related.columns.add(field.field.name)
+        else:
+            related = self.select.get(name)
+            if related is None:
+                related = self.select[name] = Plan(field.related_model)
+
+        if rest:
+            related.read(rest, serializer, whole)
+        elif serializer is not None:
+            related.merge(build_plan(serializer, related.model))
+        elif whole:
+            related.complete = True
+
+    def merge(self, other):
+        self.columns |= other.columns
+        self.complete = self.complete or other.complete
+        for attr in ('select', 'prefetch'):
+            plans = getattr(self, attr)
+            for name, plan in getattr(other, attr).items():
+                if name in plans:
+                    plans[name].merge(plan)
+                else:
+                    plans[name] = plan
+
+    def only_fields(self, prefix=''):
+        """``only()`` arguments for this plan and the relations it selects."""
+        if self.complete:
+            fields = [prefix + field.name for field in self.model._meta.concrete_fields]
+        else:
+            fields = [prefix + name for name in sorted({self.model._meta.pk.name} | self.columns)]
+        for name, plan in self.select.items():
+            fields += plan.only_fields(prefix + name + '__')
+        return fields
+
+    def is_complete(self):
+        return self.complete and all(plan.is_complete() for plan in self.select.values())
+
+
+def build_plan(serializer, model=None):
+    """The ``Plan`` of the fields ``serializer`` renders."""
+    plan = Plan(model or serializer.Meta.model)
+    dependencies = getattr(getattr(serializer, 'Meta', None), 'relation_dependencies', {})
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in dependencies:
+            for path in dependencies[name]:
+                plan.read(path.split('__'))
+            continue
+        if field.source == '*':
+            plan.complete = True
+        elif isinstance(field, serializers.ListSerializer):
+            plan.read(field.source_attrs, serializer=field.child)
+        elif isinstance(field, serializers.BaseSerializer):
+            plan.read(field.source_attrs, serializer=field)
+        else:
+            relation = getattr(field, 'child_relation', field)
+            # Slug, string and hyperlinked fields read the related object itself.
+            whole = (isinstance(relation, serializers.RelatedField)
+                     and not isinstance(relation, serializers.PrimaryKeyRelatedField))
+            plan.read(field.source_attrs, whole=whole)
+    return plan
+
+
+def optimize_queryset(queryset, plan, ordering=()):
+    """
+    Apply ``plan`` to ``queryset``: replace its ``select_related`` and
+    ``prefetch_related`` with the plan's and defer the columns it does not
+    read. ``ordering`` names columns that must be loaded anyway.
+    """
+    queryset = queryset.select_related(None)
+    paths = list(_select_paths(plan))
+    if paths:
+        queryset = queryset.select_related(*paths)
+
+    existing = {}
+    for lookup in queryset._prefetch_related_lookups:
+        if isinstance(lookup, Prefetch):
+            existing[lookup.prefetch_to] = lookup
+    lookups = []
+    for path, related in _prefetch_paths(plan):
+        lookup = existing.get(path)
+        if lookup is not None and lookup.to_attr:
+            lookups.append(lookup)
+            continue
+        if lookup is not None and lookup.queryset is not None:
+            related_queryset = lookup.queryset
+        else:
+            related_queryset = related.model._default_manager.all()
+        lookups.append(Prefetch(path, queryset=optimize_queryset(related_queryset, related)))
+    queryset = queryset.prefetch_related(None)
+    if lookups:
+        queryset = queryset.prefetch_related(*lookups)
+
+    if not plan.is_complete():
+        fields = plan.only_fields()
+        local = {field.name for field in plan.model._meta.concrete_fields}
+        for name in ordering:
+            name = name.lstrip('-').split('__')[0]
+            if name in local and not plan.complete:
+                fields.append(name)
+        queryset = queryset.only(*fields)
+    return queryset
+
+
+def _select_paths(plan, prefix=''):
+    for name, related in plan.select.items():
+        yield prefix + name
+        yield from _select_paths(related, prefix + name + '__')
+
+
+def _prefetch_paths(plan, prefix=''):
+    """Prefetches of the plan and of the relations it selects (``'event__rsvps'``)."""
+    for name, related in plan.prefetch.items():
+        yield prefix + name, related
+    for name, related in plan.select.items():
+        yield from _prefetch_paths(related, prefix + name + '__')
+
+
+class OptimizedQuerysetMixin:
+    """
+    Join, prefetch and load exactly what the view's serializer renders on
+    GET, so a list costs the same number of queries at any length.
+    Pagination orders by ``pagination_ordering`` where the view sets one;
+    those columns are always loaded.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return optimize_queryset(queryset, self.get_query_plan(), self.get_loaded_ordering(queryset))
+
+    def get_query_plan(self):
+        serializer_class = self.get_serializer_class()
+        dynamic = get_options(self.request) is not None
+        plan = None if dynamic else _plans.get(serializer_class)
+        if plan is None:
+            plan = build_plan(self.get_serializer())
+            if not dynamic:
+                _plans[serializer_class] = plan
+        return plan
+
+    def get_loaded_ordering(self, queryset):
+        return (
+            list(getattr(self, 'pagination_ordering', None) or ())
+            + list(queryset.query.order_by or queryset.model._meta.ordering)
+        )
@@ -0,0 +1,217 @@
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in keyset (cursor) pagination keyed on the queryset's ordering.
+
+    Clients that send neither ``cursor`` nor ``page_size`` keep receiving the
+    plain list. Paginated pages are selected with a ``WHERE`` on the ordering
+    columns rather than an ``OFFSET``, and no ``COUNT(*)`` is ever issued.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 25
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+        self.model = queryset.model
+        position, self.reverse = self.decode_cursor(request)
+
+        ordering = [_flip(field) for field in self.ordering] if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(_keyset_filter(ordering, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.position = position
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset, view):
+        ordering = (
+            getattr(view, 'pagination_ordering', None)
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+        )
+        pk_name = queryset.model._meta.pk.name
+        ordering = [pk_name if field.lstrip('-') == 'pk' else field for field in ordering]
+        ordering = [('-' + pk_name if field == '-pk' else field) for field in ordering]
+        if not any(field.lstrip('-') == pk_name for field in ordering):
+            # The primary key breaks ties so every position is unique.
+            ordering.append(pk_name)
+        return ordering
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values = payload['p']
+            reverse = bool(payload.get('r', False))
+            if len(values) != len(self.ordering):
+                raise ValueError('cursor does not match the ordering')
+            position = [
+                self.model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        payload = {'p': [_json_value(value) for value in position]}
+        if reverse:
+            payload['r'] = True
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        ).decode('ascii')
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_position(self, row):
+        # Model instances, or the values() dicts of FastReadMixin views
+        if isinstance(row, dict):
+            return [row[field.lstrip('-')] for field in self.ordering]
+        return [getattr(row, field.lstrip('-')) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+        # Paging backwards past the start lands on an empty page; resume from
+        # the position we came from.
+        return self.encode_cursor(self.position, reverse=False) if self.position else None
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+        return self.encode_cursor(self.position, reverse=True) if self.position else None
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+
+class OffsetPagination(LimitOffsetPagination):
+    """
+    Opt-in limit/offset pagination for small lists such as categories.
+
+    Only used when the client sends ``limit`` or ``offset``, so the existing
+    unpaginated responses are unchanged.
+    """
+
+    default_limit = 25
+    max_limit = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.limit_query_param not in params and self.offset_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def _flip(field):
+    return field[1:] if field.startswith('-') else '-' + field
+
+
+def _keyset_filter(ordering, position):
+    """
+    Build the lexicographic "row comes after ``position``" condition, i.e.
+    ``(a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z)``.
+    """
+    clauses = []
+    for index, (field, value) in enumerate(zip(ordering, position)):
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        clause = Q(**{'%s__%s' % (field.lstrip('-'), lookup): value})
+        for prev_field, prev_value in zip(ordering[:index], position[:index]):
+            clause &= Q(**{prev_field.lstrip('-'): prev_value})
+        clauses.append(clause)
+    return reduce(or_, clauses)
+
+
+def _json_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    return value
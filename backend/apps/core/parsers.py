@@ -0,0 +1,33 @@
+"""
+JSON parser backed by orjson; see ``apps.core.renderers``.
+
+orjson is always strict (no NaN or Infinity), as ``STRICT_JSON`` is by
+default. Bodies that aren't UTF-8 are parsed by the stock parser. Integers
+beyond 64 bits, which no field here accepts, are read as floats.
+"""
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read() if stream is not None else b''
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,229 @@
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import time
+import traceback
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ID = re.compile(r'^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$')
+
+# Functions whose cumulative time is reported as serializer / render time.
+SERIALIZER_FUNCTIONS = {('rest_framework/serializers.py', name) for name in ('data', 'is_valid')} | {
+    ('apps/core/fast_read.py', 'render'),
+}
+RENDER_FUNCTIONS = {('rest_framework/response.py', 'rendered_content')}
+
+SOURCE_ROOT = str(settings.BASE_DIR) + os.sep
+ORM_PATH = os.sep + os.path.join('django', 'db') + os.sep
+
+
+def profiling_root():
+    return getattr(settings, 'PROFILING_ROOT', os.path.join(settings.BASE_DIR, 'profiles'))
+
+
+class RequestProfiler:
+    """
+    Profile a block of code: a cProfile run plus every SQL statement issued
+    on any database connection, with its duration and the project code that
+    triggered it.
+
+        with RequestProfiler() as profiler:
+            response = get_response(request)
+        profile_id, summary = profiler.save(request, response)
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.queries = []
+        self.started_at = None
+        self.duration = 0.0
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        self.watch_connections()
+        self.started_at = timezone.now()
+        self._start = time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.duration = time.perf_counter() - self._start
+        self._stack.close()
+        return False
+
+    def watch_connections(self):
+        """
+        Record queries on this thread's connections. Async views run their
+        queries on the ``sync_to_async`` thread, so the ASGI middleware calls
+        this there as well.
+        """
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self._record_query))
+
+    def _record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'sql': sql,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+                'alias': context['connection'].alias,
+                'many': many,
+                'origin': query_origin(),
+            })
+
+    def summary(self, top=40):
+        stats = pstats.Stats(self.profile)
+        functions = []
+        for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+            functions.append({
+                'function': '%s:%s(%s)' % (_relative(filename), line, name),
+                'calls': calls,
+                'own_ms': round(own * 1000, 3),
+                'cumulative_ms': round(cumulative * 1000, 3),
+            })
+        functions.sort(key=lambda entry: entry['cumulative_ms'], reverse=True)
+        sql_ms = sum(query['duration_ms'] for query in self.queries)
+        return {
+            'started_at': self.started_at.isoformat(),
+            'total_ms': round(self.duration * 1000, 3),
+            'sql_ms': round(sql_ms, 3),
+            'sql_count': len(self.queries),
+            'serializer_ms': round(_outermost_time(stats, SERIALIZER_FUNCTIONS) * 1000, 3),
+            'render_ms': round(_outermost_time(stats, RENDER_FUNCTIONS) * 1000, 3),
+            'queries': self.queries,
+            'functions': functions[:top],
+        }
+
+    def save(self, request, response):
+        """
+        Write ``<id>.prof`` (loadable with ``pstats``/snakeviz) and
+        ``<id>.json`` (the summary) to ``PROFILING_ROOT`` and return
+        ``(id, summary)``.
+        """
+        root = profiling_root()
+        os.makedirs(root, exist_ok=True)
+        profile_id = '%s-%s' % (self.started_at.strftime('%Y%m%dT%H%M%S'), uuid.uuid4().hex[:8])
+
+        summary = self.summary()
+        user = getattr(request, 'user', None)
+        summary.update({
+            'id': profile_id,
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'user': getattr(user, 'email', None),
+        })
+        self.profile.dump_stats(os.path.join(root, profile_id + '.prof'))
+        with open(os.path.join(root, profile_id + '.json'), 'w') as handle:
+            json.dump(summary, handle, indent=2, default=str)
+
+        prune_profiles(root, getattr(settings, 'PROFILING_MAX_FILES', 200))
+        logger.info(
+            'Profiled %s %s: %s ms total, %s queries in %s ms (%s)',
+            request.method, request.path, summary['total_ms'], summary['sql_count'], summary['sql_ms'], profile_id,
+        )
+        return profile_id, summary
+
+
+def query_origin():
+    """
+    Where a query came from: the innermost caller outside the ORM (often a
+    serializer field or DRF mixin) and the innermost project frame.
+    """
+    origin = []
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename == __file__ or ORM_PATH in frame.filename:
+            continue
+        label = '%s:%s in %s' % (_relative(frame.filename), frame.lineno, frame.name)
+        if not origin:
+            origin.append(label)
+        if frame.filename.startswith(SOURCE_ROOT):
+            if label not in origin:
+                origin.append(label)
+            break
+    return origin
+
+
+def list_profiles():
+    root = profiling_root()
+    if not os.path.isdir(root):
+        return []
+    profiles = []
+    for filename in sorted(os.listdir(root), reverse=True):
+        if not filename.endswith('.json'):
+            continue
+        summary = read_profile(filename[:-len('.json')])
+        if summary is not None:
+            profiles.append({
+                key: summary.get(key)
+                for key in ('id', 'started_at', 'method', 'path', 'status', 'user', 'total_ms', 'sql_ms', 'sql_count')
+            })
+    return profiles
+
+
+def read_profile(profile_id):
+    path = profile_path(profile_id, '.json')
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def profile_path(profile_id, extension):
+    if not PROFILE_ID.match(profile_id):
+        return None
+    return os.path.join(profiling_root(), profile_id + extension)
+
+
+def prune_profiles(root, keep):
+    ids = sorted({os.path.splitext(name)[0] for name in os.listdir(root) if PROFILE_ID.match(os.path.splitext(name)[0])})
+    for profile_id in ids[:-keep] if keep else []:
+        for extension in ('.prof', '.json'):
+            try:
+                os.remove(os.path.join(root, profile_id + extension))
+            except FileNotFoundError:
+                pass
+
+
+def _outermost_time(stats, functions):
+    """
+    Cumulative time of the matching functions, counting only calls that were
+    not made from another matching function (nested serializers would
+    otherwise be counted twice).
+    """
+    def matches(key):
+        filename, _, name = key
+        return any(filename.replace(os.sep, '/').endswith(path) and name == target for path, target in functions)
+
+    total = 0.0
+    for key, (_, _, _, cumulative, callers) in stats.stats.items():
+        if not matches(key):
+            continue
+        if any(matches(caller) for caller in callers):
+            # Only the share of time from non-matching callers is outermost.
+            cumulative = sum(timing[3] for caller, timing in callers.items() if not matches(caller))
+        total += cumulative
+    return total
+
+
+def _relative(filename):
+    if filename.startswith(SOURCE_ROOT):
+        return filename[len(SOURCE_ROOT):]
+    marker = os.sep + 'site-packages' + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    return filename
@@ -0,0 +1,46 @@
+"""
+JSON renderer backed by orjson.
+
+Produces the same bytes as ``rest_framework.renderers.JSONRenderer`` with
+the default ``COMPACT_JSON``/``UNICODE_JSON``/``STRICT_JSON`` settings, but
+orjson writes UUIDs and dates/datetimes (``Z`` for UTC) itself, in C. What
+orjson doesn't know (``Decimal``, lazy translation strings, querysets) is
+handed to DRF's encoder, as before; serializers already turn decimals into
+strings, so API responses rarely need it. Anything orjson refuses (non-str
+dict keys, integers over 64 bits), pretty-printed output and non-default
+JSON settings are rendered by the stock renderer. The one difference:
+floats, which no serializer here produces, are written in orjson's
+shortest form (``1e16``, not ``1e+16``) and NaN as ``null``. When orjson
+isn't installed this is just the stock renderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+_encoder = encoders.JSONEncoder()
+
+
+def _default(obj):
+    return _encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (orjson is None or not self.compact or self.ensure_ascii or not self.strict
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as the stock renderer: output stays a JavaScript subset.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
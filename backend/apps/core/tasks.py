@@ -0,0 +1,52 @@
+import logging
+
+from celery import shared_task
+from django.apps import apps
+from django.db.models import Q
+from django.utils import timezone
+
+from . import images
+from .cache import bump_generation
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def generate_image_variants(model_label, pk, field_name, force=False):
+    """
+    Bring ``field_name`` (an ``ImageVariantsField``) of one row in step with
+    its image. The row is only written if the image is still the one the
+    variants were made from; otherwise the newer upload's own task wins.
+    """
+    model = apps.get_model(model_label)
+    field = model._meta.get_field(field_name)
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None or not (force or images.is_stale(instance, field)):
+        return
+
+    image = getattr(instance, field.source)
+    previous = images.variant_names(getattr(instance, field.attname))
+    variants = {}
+    if image.name:
+        try:
+            variants = images.generate(image.storage, image.name)
+        except (images.UnsafeImage, OSError, ValueError) as exc:
+            # Recorded so the broken upload is not retried on every save.
+            logger.warning('No variants for %s %s.%s: %s', model_label, pk, field.source, exc)
+            variants = {'source': image.name, 'error': str(exc)}
+
+    changes = {field.attname: variants}
+    if any(f.name == 'updated_at' for f in model._meta.concrete_fields):
+        # Lets conditional GETs and keyset pages see the new variants.
+        changes['updated_at'] = timezone.now()
+    if image.name:
+        unchanged = Q(**{field.source: image.name})
+    else:
+        unchanged = Q(**{field.source: ''}) | Q(**{'%s__isnull' % field.source: True})
+    updated = model._default_manager.filter(unchanged, pk=pk).update(**changes)
+
+    if updated:
+        images.delete_variants(image.storage, set(previous) - set(images.variant_names(variants)))
+        bump_generation(model._meta.label_lower)
+    else:
+        images.delete_variants(image.storage, images.variant_names(variants))
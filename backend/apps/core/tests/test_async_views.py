@@ -0,0 +1,100 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.async_views import async_read_view
+from apps.forum.models import ForumCategory, ForumPost, ForumReply
+from apps.forum.views import ForumPostListView
+from apps.news.models import News, NewsAttachment
+from apps.news.views import NewsDetailView, NewsListView
+
+User = get_user_model()
+
+
+class AsyncReadViewTests(TestCase):
+    """The async views must answer exactly like their sync counterparts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        cls.public = News.objects.create(title='Public', content='...', author=cls.member, is_public=True)
+        cls.private = News.objects.create(title='Private', content='...', author=cls.member, is_public=False)
+        NewsAttachment.objects.create(news=cls.public, file='news/attachments/a.pdf', filename='a.pdf')
+        category = ForumCategory.objects.create(name='General')
+        post = ForumPost.objects.create(title='Hello', content='...', category=category, author=cls.member)
+        ForumReply.objects.create(post=post, author=cls.member, content='Hi')
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.token = str(RefreshToken.for_user(self.member).access_token)
+
+    def auth(self):
+        return {'HTTP_AUTHORIZATION': 'Bearer %s' % self.token}
+
+    async def sync_get(self, path, **extra):
+        await cache.aclear()
+        return await sync_to_async(APIClient().get)(path, **extra)
+
+    async def async_get(self, view_class, path, kwargs=None, method='get', **extra):
+        request = getattr(self.factory, method)(path, **extra)
+        return await async_read_view(view_class)(request, **(kwargs or {}))
+
+    async def test_list_matches_sync_view(self):
+        for extra in ({}, self.auth()):
+            with self.subTest(authenticated=bool(extra)):
+                expected = await self.sync_get('/api/news/', **extra)
+                response = await self.async_get(NewsListView, '/api/news/', **extra)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), expected.json())
+                self.assertEqual(response['ETag'], expected['ETag'])
+
+        titles = [item['title'] for item in json.loads(response.content)]
+        self.assertEqual(sorted(titles), ['Private', 'Public'])
+
+    async def test_detail_and_not_found(self):
+        path = '/api/news/%s/' % self.public.pk
+        expected = await self.sync_get(path)
+        response = await self.async_get(NewsDetailView, path, {'pk': self.public.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), expected.json())
+        self.assertEqual(len(json.loads(response.content)['attachments']), 1)
+
+        # Guests can't see unpublished news
+        path = '/api/news/%s/' % self.private.pk
+        response = await self.async_get(NewsDetailView, path, {'pk': self.private.pk})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_paginated_list(self):
+        expected = await self.sync_get('/api/forum/posts/?page_size=1', **self.auth())
+        response = await self.async_get(ForumPostListView, '/api/forum/posts/?page_size=1', **self.auth())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), expected.json())
+        self.assertEqual(json.loads(response.content)['results'][0]['reply_count'], 1)
+
+    async def test_not_modified(self):
+        response = await self.async_get(NewsListView, '/api/news/', **self.auth())
+        response = await self.async_get(
+            NewsListView, '/api/news/', HTTP_IF_NONE_MATCH=response['ETag'], **self.auth()
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_rejects_invalid_token_and_writes(self):
+        response = await self.async_get(
+            ForumPostListView, '/api/forum/posts/', HTTP_AUTHORIZATION='Bearer not-a-token'
+        )
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_get(ForumPostListView, '/api/forum/posts/')
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_get(NewsListView, '/api/news/', method='post', **self.auth())
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,99 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.news.models import News
+from apps.tickets.models import Ticket, TicketCategory
+
+User = get_user_model()
+
+DASHBOARD = ['/api/users/profile/', '/api/news/', '/api/tickets/?fields=id,title', '/api/payments/']
+
+
+def make_data():
+    member = User.objects.create_user(
+        username='member@test.com', email='member@test.com', password='pass12345',
+        full_name='Member', role='member',
+    )
+    News.objects.create(title='Welcome', content='...', author=member, is_public=True)
+    category = TicketCategory.objects.create(name='Plumbing')
+    Ticket.objects.create(title='Leak', description='...', category=category, submitted_by=member)
+    return member
+
+
+def client_for(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION='Bearer %s' % RefreshToken.for_user(user).access_token)
+    return client
+
+
+class BatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = make_data()
+
+    def setUp(self):
+        cache.clear()
+        self.client = client_for(self.member)
+
+    def batch(self, requests, status_code=200, **extra):
+        response = self.client.post('/api/batch/', dict(extra, requests=requests), format='json')
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def test_responses_match_separate_requests(self):
+        with CaptureQueriesContext(connection) as queries:
+            responses = self.batch(DASHBOARD)['responses']
+        # The user is looked up once for the whole batch.
+        lookups = [query for query in queries if 'FROM "users_user" WHERE "users_user"."id" =' in query['sql']]
+        self.assertEqual(len(lookups), 1)
+
+        self.assertEqual([entry['path'] for entry in responses], DASHBOARD)
+        for path, entry in zip(DASHBOARD, responses):
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(entry['status'], response.status_code)
+                self.assertEqual(entry['body'], response.json())
+
+    def test_conditional_requests(self):
+        etag = self.batch(['/api/news/'])['responses'][0]['headers']['ETag']
+        entry = self.batch([{'path': '/api/news/', 'headers': {'If-None-Match': etag}}])['responses'][0]
+        self.assertEqual((entry['status'], entry['body']), (304, None))
+
+    def test_errors_stay_in_their_entry(self):
+        responses = self.batch(['/api/nowhere/', '/api/news/00000000-0000-0000-0000-000000000000/', '/api/news/'])
+        self.assertEqual([entry['status'] for entry in responses['responses']], [404, 404, 200])
+
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_limits(self):
+        self.assertIn('at most 2', self.batch(DASHBOARD, 400)['error'])
+        self.batch([], 400)
+        self.batch(['/admin/'], 400)
+        self.batch([{'path': '/api/news/', 'headers': {'Authorization': 'Bearer x'}}], 400)
+        self.assertEqual(self.client.get('/api/batch/').status_code, 405)
+        self.assertEqual(APIClient().post('/api/batch/', {'requests': ['/api/news/']}, format='json').status_code, 401)
+
+    def test_timeout(self):
+        # The deadline passes after the first request.
+        with mock.patch('apps.core.batch.time.monotonic', side_effect=[0, 0, 100]):
+            responses = self.batch(['/api/news/', '/api/tickets/'])['responses']
+        self.assertEqual([entry['status'] for entry in responses], [200, 504])
+
+
+class ConcurrentBatchTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.member = make_data()
+
+    def test_concurrent_batch_matches_sequential(self):
+        client = client_for(self.member)
+        sequential = client.post('/api/batch/', {'requests': DASHBOARD}, format='json').json()
+        concurrent = client.post('/api/batch/', {'requests': DASHBOARD, 'concurrent': True}, format='json').json()
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual({entry['status'] for entry in concurrent['responses']}, {200})
@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.cms.models import BoardMember, ContactInfo, Page
+from apps.news.models import News
+
+User = get_user_model()
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=60)
+class PublicCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com',
+            password='pass12345', full_name='Admin', role='admin',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        News.objects.create(title='Pool opens', content='...', author=self.admin, is_public=True)
+
+    def test_guest_responses_are_cached(self):
+        first = self.client.get('/api/news/')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/news/')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.json(), first.json())
+
+    def test_query_string_is_part_of_the_key(self):
+        self.client.get('/api/news/')
+        response = self.client.get('/api/news/?is_featured=true')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json(), [])
+
+    def test_save_and_delete_invalidate(self):
+        self.client.get('/api/news/')
+        news = News.objects.create(title='Gate code', content='...', author=self.admin, is_public=True)
+        response = self.client.get('/api/news/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()), 2)
+
+        news.delete()
+        response = self.client.get('/api/news/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()), 1)
+
+    def test_related_model_invalidates(self):
+        self.client.get('/api/news/')
+        self.admin.full_name = 'Board Admin'
+        self.admin.save()
+        response = self.client.get('/api/news/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['author_name'], 'Board Admin')
+
+    def test_unrelated_model_does_not_invalidate(self):
+        self.client.get('/api/cms/board/')
+        ContactInfo.objects.create(name='Security', phone='555-0100')
+        self.assertEqual(self.client.get('/api/cms/board/')['X-Cache'], 'HIT')
+        BoardMember.objects.create(name='Pat', position='Treasurer')
+        self.assertEqual(self.client.get('/api/cms/board/')['X-Cache'], 'MISS')
+
+    def test_detail_and_not_found(self):
+        Page.objects.create(slug='rules', title='Rules', content='...')
+        self.assertEqual(self.client.get('/api/cms/pages/rules/')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/api/cms/pages/rules/')['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get('/api/cms/pages/missing/').status_code, 404)
+        self.assertEqual(self.client.get('/api/cms/pages/missing/').status_code, 404)
+
+    def test_authenticated_members_bypass_the_cache(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/news/')
+        self.assertNotIn('X-Cache', response)
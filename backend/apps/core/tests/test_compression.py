@@ -0,0 +1,87 @@
+import gzip
+import json
+
+from django.http import FileResponse, HttpResponse, JsonResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core import compression
+from apps.core.middleware import CompressionMiddleware
+
+BODY = {'results': [{'id': n, 'title': 'Pool maintenance on Saturday', 'content': 'Lorem ipsum ' * 10}
+                    for n in range(50)]}
+
+
+class NegotiationTests(SimpleTestCase):
+    codings = {'zstd': None, 'br': None, 'gzip': None}
+
+    def test_negotiate(self):
+        cases = [
+            ('', None),
+            ('identity', None),
+            ('gzip', 'gzip'),
+            ('gzip, deflate, br', 'br'),
+            ('gzip, deflate, br, zstd', 'zstd'),
+            ('br;q=0.5, gzip', 'gzip'),
+            ('zstd;q=0, br;q=0', None),
+            ('*', 'zstd'),
+            ('*;q=0.1, gzip;q=0.5', 'gzip'),
+            ('GZIP;q=bogus, br', 'br'),
+        ]
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(compression.negotiate(header, self.codings), expected)
+
+    def test_gzip_always_available(self):
+        self.assertEqual(compression.negotiate('gzip, br, zstd'), list(compression.CODINGS)[0])
+        self.assertIn('gzip', compression.CODINGS)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        compression.reset_stats()
+        self.factory = RequestFactory()
+
+    def process(self, response, accept='gzip'):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(self.factory.get('/', HTTP_ACCEPT_ENCODING=accept))
+
+    def test_compresses_json(self):
+        original = JsonResponse(BODY)
+        original['ETag'] = '"abc"'
+        size = len(original.content)
+
+        response = self.process(original)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(json.loads(gzip.decompress(response.content)), BODY)
+
+        stats = compression.compression_stats()['gzip']
+        self.assertEqual(stats['responses'], 1)
+        self.assertEqual(stats['bytes_in'], size)
+        self.assertGreater(stats['ratio'], 5)
+
+    def test_skipped_responses(self):
+        small = JsonResponse({'ok': True})
+        self.assertFalse(self.process(small).has_header('Content-Encoding'))
+
+        image = HttpResponse(b'\x89PNG' + b'0' * 5000, content_type='image/png')
+        self.assertFalse(self.process(image).has_header('Content-Encoding'))
+
+        streaming = FileResponse(iter([b'0' * 5000]), content_type='application/json')
+        self.assertFalse(self.process(streaming).has_header('Content-Encoding'))
+
+        encoded = JsonResponse(BODY)
+        encoded['Content-Encoding'] = 'br'
+        self.assertEqual(self.process(encoded)['Content-Encoding'], 'br')
+
+        plain = self.process(JsonResponse(BODY), accept='identity')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertEqual(plain['Vary'], 'Accept-Encoding')
+        self.assertEqual(compression.compression_stats(), {})
+
+    @override_settings(COMPRESSION_ENABLED=False)
+    def test_disabled(self):
+        self.assertFalse(self.process(JsonResponse(BODY)).has_header('Content-Encoding'))
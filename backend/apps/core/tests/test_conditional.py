@@ -0,0 +1,101 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.news.models import News
+from apps.tickets.models import Ticket, TicketCategory, TicketComment
+
+User = get_user_model()
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        cls.category = TicketCategory.objects.create(name='Plumbing')
+        cls.ticket = Ticket.objects.create(
+            title='Leak', description='...', category=cls.category, submitted_by=cls.member,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def test_list_not_modified(self):
+        response = self.client.get('/api/tickets/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tickets/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_list_etag_tracks_rows_and_related_rows(self):
+        etag = self.client.get('/api/tickets/')['ETag']
+
+        TicketComment.objects.create(ticket=self.ticket, author=self.member, content='Any update?')
+        response = self.client.get('/api/tickets/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        other = Ticket.objects.create(title='Noise', description='...', category=self.category, submitted_by=self.member)
+        other.delete()
+        self.assertEqual(self.client.get('/api/tickets/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Ticket.objects.filter(pk=self.ticket.pk).delete()
+        self.assertEqual(self.client.get('/api/tickets/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_depends_on_query_string(self):
+        etag = self.client.get('/api/tickets/')['ETag']
+        response = self.client.get('/api/tickets/?status=open', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_last_modified(self):
+        url = '/api/tickets/%s/' % self.ticket.pk
+        response = self.client.get(url)
+        last_modified = response['Last-Modified']
+
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+        self.ticket.title = 'Big leak'
+        self.ticket.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Big leak')
+
+    def test_missing_detail(self):
+        response = self.client.get('/api/tickets/00000000-0000-0000-0000-000000000000/', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 404)
+
+    def test_keyset_pages_have_no_validators(self):
+        response = self.client.get('/api/tickets/?page_size=10')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=60)
+class CachedConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        author = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com',
+            password='pass12345', full_name='Admin', role='admin',
+        )
+        News.objects.create(title='Pool opens', content='...', author=author, is_public=True)
+
+    def test_cache_hit_answers_from_cached_etag(self):
+        client = APIClient()
+        etag = client.get('/api/news/')['ETag']
+        with self.assertNumQueries(0):
+            response = client.get('/api/news/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['X-Cache'], 'HIT')
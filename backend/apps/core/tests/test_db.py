@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.core.db import check_persistent_connections, connection_stats, reset_stats
+from apps.core.db.backends.postgresql_pool.base import DatabaseWrapper
+from apps.core.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql):
+        if self.connection.broken:
+            raise OSError('server closed the connection unexpectedly')
+        self.connection.queries.append(sql)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.autocommit = True
+        self.rollbacks = 0
+        self.queries = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        self.opened = []
+
+        def connect():
+            self.opened.append(FakeConnection())
+            return self.opened[-1]
+
+        return ConnectionPool(connect, **kwargs)
+
+    def test_reuses_released_connections(self):
+        pool = self.make_pool(max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        self.assertIsNot(pool.acquire(), first)
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(pool.status()['reused'], 1)
+
+    def test_waits_then_times_out_when_exhausted(self):
+        pool = self.make_pool(max_size=1, timeout=0.01)
+        pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        self.assertEqual(pool.status()['timeouts'], 1)
+
+    def test_discards_closed_and_broken_connections(self):
+        pool = self.make_pool(max_size=1, check_after=0)
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.broken = True
+        replacement = pool.acquire()
+        self.assertIsNot(replacement, connection)
+        self.assertTrue(connection.closed)
+
+        replacement.close()
+        pool.release(replacement)
+        self.assertEqual(pool.status()['idle'], 0)
+        self.assertEqual(pool.status()['discarded'], 2)
+
+    def test_health_check_only_after_idle_period(self):
+        pool = self.make_pool(check_after=60)
+        connection = pool.acquire()
+        pool.release(connection)
+        pool.acquire()
+        self.assertEqual(connection.queries, [])
+
+        pool = self.make_pool(check_after=0)
+        connection = pool.acquire()
+        pool.release(connection)
+        pool.acquire()
+        self.assertEqual(connection.queries, ['SELECT 1'])
+
+    def test_rolls_back_open_transaction_on_release(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+        connection.autocommit = False
+        pool.release(connection)
+        self.assertEqual(connection.rollbacks, 1)
+
+    def test_expires_idle_connections(self):
+        pool = self.make_pool(max_idle=0)
+        connection = pool.acquire()
+        pool.release(connection)
+        self.assertIsNot(pool.acquire(), connection)
+
+
+class PooledBackendTests(SimpleTestCase):
+    def test_pool_options_are_not_passed_to_psycopg2(self):
+        wrapper = DatabaseWrapper({
+            'ENGINE': 'apps.core.db.backends.postgresql_pool', 'NAME': 'hoa_db', 'USER': 'hoa', 'PASSWORD': '',
+            'HOST': 'localhost', 'PORT': '', 'OPTIONS': {'pool': {'max_size': 4}}, 'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': False, 'AUTOCOMMIT': True, 'ATOMIC_REQUESTS': False, 'TIME_ZONE': None,
+        })
+        params = wrapper.get_connection_params()
+        self.assertNotIn('pool', params)
+        self.assertEqual(wrapper.settings_dict['OPTIONS'], {'pool': {'max_size': 4}})
+
+    def test_warns_about_per_request_connections(self):
+        databases = {'default': {'ENGINE': 'django.db.backends.postgresql', 'CONN_MAX_AGE': 0}}
+        with mock.patch('apps.core.db.settings', SimpleNamespace(DATABASES=databases)):
+            warnings = check_persistent_connections(None)
+        self.assertEqual([warning.id for warning in warnings], ['core.W001'])
+
+        databases['default']['CONN_MAX_AGE'] = 60
+        with mock.patch('apps.core.db.settings', SimpleNamespace(DATABASES=databases)):
+            self.assertEqual(check_persistent_connections(None), [])
+
+
+class ConnectionStatsTests(TestCase):
+    def test_counts_requests(self):
+        reset_stats()
+        self.client.get('/api/news/')
+        self.client.get('/api/news/')
+        stats = connection_stats()['default']
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['connections_opened'], 0)
+        self.assertEqual(stats['reuse_rate'], 1.0)
@@ -0,0 +1,117 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.core.dynamic_fields import parse_paths
+from apps.events.models import Event, EventRSVP
+from apps.forum.models import ForumCategory, ForumPost, ForumReply
+from apps.tickets.models import Ticket, TicketCategory
+
+User = get_user_model()
+
+
+class DynamicFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member', role='member',
+        )
+        now = timezone.now()
+        for n in range(3):
+            event = Event.objects.create(
+                title='Event %d' % n, description='...', location='Clubhouse', organizer=cls.admin,
+                start_date=now + timedelta(days=n), end_date=now + timedelta(days=n, hours=2),
+            )
+            EventRSVP.objects.create(event=event, user=cls.member, status='attending')
+        category = ForumCategory.objects.create(name='General')
+        post = ForumPost.objects.create(title='Hello', content='...', category=category, author=cls.member)
+        ForumReply.objects.create(post=post, author=cls.admin, content='Hi')
+        cls.post = post
+        cls.ticket = Ticket.objects.create(
+            title='Leak', description='...', category=TicketCategory.objects.create(name='Plumbing'),
+            submitted_by=cls.member,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def get(self, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json(), [query['sql'] for query in queries]
+
+    def test_parse_paths(self):
+        self.assertEqual(parse_paths('id, rsvps.status,rsvps.user,,'), {'id': {}, 'rsvps': {'status': {}, 'user': {}}})
+
+    def test_fields(self):
+        data, queries = self.get('/api/events/?fields=id,title,bogus')
+        self.assertEqual(set(data[0]), {'id', 'title'})
+        # No organizer join and no RSVP prefetch for fields that are not sent
+        # (the ETag query still counts the RSVPs).
+        queries = [sql for sql in queries if 'MAX(' not in sql.upper()]
+        self.assertFalse(any('events_eventrsvp' in sql for sql in queries))
+        self.assertFalse(any('users_user' in sql for sql in queries))
+
+    def test_nested_fields(self):
+        data, queries = self.get('/api/events/?fields=id,rsvps.status')
+        self.assertEqual(set(data[0]), {'id', 'rsvps'})
+        self.assertEqual(data[0]['rsvps'], [{'status': 'attending'}])
+        rsvp_queries = [sql for sql in queries if 'events_eventrsvp' in sql and 'MAX(' not in sql.upper()]
+        self.assertEqual(len(rsvp_queries), 1)
+        self.assertNotIn('users_user', rsvp_queries[0])
+
+    def test_omit(self):
+        full, full_queries = self.get('/api/events/')
+        data, queries = self.get('/api/events/?omit=rsvps,description')
+        self.assertEqual(set(data[0]), set(full[0]) - {'rsvps', 'description'})
+        self.assertLess(len(queries), len(full_queries))
+
+        data, _ = self.get('/api/events/?omit=rsvps.user_name')
+        self.assertEqual(set(data[0]['rsvps'][0]), {'id', 'user', 'status', 'guests', 'created_at'})
+
+    def test_expand(self):
+        _, plain_queries = self.get('/api/events/')
+        data, queries = self.get('/api/events/?expand=organizer')
+        self.assertEqual(data[0]['organizer'], {'id': str(self.admin.pk), 'full_name': 'Admin'})
+        self.assertEqual(len(queries), len(plain_queries))
+
+        data, _ = self.get('/api/tickets/%s/?expand=category&fields=id,category' % self.ticket.pk)
+        self.assertEqual(data, {'id': str(self.ticket.pk), 'category': {
+            'id': str(self.ticket.category.pk), 'name': 'Plumbing', 'description': '',
+            'created_at': data['category']['created_at'],
+        }})
+
+    def test_relation_dependencies(self):
+        # reply_count reads the prefetched replies, so they stay prefetched.
+        data, queries = self.get('/api/forum/posts/%s/?fields=id,reply_count' % self.post.pk)
+        self.assertEqual(data, {'id': str(self.post.pk), 'reply_count': 1})
+        self.assertTrue(any('forum_forumreply' in sql for sql in queries))
+
+    def test_profile(self):
+        data, queries = self.get('/api/users/profile/?omit=household_members,pets,vehicles')
+        self.assertNotIn('pets', data)
+        self.assertEqual(queries, [])
+        data, _ = self.get('/api/users/profile/?fields=id,full_name')
+        self.assertEqual(data, {'id': str(self.member.pk), 'full_name': 'Member'})
+
+    def test_writes_ignore_parameters(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.patch(
+            '/api/events/%s/update/?fields=id' % Event.objects.first().pk, {'title': 'Renamed'}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Renamed')
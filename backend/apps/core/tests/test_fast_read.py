@@ -0,0 +1,101 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.core.fast_read import FastReadMixin, get_reader
+from apps.payments.models import Payment, PaymentType
+from apps.tickets.models import Ticket, TicketCategory, TicketComment
+from apps.users.serializers import PetSerializer
+
+User = get_user_model()
+
+
+class FastReadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member', role='member',
+        )
+        dues = PaymentType.objects.create(name='Dues', amount=Decimal('1500.00'))
+        category = TicketCategory.objects.create(name='Plumbing')
+        for n in range(5):
+            Payment.objects.create(
+                user=cls.member, payment_type=dues, amount=Decimal('1500.5'),
+                status='completed' if n % 2 else 'pending', transaction_id='TX%d' % n,
+            )
+            ticket = Ticket.objects.create(
+                title='Leak %d' % n, description='...', category=category, submitted_by=cls.member,
+                # Every other ticket is unassigned: assigned_to_name is left out.
+                assigned_to=cls.admin if n % 2 else None,
+            )
+            if n % 2:
+                TicketComment.objects.create(ticket=ticket, author=cls.admin, content='On it')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def assertSameAsSerializer(self, path):
+        fast = self.get(path)
+        cache.clear()
+        with mock.patch.object(FastReadMixin, 'get_values_reader', return_value=None):
+            slow = self.get(path)
+        self.assertEqual(fast, slow)
+        return fast
+
+    def test_payments_match_the_serializer(self):
+        data = self.assertSameAsSerializer('/api/payments/')
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[0]['amount'], '1500.50')
+        self.assertSameAsSerializer('/api/payments/?status=completed&fields=id,amount,user_name')
+        self.assertSameAsSerializer('/api/payments/?expand=payment_type,user')
+        self.assertSameAsSerializer('/api/payments/?limit=2&offset=1')
+
+    def test_tickets_match_the_serializer(self):
+        data = self.assertSameAsSerializer('/api/tickets/')
+        self.assertEqual(sum('assigned_to_name' in item for item in data), 2)
+        self.assertEqual(sum(len(item['comments']) for item in data), 2)
+        self.assertSameAsSerializer('/api/tickets/?omit=comments,description')
+        self.assertSameAsSerializer('/api/tickets/?expand=category')
+
+    def test_keyset_pages_match_the_serializer(self):
+        page = self.assertSameAsSerializer('/api/tickets/?page_size=2')
+        self.assertEqual(len(page['results']), 2)
+        second = self.assertSameAsSerializer(page['next'].replace('http://testserver', ''))
+        self.assertEqual(len(second['results']), 2)
+        self.assertFalse({item['id'] for item in page['results']} & {item['id'] for item in second['results']})
+
+    def test_query_count_does_not_grow_with_the_list(self):
+        def count():
+            with CaptureQueriesContext(connection) as queries:
+                self.get('/api/tickets/')
+            return len(queries)
+
+        few = count()
+        category = TicketCategory.objects.get()
+        for n in range(5):
+            ticket = Ticket.objects.create(title='Drip %d' % n, description='...', category=category, submitted_by=self.member)
+            TicketComment.objects.create(ticket=ticket, author=self.admin, content='Noted')
+        self.assertEqual(count(), few)
+
+    def test_unsupported_serializers_fall_back(self):
+        # Image fields need the storage to build their URLs.
+        self.assertIsNone(get_reader(PetSerializer()))
+        self.assertEqual(self.get('/api/users/pets/'), [])
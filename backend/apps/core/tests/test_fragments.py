@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.events.models import Event, EventRSVP
+from apps.events.serializers import EventSerializer
+
+User = get_user_model()
+
+
+@override_settings(FRAGMENT_CACHE_TIMEOUT=60)
+class FragmentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member', role='member',
+        )
+        now = timezone.now()
+        cls.events = [
+            Event.objects.create(
+                title='Event %d' % n, description='...', location='Clubhouse', organizer=cls.admin,
+                start_date=now + timedelta(days=n), end_date=now + timedelta(days=n, hours=2),
+            )
+            for n in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def get(self, path='/api/events/'):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_hits_skip_serialization(self):
+        first = self.get()
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as get_many, \
+                mock.patch.object(serializers.Serializer, 'to_representation', side_effect=AssertionError):
+            second = self.get()
+        self.assertEqual(second, first)
+        # The fragments of the whole list in one call (the other looks up
+        # the users.User generation).
+        fragment_calls = [call for call in get_many.call_args_list if call.args[0][0].startswith('fragment:')]
+        self.assertEqual(len(fragment_calls), 1)
+        self.assertEqual(len(fragment_calls[0].args[0]), 3)
+
+    def test_only_changed_objects_are_serialized_again(self):
+        self.get()
+        event = self.events[0]
+        event.title = 'Renamed'
+        event.save()
+        with mock.patch.object(
+                EventSerializer, 'to_representation', autospec=True,
+                side_effect=EventSerializer.to_representation) as to_representation:
+            data = self.get()
+        self.assertEqual(to_representation.call_count, 1)
+        self.assertEqual({item['title'] for item in data}, {'Renamed', 'Event 1', 'Event 2'})
+
+    def test_nested_rows_touch_the_parent(self):
+        self.get()
+        before = Event.objects.get(pk=self.events[1].pk).updated_at
+        EventRSVP.objects.create(event=self.events[1], user=self.member, status='attending')
+        self.assertGreater(Event.objects.get(pk=self.events[1].pk).updated_at, before)
+
+        data = {item['id']: item for item in self.get()}
+        self.assertEqual(data[str(self.events[1].pk)]['rsvps'][0]['user_name'], 'Member')
+
+    def test_related_models_are_part_of_the_key(self):
+        self.get()
+        self.admin.full_name = 'Board Admin'
+        self.admin.save()
+        self.assertEqual({item['organizer_name'] for item in self.get()}, {'Board Admin'})
+
+    def test_roles_and_fieldsets_are_kept_apart(self):
+        self.get()
+        self.assertEqual(set(self.get('/api/events/?fields=id,title')[0]), {'id', 'title'})
+
+        serializer = EventSerializer(context={'request': mock.Mock(
+            method='GET', user=self.member, query_params={}, build_absolute_uri=lambda path: 'http://testserver/',
+        )})
+        key = serializer.get_fragment_key(self.events[0])
+        serializer = EventSerializer(context={'request': mock.Mock(
+            method='GET', user=self.admin, query_params={}, build_absolute_uri=lambda path: 'http://testserver/',
+        )})
+        self.assertNotEqual(serializer.get_fragment_key(self.events[0]), key)
+        self.assertIn(':member:', key)
+
+    def test_writes_are_not_cached(self):
+        self.client.force_authenticate(self.admin)
+        with mock.patch.object(cache, 'set') as cache_set:
+            response = self.client.patch(
+                '/api/events/%s/update/' % self.events[0].pk, {'title': 'Renamed'}, format='json',
+            )
+        self.assertEqual(response.json()['title'], 'Renamed')
+        self.assertFalse(any(call.args[0].startswith('fragment:') for call in cache_set.call_args_list))
+
+    @override_settings(FRAGMENT_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.get()
+        self.assertFalse(any(key.startswith('fragment:') for key in _cache_keys()))
+
+
+def _cache_keys():
+    # LocMemCache keys are ':<version>:<key>'
+    return [key.split(':', 2)[2] for key in getattr(cache, '_cache', {})]
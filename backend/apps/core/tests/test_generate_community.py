@@ -0,0 +1,42 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from apps.payments.models import Payment
+from apps.polls.models import PollVote
+from apps.tickets.models import Ticket, TicketComment
+
+User = get_user_model()
+
+
+class GenerateCommunityTests(TestCase):
+    def generate(self, **options):
+        call_command('generate_community', scale=0.001, stdout=StringIO(), **options)
+
+    def test_generates_a_small_community(self):
+        self.generate(admins=2000, polls=2000)
+
+        self.assertEqual(User.objects.filter(role='member').count(), 20)
+        self.assertEqual(User.objects.filter(role='admin').count(), 2)
+        self.assertEqual(Payment.objects.count(), 500)
+        self.assertEqual(Ticket.objects.count(), 100)
+        self.assertTrue(TicketComment.objects.exists())
+        self.assertTrue(PollVote.objects.exists())
+
+        # One shared hash, and it is a working password.
+        self.assertEqual(User.objects.values('password').distinct().count(), 1)
+        self.assertTrue(User.objects.first().check_password('password123'))
+
+        # Timestamps are spread out rather than all "now".
+        self.assertGreater(Payment.objects.values('created_at').distinct().count(), 1)
+        resident = User.objects.filter(role='member').order_by('email').first()
+        self.assertTrue(resident.block and resident.lot)
+
+    def test_refuses_to_reuse_a_domain(self):
+        self.generate()
+        with self.assertRaises(CommandError):
+            self.generate()
+        self.generate(domain='second.test')
+        self.assertEqual(User.objects.filter(email__endswith='@second.test', role='member').count(), 20)
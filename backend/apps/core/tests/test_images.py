@@ -0,0 +1,146 @@
+import io
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.core import images
+from apps.users.models import Pet
+
+User = get_user_model()
+
+
+def jpeg(size=(2000, 1000), orientation=None):
+    """A JPEG with camera EXIF (make, GPS) and optionally an orientation tag."""
+    exif = Image.Exif()
+    exif[0x010F] = 'PhoneMaker'  # Make
+    exif[0x8825] = {1: 'N', 2: (52.0, 22.0, 0.0)}  # GPSInfo
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    Image.new('RGB', size, 'teal').save(buffer, 'JPEG', exif=exif)
+    return SimpleUploadedFile('rex.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+
+@override_settings(
+    IMAGE_VARIANT_WIDTHS=[160, 320, 640, 1280], IMAGE_VARIANT_FORMATS=['webp', 'jpeg'], IMAGE_MAX_PIXELS=50000000,
+)
+class ImageVariantTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.user = User.objects.create_user(
+            username='owner@test.com', email='owner@test.com', password='pass12345',
+            full_name='Owner', role='member',
+        )
+        self.client = APIClient(HTTP_HOST='localhost')
+        self.client.force_authenticate(self.user)
+
+    def upload(self, photo, pet=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            if pet is None:
+                response = self.client.post('/api/users/pets/', {'name': 'Rex', 'pet_type': 'dog', 'photo': photo})
+            else:
+                response = self.client.patch('/api/users/pets/%s/' % pet.pk, {'photo': photo})
+        return response
+
+    def test_upload_generates_oriented_variants_without_exif(self):
+        response = self.upload(jpeg(orientation=6))  # stored sideways, displayed 1000 x 2000
+        self.assertEqual(response.status_code, 201, response.data)
+        # Queued on commit, so the create response itself has none yet.
+        self.assertIsNone(response.data['photo_srcset'])
+
+        pet = Pet.objects.get()
+        variants = pet.photo_variants
+        self.assertEqual(variants['source'], pet.photo.name)
+        self.assertEqual((variants['width'], variants['height']), (1000, 2000))
+        self.assertEqual([v['width'] for v in variants['formats']['webp']], [160, 320, 640])
+        self.assertEqual([v['height'] for v in variants['formats']['jpeg']], [320, 640, 1280])
+
+        for key, pillow_format in (('webp', 'WEBP'), ('jpeg', 'JPEG')):
+            variant = variants['formats'][key][-1]
+            with Image.open(os.path.join(self.media_root, variant['name'])) as image:
+                self.assertEqual(image.format, pillow_format)
+                self.assertEqual(image.size, (640, 1280))
+                self.assertEqual(dict(image.getexif()), {})
+
+    def test_serializer_returns_srcset(self):
+        self.upload(jpeg(size=(800, 600)))
+
+        data = self.client.get('/api/users/pets/').data[0]['photo_srcset']
+        self.assertEqual((data['width'], data['height']), (800, 600))
+        self.assertTrue(data['src'].startswith('http://localhost/media/pet_photos/variants/rex-640w'))
+        self.assertEqual(data['srcset']['webp'].count('http://localhost/media/'), 3)
+        self.assertTrue(data['srcset']['webp'].endswith(' 640w'))
+        self.assertIn('-160w.jpg 160w, ', data['srcset']['jpeg'])
+
+    def test_small_image_gets_one_variant_at_its_own_width(self):
+        self.upload(jpeg(size=(100, 50)))
+        self.assertEqual(
+            [v['width'] for v in Pet.objects.get().photo_variants['formats']['jpeg']], [100],
+        )
+
+    def test_replacing_and_clearing_the_image(self):
+        self.upload(jpeg(size=(400, 300)))
+        pet = Pet.objects.get()
+        old_files = images.variant_names(pet.photo_variants)
+        self.assertEqual(len(old_files), 4)
+
+        self.upload(jpeg(size=(200, 100)), pet=pet)
+        pet.refresh_from_db()
+        self.assertEqual(pet.photo_variants['source'], pet.photo.name)
+        self.assertEqual(pet.photo_variants['width'], 200)
+        for name in old_files:
+            self.assertFalse(os.path.exists(os.path.join(self.media_root, name)))
+
+        new_files = images.variant_names(pet.photo_variants)
+        with self.captureOnCommitCallbacks(execute=True):
+            pet.photo = None
+            pet.save()
+        pet.refresh_from_db()
+        self.assertEqual(pet.photo_variants, {})
+        for name in new_files:
+            self.assertFalse(os.path.exists(os.path.join(self.media_root, name)))
+
+    def test_saving_other_fields_does_not_regenerate(self):
+        self.upload(jpeg(size=(400, 300)))
+        pet = Pet.objects.get()
+        with self.captureOnCommitCallbacks() as callbacks:
+            pet.name = 'Max'
+            pet.save()
+        self.assertEqual(callbacks, [])
+
+    @override_settings(IMAGE_MAX_PIXELS=10000)
+    def test_rejects_decompression_bombs(self):
+        response = self.upload(jpeg(size=(200, 100)))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['photo'][0].code, 'too_many_pixels')
+        self.assertFalse(Pet.objects.exists())
+
+    def test_unreadable_images_are_recorded_not_retried(self):
+        self.upload(jpeg(size=(400, 300)))
+        pet = Pet.objects.get()
+        with override_settings(IMAGE_MAX_PIXELS=1000), self.assertLogs('apps.core.tasks', 'WARNING'):
+            call_command('generate_image_variants', force=True, stdout=StringIO())
+        pet.refresh_from_db()
+        self.assertIn('IMAGE_MAX_PIXELS', pet.photo_variants['error'])
+        self.assertFalse(images.is_stale(pet, Pet._meta.get_field('photo_variants')))
+
+    def test_command_backfills_missing_variants(self):
+        self.upload(jpeg(size=(400, 300)))
+        Pet.objects.update(photo_variants={})
+
+        out = StringIO()
+        call_command('generate_image_variants', model=['users.Pet'], stdout=out)
+        self.assertIn('users.Pet.photo: 1 processed', out.getvalue())
+        self.assertEqual(Pet.objects.get().photo_variants['width'], 400)
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core import compression, metrics
+from apps.news.models import News
+
+User = get_user_model()
+
+
+def value(text, line_start):
+    for line in text.splitlines():
+        if line.startswith(line_start + ' '):
+            return float(line.rsplit(' ', 1)[1])
+    return None
+
+
+@override_settings(METRICS_ROOT='')
+class MetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.registry.reset()
+        compression.reset_stats()
+        self.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        News.objects.create(title='Welcome', content='...', author=self.admin, is_public=True)
+
+    def scrape(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.get('/api/metrics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        return response.content.decode()
+
+    def test_records_requests(self):
+        client = APIClient()
+        for _ in range(2):
+            self.assertEqual(client.get('/api/news/').status_code, 200)
+        client.get('/api/news/00000000-0000-0000-0000-000000000000/')
+        client.get('/no-such-page/')
+
+        text = self.scrape()
+        self.assertEqual(value(text, 'hoa_http_requests_total{method="GET",status="200",view="news-list"}'), 2)
+        self.assertEqual(value(text, 'hoa_http_requests_total{method="GET",status="404",view="news-detail"}'), 1)
+        self.assertEqual(value(text, 'hoa_http_requests_total{method="GET",status="404",view="unresolved"}'), 1)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_count{method="GET",view="news-list"}'), 2)
+        self.assertEqual(
+            value(text, 'hoa_http_request_duration_seconds_bucket{method="GET",view="news-list",le="+Inf"}'), 2,
+        )
+        self.assertEqual(value(text, 'hoa_public_cache_requests_total{result="miss",view="news-list"}'), 1)
+        self.assertEqual(value(text, 'hoa_public_cache_requests_total{result="hit",view="news-list"}'), 1)
+        # Only the cache miss ran queries and the serializer.
+        self.assertGreater(value(text, 'hoa_db_queries_total{view="news-list"}'), 0)
+        self.assertGreater(value(text, 'hoa_serializer_seconds_total{view="news-list"}'), 0)
+        self.assertIn('# TYPE hoa_http_response_size_bytes histogram', text)
+
+    def test_admin_only(self):
+        client = APIClient()
+        self.assertEqual(client.get('/api/metrics/').status_code, 401)
+        member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member', role='member',
+        )
+        client.force_authenticate(member)
+        self.assertEqual(client.get('/api/metrics/').status_code, 403)
+
+    def test_adds_up_worker_files(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(METRICS_ROOT=root):
+            metrics.registry.inc('hoa_http_requests_total', {'view': 'news-list', 'method': 'GET', 'status': '200'})
+            metrics.registry.observe('hoa_http_request_duration_seconds', {'view': 'news-list', 'method': 'GET'}, 0.02)
+            # Another worker's last flush
+            other = metrics.Registry()
+            other.inc('hoa_http_requests_total', {'view': 'news-list', 'method': 'GET', 'status': '200'}, 3)
+            other.observe('hoa_http_request_duration_seconds', {'view': 'news-list', 'method': 'GET'}, 20)
+            with open(os.path.join(root, 'metrics-1-1.json'), 'w') as handle:
+                json.dump(other.snapshot(), handle)
+
+            text = metrics.render(metrics.collect())
+            self.assertEqual(len(os.listdir(root)), 2)
+
+        labels = 'method="GET",view="news-list"'
+        self.assertEqual(value(text, 'hoa_http_requests_total{method="GET",status="200",view="news-list"}'), 4)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_bucket{%s,le="0.01"}' % labels), 0)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_bucket{%s,le="0.025"}' % labels), 1)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_bucket{%s,le="10.0"}' % labels), 1)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_bucket{%s,le="+Inf"}' % labels), 2)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_sum{%s}' % labels), 20.02)
+        self.assertEqual(value(text, 'hoa_http_request_duration_seconds_count{%s}' % labels), 2)
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.core.optimizer import build_plan, optimize_queryset
+from apps.forum.models import ForumPost
+from apps.forum.serializers import ForumPostSerializer
+from apps.polls.models import Poll, PollOption, PollVote
+from apps.tickets.models import Ticket, TicketCategory, TicketComment
+
+User = get_user_model()
+
+
+class OptimizerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        cls.category = TicketCategory.objects.create(name='Plumbing')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def add_tickets(self, count):
+        for n in range(count):
+            ticket = Ticket.objects.create(
+                title='Leak %d' % n, description='...', category=self.category,
+                submitted_by=self.admin, assigned_to=self.admin,
+            )
+            TicketComment.objects.create(ticket=ticket, author=self.admin, content='On it')
+
+    def get(self, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+        # Leave out the ETag aggregate.
+        return response.json(), [query['sql'] for query in queries if 'MAX(' not in query['sql'].upper()]
+
+    def test_list_joins_prefetches_and_defers(self):
+        self.add_tickets(2)
+        data, queries = self.get('/api/tickets/')
+        self.assertEqual(data[0]['category_name'], 'Plumbing')
+        self.assertEqual(data[0]['comments'][0]['author_name'], 'Admin')
+
+        tickets = next(sql for sql in queries if 'FROM "tickets_ticket"' in sql and 'COUNT(' not in sql)
+        self.assertIn('JOIN "tickets_ticketcategory"', tickets)
+        self.assertIn('JOIN "users_user"', tickets)
+        self.assertIn('"tickets_ticket"."description"', tickets)
+        # Only the names of the related rows are read.
+        self.assertNotIn('"tickets_ticketcategory"."description"', tickets)
+        self.assertNotIn('"password"', tickets)
+
+        comments = next(sql for sql in queries if 'FROM "tickets_ticketcomment"' in sql)
+        self.assertIn('JOIN "users_user"', comments)
+        self.assertIn('"tickets_ticketcomment"."ticket_id"', comments)
+        self.assertNotIn('"password"', comments)
+
+    def test_query_count_does_not_grow_with_the_list(self):
+        self.add_tickets(1)
+        _, few = self.get('/api/tickets/')
+        self.add_tickets(5)
+        _, many = self.get('/api/tickets/')
+        self.assertEqual(len(few), len(many))
+
+    def test_sparse_fields_load_only_their_columns(self):
+        self.add_tickets(1)
+        data, queries = self.get('/api/tickets/?fields=id,title')
+        self.assertEqual(set(data[0]), {'id', 'title'})
+        tickets = [sql for sql in queries if 'FROM "tickets_ticket"' in sql and 'COUNT(' not in sql]
+        self.assertEqual(len(tickets), 1)
+        self.assertNotIn('JOIN', tickets[0])
+        self.assertNotIn('"description"', tickets[0])
+        self.assertFalse(any('tickets_ticketcomment' in sql for sql in queries))
+
+    def test_view_prefetch_keeps_its_annotations(self):
+        now = timezone.now()
+        poll = Poll.objects.create(
+            title='Pool hours', description='...', created_by=self.admin,
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1),
+        )
+        yes = PollOption.objects.create(poll=poll, text='Yes', order=0)
+        PollOption.objects.create(poll=poll, text='No', order=1)
+        PollVote.objects.create(poll=poll, option=yes, user=self.admin)
+
+        data, _ = self.get('/api/polls/%s/' % poll.pk)
+        self.assertEqual({o['text']: o['vote_count'] for o in data['options']}, {'Yes': 1, 'No': 0})
+        self.assertEqual((data['total_votes'], data['user_voted']), (1, True))
+
+    def test_relation_dependencies(self):
+        plan = build_plan(ForumPostSerializer())
+        self.assertEqual(set(plan.select), {'category', 'author'})
+        self.assertEqual(plan.prefetch['replies'].select['author'].columns, {'full_name'})
+        self.assertIn('post', plan.prefetch['replies'].columns)
+
+        # reply_count only counts the prefetched replies.
+        plan = build_plan(_ReplyCountSerializer())
+        self.assertEqual(plan.prefetch['replies'].columns, {'post'})
+        self.assertFalse(plan.complete)
+
+    def test_opaque_fields_load_every_column_of_their_model(self):
+        queryset = optimize_queryset(ForumPost.objects.all(), build_plan(_OpaqueSerializer()))
+        self.assertEqual(queryset.query.select_related, {'author': {}})
+        loaded, defer = queryset.query.deferred_loading
+        self.assertFalse(defer)
+        self.assertLessEqual({field.name for field in ForumPost._meta.concrete_fields}, loaded)
+        self.assertEqual({name for name in loaded if name.startswith('author__')}, {'author__id', 'author__full_name'})
+
+
+class _ReplyCountSerializer(ForumPostSerializer):
+    class Meta(ForumPostSerializer.Meta):
+        fields = ['id', 'reply_count']
+
+
+class _OpaqueSerializer(serializers.ModelSerializer):
+    summary = serializers.SerializerMethodField()
+    author_name = serializers.CharField(source='author.full_name')
+
+    class Meta:
+        model = ForumPost
+        fields = ['id', 'summary', 'author_name']
+
+    def get_summary(self, obj):
+        return obj.title
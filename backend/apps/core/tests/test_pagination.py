@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.forum.models import ForumCategory, ForumPost
+from apps.tickets.models import TicketCategory
+
+User = get_user_model()
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        category = ForumCategory.objects.create(name='General')
+        now = timezone.now()
+        posts = []
+        for index in range(8):
+            post = ForumPost.objects.create(
+                title='Post %d' % index, content='...', category=category,
+                author=cls.member, is_pinned=index in (2, 5),
+            )
+            posts.append(post)
+        # Give some posts identical timestamps so ties are broken by the pk.
+        for index, post in enumerate(posts):
+            ForumPost.objects.filter(pk=post.pk).update(created_at=now - timedelta(minutes=index // 2))
+        cls.expected = [str(pk) for pk in ForumPost.objects.order_by('-is_pinned', '-created_at', 'id').values_list('id', flat=True)]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get('/api/forum/posts/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 8)
+
+    def test_walks_forward_and_back(self):
+        seen = []
+        pages = []
+        url = '/api/forum/posts/?page_size=3'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['previous'])
+
+        response = self.client.get(pages[-1]['previous'])
+        self.assertEqual([item['id'] for item in response.data['results']], self.expected[3:6])
+        response = self.client.get(response.data['previous'])
+        self.assertEqual([item['id'] for item in response.data['results']], self.expected[:3])
+        self.assertIsNone(response.data['previous'])
+
+    def test_no_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/forum/posts/?page_size=3')
+        counts = [
+            query['sql'] for query in queries.captured_queries
+            if 'COUNT(' in query['sql'].upper() and 'FROM "forum_forumpost"' in query['sql']
+        ]
+        self.assertEqual(counts, [])
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/forum/posts/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+
+class OffsetPaginationTests(TestCase):
+    def test_limit_offset_on_small_lists(self):
+        member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        for index in range(4):
+            TicketCategory.objects.create(name='Category %d' % index)
+        client = APIClient()
+        client.force_authenticate(member)
+
+        self.assertEqual(len(client.get('/api/tickets/categories/').data), 4)
+        response = client.get('/api/tickets/categories/?limit=3')
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(len(response.data['results']), 3)
@@ -0,0 +1,82 @@
+import os
+import pstats
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.tickets.models import Ticket, TicketCategory
+
+User = get_user_model()
+
+
+class ProfilingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com',
+            password='pass12345', full_name='Admin', role='admin',
+        )
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        category = TicketCategory.objects.create(name='Plumbing')
+        for index in range(3):
+            Ticket.objects.create(title='Leak %d' % index, description='...', category=category, submitted_by=cls.member)
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        override = override_settings(PROFILING_ROOT=self.root.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def client_for(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer %s' % RefreshToken.for_user(user).access_token)
+        return client
+
+    def test_admin_request_is_profiled(self):
+        client = self.client_for(self.admin)
+        response = client.get('/api/tickets/', HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, 200)
+        profile_id = response['X-Profile-Id']
+        self.assertIn('sql;dur=', response['Server-Timing'])
+        pstats.Stats(os.path.join(self.root.name, profile_id + '.prof'))
+
+        summary = client.get('/api/profiles/%s/' % profile_id).data
+        self.assertEqual(summary['path'], '/api/tickets/')
+        self.assertEqual(summary['user'], 'admin@test.com')
+        self.assertEqual(summary['sql_count'], len(summary['queries']))
+        self.assertTrue(any('tickets_ticket' in query['sql'] for query in summary['queries']))
+        self.assertTrue(all(query['origin'] for query in summary['queries']))
+        self.assertGreater(summary['serializer_ms'], 0)
+        self.assertGreater(summary['render_ms'], 0)
+
+        listing = client.get('/api/profiles/').data
+        self.assertEqual([entry['id'] for entry in listing], [profile_id])
+        download = client.get('/api/profiles/%s/download/' % profile_id)
+        self.assertEqual(download.status_code, 200)
+
+    def test_query_parameter_trigger(self):
+        response = self.client_for(self.admin).get('/api/tickets/?_profile=1')
+        self.assertIn('X-Profile-Id', response)
+
+    def test_members_are_not_profiled(self):
+        client = self.client_for(self.member)
+        response = client.get('/api/tickets/', HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertEqual(os.listdir(self.root.name), [])
+        self.assertEqual(client.get('/api/profiles/').status_code, 403)
+
+    def test_unrequested_admin_request_is_not_profiled(self):
+        response = self.client_for(self.admin).get('/api/tickets/')
+        self.assertNotIn('X-Profile-Id', response)
+
+    def test_invalid_profile_id(self):
+        response = self.client_for(self.admin).get('/api/profiles/..%2Fsettings/download/')
+        self.assertEqual(response.status_code, 404)
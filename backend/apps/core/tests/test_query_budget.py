@@ -0,0 +1,187 @@
+from datetime import timedelta
+from decimal import Decimal
+from itertools import count
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from apps.bookings.models import Booking, Facility
+from apps.cms.models import BoardMember, ContactInfo, Page
+from apps.documents.models import Document, DocumentCategory
+from apps.events.models import Event, EventRSVP
+from apps.forum.models import ForumCategory, ForumPost, ForumReply
+from apps.news.models import News, NewsAttachment
+from apps.payments.models import Payment, PaymentType
+from apps.polls.models import Poll, PollOption, PollVote
+from apps.tickets.models import Ticket, TicketCategory, TicketComment
+from apps.users.models import HouseholdMember, Pet, ProfileChangeLog, Vehicle
+
+User = get_user_model()
+
+APPS = ['core', 'users', 'news', 'events', 'documents', 'bookings', 'payments', 'tickets', 'forum', 'polls', 'cms']
+
+sequence = count()
+
+
+def app_endpoints():
+    """
+    Yield ``(route, callback)`` for every URL pattern of the apps above, with
+    the route relative to the site root.
+    """
+    for pattern in get_resolver().url_patterns:
+        if not isinstance(pattern, URLResolver):
+            continue
+        module = getattr(pattern.urlconf_module, '__name__', '')
+        if module not in ['apps.%s.urls' % app for app in APPS]:
+            continue
+        for child in pattern.url_patterns:
+            if isinstance(child, URLPattern):
+                yield '/' + str(pattern.pattern) + str(child.pattern), child.callback
+
+
+def budget_for(callback):
+    view_class = getattr(callback, 'view_class', None)
+    if view_class is not None and hasattr(view_class, 'query_budget'):
+        return view_class.query_budget
+    return getattr(callback, 'query_budget', None)
+
+
+def make_user(role='member'):
+    n = next(sequence)
+    email = '%s%d@test.com' % (role, n)
+    return User.objects.create_user(
+        username=email, email=email, password='pass12345',
+        full_name='%s %d' % (role.title(), n), role=role, block='B%d' % n, lot='L%d' % n,
+    )
+
+
+def seed(users, size):
+    """
+    Add ``size`` rows of every model, each with ``size`` children, spread
+    over ``users`` so every user owns some of each.
+    """
+    now = timezone.now()
+    for index in range(size):
+        n = next(sequence)
+        owner = users[index % len(users)]
+
+        for user in users:
+            HouseholdMember.objects.create(user=user, full_name='Member %d' % n, relationship='child')
+            Pet.objects.create(user=user, name='Pet %d' % n, pet_type='dog')
+            Vehicle.objects.create(
+                user=user, license_plate='P%d' % n, make='Make', model='Model', year=2020, color='Red',
+            )
+            ProfileChangeLog.objects.create(user=user, change_type='update', field_name='phone')
+
+        news = News.objects.create(title='News %d' % n, content='...', author=owner)
+        event = Event.objects.create(
+            title='Event %d' % n, description='...', location='Hall', organizer=owner,
+            start_date=now + timedelta(days=1), end_date=now + timedelta(days=1, hours=2),
+        )
+        document_category = DocumentCategory.objects.create(name='Category %d' % n)
+        Document.objects.create(
+            title='Document %d' % n, file='documents/%d.pdf' % n,
+            category=document_category, uploaded_by=owner,
+        )
+        facility = Facility.objects.create(name='Facility %d' % n, description='...', capacity=10)
+        payment_type = PaymentType.objects.create(name='Dues %d' % n, amount=Decimal('10.00'))
+        ticket_category = TicketCategory.objects.create(name='Category %d' % n)
+        ticket = Ticket.objects.create(
+            title='Ticket %d' % n, description='...', category=ticket_category, submitted_by=owner,
+        )
+        forum_category = ForumCategory.objects.create(name='Category %d' % n)
+        post = ForumPost.objects.create(title='Post %d' % n, content='...', category=forum_category, author=owner)
+        poll = Poll.objects.create(
+            title='Poll %d' % n, description='...', created_by=owner,
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1),
+        )
+        Page.objects.create(slug='page-%d' % n, title='Page %d' % n, content='...')
+        ContactInfo.objects.create(name='Contact %d' % n, phone='555-%04d' % n)
+        BoardMember.objects.create(name='Board %d' % n, position='Member')
+
+        for child in range(size):
+            user = users[child % len(users)]
+            NewsAttachment.objects.create(news=news, file='news/attachments/%d.pdf' % child, filename='%d.pdf' % child)
+            EventRSVP.objects.get_or_create(event=event, user=user, defaults={'status': 'attending'})
+            Booking.objects.create(
+                facility=facility, user=user, purpose='Party', expected_guests=5,
+                start_datetime=now + timedelta(days=child + 1), end_datetime=now + timedelta(days=child + 1, hours=2),
+            )
+            Payment.objects.create(user=user, payment_type=payment_type, amount=Decimal('10.00'))
+            TicketComment.objects.create(ticket=ticket, author=user, content='...')
+            ForumReply.objects.create(post=post, author=user, content='...')
+            option = PollOption.objects.create(poll=poll, text='Option %d' % child)
+            if not PollVote.objects.filter(poll=poll, user=user).exists():
+                PollVote.objects.create(poll=poll, option=option, user=user)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Every GET endpoint must declare a ``query_budget`` (the ``query_budget``
+    decorator for function views) and stay within it no matter how many rows
+    exist: the query count with ten times the data must be identical.
+    """
+
+    def setUp(self):
+        self.admin = make_user('admin')
+        self.member = make_user('member')
+        self.users = [self.admin, self.member, make_user('member')]
+
+    def sample_path(self, route, callback, user):
+        """Fill in ``<uuid:pk>`` / ``<slug:slug>`` with an object the user can see."""
+        if '<' not in route:
+            return route
+        view_class = getattr(callback, 'view_class', None)
+        if view_class is None or not hasattr(view_class, 'get_queryset'):
+            return None
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=user)
+        view = view_class(request=Request(request), kwargs={}, format_kwarg=None)
+        view.request.user = user
+        lookup = view_class.lookup_field
+        obj = view.get_queryset().order_by().first()
+        if obj is None:
+            return None
+        prefix, rest = route.split('<', 1)
+        return prefix + str(getattr(obj, lookup)) + rest.split('>', 1)[1]
+
+    def measure(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        counts = {}
+        for route, callback in app_endpoints():
+            path = self.sample_path(route, callback, user)
+            if path is None:
+                continue
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(path)
+            if response.status_code != 200:
+                continue
+            counts[route] = (len(queries), budget_for(callback))
+        return counts
+
+    def assert_flat_and_within_budget(self, user):
+        seed(self.users, 2)
+        small = self.measure(user)
+        seed(self.users, 8)
+        large = self.measure(user)
+
+        self.assertTrue(small)
+        for route, (queries, budget) in sorted(large.items()):
+            with self.subTest(route=route):
+                self.assertIsNotNone(budget, '%s returns 200 but declares no query_budget' % route)
+                self.assertIn(route, small)
+                self.assertEqual(queries, small[route][0], '%s query count grows with the data' % route)
+                self.assertLessEqual(queries, budget, '%s is over its query budget' % route)
+
+    def test_admin(self):
+        self.assert_flat_and_within_budget(self.admin)
+
+    def test_member(self):
+        self.assert_flat_and_within_budget(self.member)
@@ -0,0 +1,84 @@
+import io
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.bookings.models import Facility
+from apps.bookings.serializers import FacilitySerializer
+from apps.core.parsers import FastJSONParser
+from apps.core.renderers import FastJSONRenderer
+from apps.payments.models import Payment, PaymentType
+from apps.payments.serializers import PaymentSerializer
+
+User = get_user_model()
+
+
+class FastJSONRendererTests(TestCase):
+    def assertSameOutput(self, data, accepted_media_type=None):
+        expected = JSONRenderer().render(data, accepted_media_type)
+        self.assertEqual(FastJSONRenderer().render(data, accepted_media_type), expected)
+
+    def test_python_values(self):
+        now = timezone.now()
+        self.assertSameOutput({
+            'id': uuid.uuid4(),
+            'amount': Decimal('150.00'),
+            'rate': Decimal('12.5'),
+            'utc': now,
+            'utc_whole_second': now.replace(microsecond=0),
+            'manila': now.astimezone(ZoneInfo('Asia/Manila')),
+            'offset': datetime(2024, 3, 1, 9, 30, tzinfo=dt_timezone(timedelta(hours=-5))),
+            'naive': datetime(2024, 3, 1, 9, 30, 15, 120),
+            'date': date(2024, 3, 1),
+            'label': gettext_lazy('Pending'),
+            'text': 'Ñandú — “quotes” \u2028 line \u2029 para \\ "escaped" \x00',
+            'nested': OrderedDict([('b', [1, None, True, False]), ('a', (1, 2))]),
+            'big': 2 ** 70,
+            'empty': {},
+        })
+        self.assertSameOutput({1: 'one', None: 'none'})
+        self.assertSameOutput([{'id': uuid.uuid4()}], 'application/json; indent=4')
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_serializer_output(self):
+        user = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member Ñame', role='member',
+        )
+        payment_type = PaymentType.objects.create(name='Monthly dues', amount=Decimal('150.00'))
+        for amount in ('150.00', '0.10', '99999.99'):
+            Payment.objects.create(user=user, payment_type=payment_type, amount=Decimal(amount))
+        Facility.objects.create(name='Pool', description='...', capacity=40, hourly_rate=Decimal('12.50'))
+
+        self.assertSameOutput(PaymentSerializer(Payment.objects.all(), many=True).data)
+        self.assertSameOutput(FacilitySerializer(Facility.objects.all(), many=True).data)
+
+
+class FastJSONParserTests(TestCase):
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), 'application/json', {})
+
+    def test_same_result_as_stock_parser(self):
+        bodies = [
+            b'{"amount": "150.00", "count": 3, "ratio": 0.5, "ok": true, "none": null}',
+            '{"name": "Ñandú \\u2028"}'.encode(),
+            b'  []  ',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assertEqual(self.parse(FastJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_invalid_json(self):
+        for body in (b'', b'{"a": }', b'[NaN]', b'{"a": 1} x'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(FastJSONParser(), body)
@@ -0,0 +1,117 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.db import routers
+from apps.core.decorators import use_primary
+from apps.core.middleware import ReplicaMiddleware
+from apps.news.models import News
+
+User = get_user_model()
+
+
+def setUpModule():
+    # A second alias on the test database stands in for a replica, the same
+    # way DATABASE_REPLICA_URLS entries mirror "default" under test.
+    default = connections['default'].settings_dict
+    connections.settings['replica'] = dict(default, TEST=dict(default['TEST'], MIRROR='default'))
+
+
+def tearDownModule():
+    connections['replica'].close()
+    del connections['replica']
+    del connections.settings['replica']
+
+
+@override_settings(
+    DATABASE_REPLICAS=['replica'],
+    DATABASE_ROUTERS=['apps.core.db.routers.ReplicaRouter'],
+    REPLICA_PIN_SECONDS=5,
+)
+class ReplicaRoutingTests(TransactionTestCase):
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        self.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        self.other = User.objects.create_user(
+            username='other@test.com', email='other@test.com',
+            password='pass12345', full_name='Other', role='member',
+        )
+        News.objects.create(title='Welcome', content='...', author=self.member, is_public=True)
+
+    def client_for(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer %s' % RefreshToken.for_user(user).access_token)
+        return client
+
+    def get(self, client, path):
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['replica']) as replica:
+            response = client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return len(primary), len(replica)
+
+    def test_reads_go_to_replica(self):
+        primary, replica = self.get(self.client_for(self.member), '/api/news/')
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_user_is_pinned_to_primary_after_a_write(self):
+        client = self.client_for(self.member)
+        response = client.patch('/api/users/profile/basic/', {'full_name': 'Renamed'}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+
+        primary, replica = self.get(client, '/api/users/profile/basic/')
+        self.assertEqual(replica, 0)
+        self.assertGreater(primary, 0)
+
+        # Other users keep reading from the replica
+        primary, replica = self.get(self.client_for(self.other), '/api/news/')
+        self.assertEqual(primary, 0)
+
+        cache.delete(routers.PIN_KEY % self.member.pk)
+        primary, replica = self.get(client, '/api/news/')
+        self.assertEqual(primary, 0)
+
+    def test_use_primary_views(self):
+        @use_primary
+        def view(request):
+            return None
+
+        self.addCleanup(routers.reset_read_alias, routers.set_read_alias(None))
+        middleware = ReplicaMiddleware(lambda request: None)
+        request = RequestFactory().get('/')
+        middleware.process_view(request, view, (), {})
+        self.assertIsNone(routers.get_read_alias())
+
+        middleware.process_view(request, lambda request: None, (), {})
+        self.assertEqual(routers.get_read_alias(), 'replica')
+
+    def test_router(self):
+        router = routers.ReplicaRouter()
+        with routers.read_from('replica'):
+            self.assertEqual(router.db_for_read(News), 'replica')
+            self.assertEqual(router.db_for_write(News), 'default')
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(News), 'default')
+        self.assertEqual(router.db_for_read(News), 'default')
+        self.assertFalse(router.allow_migrate('replica', 'news'))
+        self.assertTrue(router.allow_migrate('default', 'news'))
+
+    def test_batches_read_from_replica_without_pinning(self):
+        client = self.client_for(self.member)
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['replica']) as replica:
+            response = client.post('/api/batch/', {'requests': ['/api/news/']}, format='json')
+        self.assertEqual(response.json()['responses'][0]['status'], 200)
+        self.assertGreater(len(replica), 0)
+        self.assertFalse(any('news_news' in query['sql'] for query in primary))
+        self.assertFalse(routers.is_pinned(self.member.pk))
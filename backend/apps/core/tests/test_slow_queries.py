@@ -0,0 +1,136 @@
+import io
+import json
+import logging
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core.db import slow_queries
+from apps.news.models import News
+from apps.polls.models import Poll, PollOption
+from apps.polls.serializers import PollOptionSerializer
+
+User = get_user_model()
+
+
+class SlowQueryLogTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'logs', 'slow.log')
+        self.handler = slow_queries.SlowQueryFileHandler(self.path, maxBytes=0, backupCount=0)
+        self.handler.setFormatter(slow_queries.JSONLineFormatter())
+        logger = logging.getLogger(slow_queries.__name__)
+        handlers, logger.handlers = logger.handlers, [self.handler]
+        self.addCleanup(self.handler.close)
+        self.addCleanup(setattr, logger, 'handlers', handlers)
+        # Log every statement, until the handler is taken off again.
+        log_everything = override_settings(SLOW_QUERY_THRESHOLD_MS=0.000001, SLOW_QUERY_EXPLAIN=True)
+        log_everything.enable()
+        self.addCleanup(log_everything.disable)
+        self.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass12345',
+            full_name='Admin', role='admin',
+        )
+        News.objects.create(title='Welcome', content='...', author=self.admin, is_public=True)
+        self.reset()
+
+    def reset(self):
+        # The handler opens the file again on its next record.
+        self.handler.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def entries(self):
+        self.handler.flush()
+        return list(slow_queries.read_entries(self.path))
+
+    def test_logs_view_origin_params_and_plan(self):
+        response = APIClient().get('/api/news/')
+        self.assertEqual(response.status_code, 200)
+
+        entries = [entry for entry in self.entries() if 'news_news' in entry['sql']]
+        self.assertTrue(entries)
+        entry = entries[0]
+        self.assertEqual(entry['view'], 'news-list')
+        self.assertTrue(entry['sql'].startswith('SELECT'))
+        self.assertIsInstance(entry['params'], list)
+        self.assertGreater(entry['duration_ms'], 0)
+        self.assertTrue(entry['plan'])
+        self.assertIn('apps/', entry['origin'])
+
+    def test_origin_is_the_innermost_project_frame(self):
+        poll = Poll.objects.create(
+            title='Pool hours', description='...', created_by=self.admin,
+            start_date='2030-01-01T00:00:00Z', end_date='2030-02-01T00:00:00Z',
+        )
+        option = PollOption.objects.create(poll=poll, text='Later', order=1)
+        self.reset()
+
+        PollOptionSerializer(option).data
+
+        origins = [entry['origin'] for entry in self.entries()]
+        self.assertTrue(origins)
+        self.assertTrue(origins[0].startswith('PollOptionSerializer.get_vote_count (apps/polls/serializers.py:'))
+        self.assertIsNone(self.entries()[0]['view'])
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+    def test_disabled(self):
+        User.objects.count()
+        self.assertEqual(self.entries(), [])
+
+    @override_settings(SLOW_QUERY_EXPLAIN=False)
+    def test_without_explain(self):
+        User.objects.count()
+        self.assertEqual([entry['plan'] for entry in self.entries()], [None])
+
+
+class SlowQueryReportTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'slow.log')
+
+    def write(self, path, entries):
+        with open(path, 'w') as handle:
+            for entry in entries:
+                handle.write(json.dumps(entry) + '\n')
+
+    def entry(self, sql, duration_ms, view='poll-list', origin='PollListView.get_queryset (apps/polls/views.py:1)'):
+        return {
+            'time': '2026-01-01T00:00:00+00:00', 'duration_ms': duration_ms, 'alias': 'default',
+            'view': view, 'origin': origin, 'sql': sql, 'params': [1], 'plan': ['SCAN polls_pollvote'],
+        }
+
+    def test_groups_by_statement_and_sorts_by_total_time(self):
+        in_list = 'SELECT * FROM "polls_pollvote" WHERE "option_id" IN (%s, %s)'
+        self.write(self.path + '.1', [self.entry(in_list, 40), self.entry('SELECT 1', 90)])
+        self.write(self.path, [
+            self.entry('SELECT * FROM "polls_pollvote"  WHERE "option_id" IN (%s)', 60, view='poll-detail'),
+            'not json',
+        ])
+        self.assertEqual(slow_queries.log_files(self.path), [self.path + '.1', self.path])
+
+        out = io.StringIO()
+        call_command('slow_queries', log=self.path, json=True, stdout=out)
+        report = json.loads(out.getvalue())
+
+        self.assertEqual([group['sql'] for group in report], [
+            'SELECT * FROM "polls_pollvote" WHERE "option_id" IN (...)', 'SELECT 1',
+        ])
+        self.assertEqual(report[0]['count'], 2)
+        self.assertEqual(report[0]['total_ms'], 100)
+        self.assertEqual(report[0]['mean_ms'], 50)
+        self.assertEqual(report[0]['max_ms'], 60)
+        self.assertEqual(report[0]['views'], {'poll-list': 1, 'poll-detail': 1})
+
+        out = io.StringIO()
+        call_command('slow_queries', log=self.path, view='poll-detail', top=5, stdout=out)
+        self.assertIn('#1  60.0 ms total, 1 calls', out.getvalue())
+        self.assertNotIn('#2', out.getvalue())
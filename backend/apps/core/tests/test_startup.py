@@ -0,0 +1,33 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+BOOT = '''
+import json, os, sys
+os.environ['DJANGO_SETTINGS_MODULE'] = 'hoa_backend.settings'
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps(sorted(name for name in sys.modules if name.split('.')[0] in %r)))
+'''
+
+# Only needed by 2FA setup and the API docs; see benchmarks/startup.py.
+LAZY_MODULES = ('drf_yasg', 'pkg_resources', 'qrcode', 'PIL', 'pyotp')
+
+
+class StartupTests(SimpleTestCase):
+    def test_heavy_dependencies_are_not_imported_at_boot(self):
+        output = subprocess.check_output(
+            [sys.executable, '-c', BOOT % (LAZY_MODULES,)], cwd=settings.BASE_DIR,
+        )
+        self.assertEqual(json.loads(output.decode().strip().splitlines()[-1]), [])
+
+    @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+    def test_api_docs_load_on_first_request(self):
+        response = self.client.get('/swagger/', HTTP_HOST='localhost')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'drf-yasg/swagger-ui-init.js')
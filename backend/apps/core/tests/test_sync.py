@@ -0,0 +1,151 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.core.models import Tombstone
+from apps.core.sync import RESOURCES, _changed_rows, prune_tombstones
+from apps.news.models import News
+from apps.payments.models import Payment, PaymentType
+from apps.polls.models import Poll, PollOption, PollVote
+from apps.users.models import Pet
+
+User = get_user_model()
+
+
+@override_settings(SYNC_OVERLAP=0)
+class SyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass12345',
+            full_name='Member', role='member',
+        )
+        cls.neighbour = User.objects.create_user(
+            username='neighbour@test.com', email='neighbour@test.com', password='pass12345',
+            full_name='Neighbour', role='member',
+        )
+        cls.dues = PaymentType.objects.create(name='Dues', amount=Decimal('50.00'))
+        cls.news = News.objects.create(title='Welcome', content='...', author=cls.neighbour)
+        now = timezone.now()
+        cls.poll = Poll.objects.create(
+            title='Pool hours', description='...', created_by=cls.neighbour,
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1),
+        )
+        cls.option = PollOption.objects.create(poll=cls.poll, text='Yes', order=0)
+        for user in (cls.member, cls.neighbour):
+            Payment.objects.create(user=user, payment_type=cls.dues, amount=Decimal('50.00'))
+            Pet.objects.create(user=user, name='Rex', pet_type='dog')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def sync(self, token=None, status_code=200):
+        response = self.client.get('/api/sync/', {'token': token} if token else {})
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def ids(self, data, name, kind='updated'):
+        changes = data['changes'][name][kind]
+        return {item['id'] for item in changes} if kind == 'updated' else set(changes)
+
+    def test_full_sync(self):
+        data = self.sync()
+        self.assertTrue(data['full'])
+        self.assertEqual(set(data['changes']), {resource.name for resource in RESOURCES})
+        self.assertEqual(self.ids(data, 'news'), {str(self.news.pk)})
+        self.assertEqual(self.ids(data, 'polls'), {str(self.poll.pk)})
+        self.assertEqual(self.ids(data, 'payments'), {str(payment.pk) for payment in self.member.payment_set.all()})
+        self.assertEqual(self.ids(data, 'pets'), {str(self.member.pets.get().pk)})
+
+    def test_only_changes_since_the_token(self):
+        token = self.sync()['sync_token']
+        data = self.sync(token)
+        self.assertFalse(data['full'])
+        self.assertEqual(data['changes'], {resource.name: {'updated': [], 'deleted': []} for resource in RESOURCES})
+
+        payment = self.member.payment_set.get()
+        payment.status = 'completed'
+        payment.save()
+        self.neighbour.payment_set.update(status='completed', updated_at=timezone.now())
+        data = self.sync(data['sync_token'])
+        self.assertEqual([item['status'] for item in data['changes']['payments']['updated']], ['completed'])
+        self.assertEqual(self.ids(data, 'news'), set())
+
+        # Nothing twice
+        self.assertEqual(self.ids(self.sync(data['sync_token']), 'payments'), set())
+
+    def test_deletions(self):
+        token = self.sync()['sync_token']
+        pet_id, news_id = str(self.member.pets.get().pk), str(self.news.pk)
+        self.member.pets.get().delete()
+        self.neighbour.pets.get().delete()
+        self.news.delete()
+        data = self.sync(token)
+        self.assertEqual(self.ids(data, 'pets', 'deleted'), {pet_id})
+        self.assertEqual(self.ids(data, 'news', 'deleted'), {news_id})
+        self.assertEqual(Tombstone.objects.get(object_id=pet_id).owner, self.member.pk)
+
+    def test_rows_leaving_the_device_are_deleted(self):
+        token = self.sync()['sync_token']
+        self.poll.is_active = False
+        self.poll.save()
+        data = self.sync(token)
+        self.assertEqual(self.ids(data, 'polls'), set())
+        self.assertEqual(self.ids(data, 'polls', 'deleted'), {str(self.poll.pk)})
+
+    def test_nested_rows_move_their_parent(self):
+        token = self.sync()['sync_token']
+        PollVote.objects.create(poll=self.poll, option=self.option, user=self.member)
+        polls = self.sync(token)['changes']['polls']['updated']
+        self.assertEqual((polls[0]['total_votes'], polls[0]['user_voted']), (1, True))
+
+    def test_warm_sync_cost_does_not_grow(self):
+        token = self.sync()['sync_token']
+
+        def count():
+            with CaptureQueriesContext(connection) as queries:
+                self.sync(token)
+            return len(queries)
+
+        few = count()
+        for n in range(20):
+            Payment.objects.create(user=self.member, payment_type=self.dues, amount=Decimal('50.00'))
+            News.objects.create(title='News %d' % n, content='...', author=self.neighbour)
+        token = self.sync()['sync_token']
+        # One range scan per resource and one for the tombstones
+        self.assertEqual(count(), few)
+        self.assertEqual(few, len(RESOURCES) + 1)
+
+        payments = next(resource for resource in RESOURCES if resource.name == 'payments')
+        plan = _changed_rows(payments, self.member, timezone.now(), {}).explain()
+        self.assertIn('payment_user_updated_idx', plan)
+
+    def test_overlap_sends_recent_rows_again(self):
+        with override_settings(SYNC_OVERLAP=60):
+            token = self.sync()['sync_token']
+        self.assertEqual(self.ids(self.sync(token), 'news'), {str(self.news.pk)})
+
+    def test_invalid_tokens(self):
+        token = self.sync()['sync_token']
+        self.sync(token[:-2] + 'xx', status_code=400)
+        self.client.force_authenticate(self.neighbour)
+        self.sync(token, status_code=400)
+        self.client.force_authenticate(self.member)
+        with override_settings(SYNC_TOMBSTONE_DAYS=-1):
+            self.sync(token, status_code=410)
+
+    def test_prune_tombstones(self):
+        self.news.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=91))
+        self.member.pets.get().delete()
+        self.assertEqual(prune_tombstones(), 1)
+        self.assertEqual(Tombstone.objects.count(), 1)
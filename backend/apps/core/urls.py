@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('batch/', views.BatchView.as_view(), name='batch'),
+    path('metrics/', views.MetricsView.as_view(), name='metrics'),
+    path('profiles/', views.ProfileListView.as_view(), name='profile-list'),
+    path('profiles/<str:profile_id>/', views.ProfileDetailView.as_view(), name='profile-detail'),
+    path('profiles/<str:profile_id>/download/', views.ProfileDownloadView.as_view(), name='profile-download'),
+    path('sync/', views.SyncView.as_view(), name='sync'),
+]
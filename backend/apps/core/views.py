@@ -0,0 +1,88 @@
+import os
+
+from django.core import signing
+from django.http import FileResponse, HttpResponse
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.users.permissions import IsAdmin, IsResident
+
+from . import metrics
+from .batch import InvalidBatch, parse_batch, run_batch
+from .profiling import list_profiles, profile_path, read_profile
+from .sync import sync
+
+
+class BatchView(APIView):
+    """Several GETs in one request (see ``apps.core.batch``)."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    # Only reads, so a batch does not pin the user to the primary database.
+    read_only = True
+
+    def post(self, request):
+        try:
+            requests, concurrent = parse_batch(request.data)
+        except InvalidBatch as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'responses': run_batch(request, requests, concurrent)})
+
+
+class MetricsView(APIView):
+    """Request metrics of all workers, in the Prometheus text format."""
+
+    permission_classes = [IsAdmin]
+    query_budget = 0
+
+    def get(self, request):
+        return HttpResponse(
+            metrics.render(metrics.collect()), content_type='text/plain; version=0.0.4; charset=utf-8',
+        )
+
+
+class ProfileListView(APIView):
+    permission_classes = [IsAdmin]
+    query_budget = 0
+
+    def get(self, request):
+        return Response(list_profiles())
+
+
+class ProfileDetailView(APIView):
+    permission_classes = [IsAdmin]
+    query_budget = 0
+
+    def get(self, request, profile_id):
+        summary = read_profile(profile_id)
+        if summary is None:
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(summary)
+
+
+class ProfileDownloadView(APIView):
+    permission_classes = [IsAdmin]
+    query_budget = 0
+
+    def get(self, request, profile_id):
+        path = profile_path(profile_id, '.prof')
+        if path is None or not os.path.exists(path):
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=profile_id + '.prof')
+
+
+class SyncView(APIView):
+    """Records changed since the client's sync token (see ``apps.core.sync``)."""
+
+    permission_classes = [IsResident]
+    query_budget = 16
+    # A lagging replica would hide rows from a token that has already moved past them.
+    use_primary = True
+
+    def get(self, request):
+        try:
+            return Response(sync(request, request.query_params.get('token')))
+        except signing.SignatureExpired:
+            return Response({'error': 'Sync token expired; sync from scratch'}, status=status.HTTP_410_GONE)
+        except signing.BadSignature:
+            return Response({'error': 'Invalid sync token'}, status=status.HTTP_400_BAD_REQUEST)
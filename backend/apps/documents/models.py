@@ -28,6 +28,9 @@ class Document(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['updated_at'], name='document_updated_idx'),
+        ]
     
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -1,12 +1,14 @@
 from rest_framework import serializers
 from .models import Document, DocumentCategory
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.fragments import FragmentCacheMixin, FragmentListSerializer
 
-class DocumentCategorySerializer(serializers.ModelSerializer):
+class DocumentCategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = DocumentCategory
         fields = ['id', 'name', 'description', 'is_public', 'created_at']
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(FragmentCacheMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     uploaded_by_name = serializers.CharField(source='uploaded_by.full_name', read_only=True)
     
@@ -14,4 +16,6 @@ class DocumentSerializer(serializers.ModelSerializer):
         model = Document
         fields = ['id', 'title', 'description', 'file', 'category', 'category_name',
                  'is_public', 'uploaded_by', 'uploaded_by_name', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uploaded_by', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'uploaded_by', 'created_at', 'updated_at']
+        list_serializer_class = FragmentListSerializer
+        expandable_fields = {'category': DocumentCategorySerializer, 'uploaded_by': 'apps.users.serializers.UserSummarySerializer'}
\ No newline at end of file
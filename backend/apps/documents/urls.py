@@ -1,10 +1,11 @@
 from django.urls import path
+from apps.core.async_views import read_view
 from . import views
 
 urlpatterns = [
-    path('categories/', views.DocumentCategoryListView.as_view(), name='document-categories'),
-    path('', views.DocumentListView.as_view(), name='document-list'),
-    path('<uuid:pk>/', views.DocumentDetailView.as_view(), name='document-detail'),
+    path('categories/', read_view(views.DocumentCategoryListView), name='document-categories'),
+    path('', read_view(views.DocumentListView), name='document-list'),
+    path('<uuid:pk>/', read_view(views.DocumentDetailView), name='document-detail'),
     path('create/', views.DocumentCreateView.as_view(), name='document-create'),
     path('<uuid:pk>/update/', views.DocumentUpdateView.as_view(), name='document-update'),
     path('<uuid:pk>/delete/', views.DocumentDeleteView.as_view(), name='document-delete'),
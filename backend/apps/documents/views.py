@@ -3,17 +3,25 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import Document, DocumentCategory
 from .serializers import DocumentSerializer, DocumentCategorySerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.cache import PublicCacheMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
-class DocumentCategoryListView(generics.ListAPIView):
+class DocumentCategoryListView(PublicCacheMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = DocumentCategory.objects.all()
     serializer_class = DocumentCategorySerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class DocumentListView(generics.ListAPIView):
+class DocumentListView(PublicCacheMixin, ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = DocumentSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'is_public']
     permission_classes = [permissions.AllowAny]
+    query_budget = 2
+    cache_models = ['documents.DocumentCategory', 'users.User']
     
     def get_queryset(self):
         queryset = Document.objects.all()
@@ -21,9 +29,10 @@ class DocumentListView(generics.ListAPIView):
             queryset = queryset.filter(is_public=True)
         return queryset
 
-class DocumentDetailView(generics.RetrieveAPIView):
+class DocumentDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = DocumentSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 2
     
     def get_queryset(self):
         queryset = Document.objects.all()
@@ -3,4 +3,11 @@ from django.apps import AppConfig
 
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.events'
\ No newline at end of file
+    name = 'apps.events'
+
+    def ready(self):
+        from apps.core.fragments import touch_parent
+        from .models import EventRSVP
+
+        # Nested in the parent's cached representation
+        touch_parent(EventRSVP, 'event')
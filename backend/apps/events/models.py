@@ -18,6 +18,9 @@ class Event(models.Model):
     
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=['updated_at'], name='event_updated_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from .models import Event, EventRSVP
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.fragments import FragmentCacheMixin, FragmentListSerializer
 
-class EventRSVPSerializer(serializers.ModelSerializer):
+class EventRSVPSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user_name = serializers.CharField(source='user.full_name', read_only=True)
     
     class Meta:
@@ -9,7 +11,7 @@ class EventRSVPSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'user_name', 'status', 'guests', 'created_at']
         read_only_fields = ['id', 'user', 'created_at']
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(FragmentCacheMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     rsvps = EventRSVPSerializer(many=True, read_only=True)
     organizer_name = serializers.CharField(source='organizer.full_name', read_only=True)
     
@@ -18,4 +20,6 @@ class EventSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description', 'start_date', 'end_date', 
                  'location', 'max_attendees', 'is_public', 'requires_rsvp',
                  'organizer', 'organizer_name', 'rsvps', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'organizer', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'organizer', 'created_at', 'updated_at']
+        list_serializer_class = FragmentListSerializer
+        expandable_fields = {'organizer': 'apps.users.serializers.UserSummarySerializer'}
\ No newline at end of file
@@ -1,9 +1,10 @@
 from django.urls import path
+from apps.core.async_views import read_view
 from . import views
 
 urlpatterns = [
-    path('', views.EventListView.as_view(), name='event-list'),
-    path('<uuid:pk>/', views.EventDetailView.as_view(), name='event-detail'),
+    path('', read_view(views.EventListView), name='event-list'),
+    path('<uuid:pk>/', read_view(views.EventDetailView), name='event-detail'),
     path('create/', views.EventCreateView.as_view(), name='event-create'),
     path('<uuid:pk>/update/', views.EventUpdateView.as_view(), name='event-update'),
     path('<uuid:pk>/delete/', views.EventDeleteView.as_view(), name='event-delete'),
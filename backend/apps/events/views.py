@@ -5,12 +5,18 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import Event, EventRSVP
 from .serializers import EventSerializer, EventRSVPSerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.cache import PublicCacheMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
 
-class EventListView(generics.ListAPIView):
+class EventListView(PublicCacheMixin, ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = EventSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_public']
     permission_classes = [permissions.AllowAny]
+    query_budget = 3
+    conditional_related = ['rsvps']
+    cache_models = ['events.EventRSVP', 'users.User']
     
     def get_queryset(self):
         queryset = Event.objects.all()
@@ -18,9 +24,11 @@ class EventListView(generics.ListAPIView):
             queryset = queryset.filter(is_public=True)
         return queryset
 
-class EventDetailView(generics.RetrieveAPIView):
+class EventDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = EventSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 3
+    conditional_related = ['rsvps']
     
     def get_queryset(self):
         queryset = Event.objects.all()
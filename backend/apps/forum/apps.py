@@ -2,4 +2,11 @@ from django.apps import AppConfig
 
 class ForumConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.forum'
\ No newline at end of file
+    name = 'apps.forum'
+
+    def ready(self):
+        from apps.core.fragments import touch_parent
+        from .models import ForumReply
+
+        # Nested in the parent's cached representation
+        touch_parent(ForumReply, 'post')
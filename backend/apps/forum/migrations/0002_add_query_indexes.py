@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forumpost',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-is_pinned', '-created_at', 'id'], name='forumpost_published_idx'),
+        ),
+    ]
@@ -36,6 +36,13 @@ class ForumPost(models.Model):
     
     class Meta:
         ordering = ['-is_pinned', '-created_at']
+        indexes = [
+            models.Index(
+                fields=['-is_pinned', '-created_at', 'id'],
+                name='forumpost_published_idx',
+                condition=models.Q(status='published'),
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -1,12 +1,14 @@
 from rest_framework import serializers
 from .models import ForumCategory, ForumPost, ForumReply
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.fragments import FragmentCacheMixin, FragmentListSerializer
 
-class ForumCategorySerializer(serializers.ModelSerializer):
+class ForumCategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ForumCategory
         fields = ['id', 'name', 'description', 'is_active', 'created_at']
 
-class ForumReplySerializer(serializers.ModelSerializer):
+class ForumReplySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.full_name', read_only=True)
     
     class Meta:
@@ -15,7 +17,7 @@ class ForumReplySerializer(serializers.ModelSerializer):
                  'created_at', 'updated_at']
         read_only_fields = ['id', 'author', 'created_at', 'updated_at']
 
-class ForumPostSerializer(serializers.ModelSerializer):
+class ForumPostSerializer(FragmentCacheMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     author_name = serializers.CharField(source='author.full_name', read_only=True)
     replies = ForumReplySerializer(many=True, read_only=True)
@@ -27,6 +29,12 @@ class ForumPostSerializer(serializers.ModelSerializer):
                  'author', 'author_name', 'status', 'is_pinned', 'is_locked',
                  'views', 'replies', 'reply_count', 'created_at', 'updated_at']
         read_only_fields = ['id', 'author', 'views', 'created_at', 'updated_at']
+        list_serializer_class = FragmentListSerializer
+        expandable_fields = {'category': ForumCategorySerializer, 'author': 'apps.users.serializers.UserSummarySerializer'}
+        relation_dependencies = {'reply_count': ['replies']}
     
     def get_reply_count(self, obj):
+        # The list/detail querysets prefetch the replies
+        if 'replies' in getattr(obj, '_prefetched_objects_cache', {}):
+            return len(obj.replies.all())
         return obj.replies.count()
\ No newline at end of file
@@ -1,9 +1,10 @@
 from django.urls import path
+from apps.core.async_views import read_view
 from . import views
 
 urlpatterns = [
-    path('categories/', views.ForumCategoryListView.as_view(), name='forum-categories'),
-    path('posts/', views.ForumPostListView.as_view(), name='forum-post-list'),
+    path('categories/', read_view(views.ForumCategoryListView), name='forum-categories'),
+    path('posts/', read_view(views.ForumPostListView), name='forum-post-list'),
     path('posts/<uuid:pk>/', views.ForumPostDetailView.as_view(), name='forum-post-detail'),
     path('posts/create/', views.ForumPostCreateView.as_view(), name='forum-post-create'),
     path('posts/<uuid:pk>/update/', views.ForumPostUpdateView.as_view(), name='forum-post-update'),
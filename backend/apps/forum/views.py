@@ -5,27 +5,35 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import ForumCategory, ForumPost, ForumReply
 from .serializers import ForumCategorySerializer, ForumPostSerializer, ForumReplySerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
-class ForumCategoryListView(generics.ListAPIView):
+class ForumCategoryListView(OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = ForumCategory.objects.filter(is_active=True)
     serializer_class = ForumCategorySerializer
     permission_classes = [IsResident]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class ForumPostListView(generics.ListAPIView):
+class ForumPostListView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = ForumPostSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'status']
     permission_classes = [IsResident]
+    query_budget = 3
+    conditional_related = ['replies']
     
     def get_queryset(self):
-        queryset = ForumPost.objects.filter(status='published')
+        queryset = ForumPost.objects.all()
         if self.request.user.role == 'admin':
-            queryset = ForumPost.objects.all()
-        return queryset
+            return queryset
+        return queryset.filter(status='published')
 
-class ForumPostDetailView(generics.RetrieveAPIView):
+class ForumPostDetailView(OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = ForumPostSerializer
     permission_classes = [IsResident]
+    query_budget = 3
     
     def get_queryset(self):
         return ForumPost.objects.filter(status='published')
@@ -3,4 +3,11 @@ from django.apps import AppConfig
 
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.news'
\ No newline at end of file
+    name = 'apps.news'
+
+    def ready(self):
+        from apps.core.fragments import touch_parent
+        from .models import NewsAttachment
+
+        # Nested in the parent's cached representation
+        touch_parent(NewsAttachment, 'news')
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['updated_at'], name='news_updated_idx'),
+        ),
+    ]
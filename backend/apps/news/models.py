@@ -2,12 +2,15 @@ import uuid
 from django.db import models
 from django.conf import settings
 
+from apps.core.images import ImageVariantsField, validate_image_pixels
+
 class News(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=200)
     content = models.TextField()
     excerpt = models.TextField(max_length=300, blank=True)
-    image = models.ImageField(upload_to='news/', blank=True, null=True)
+    image = models.ImageField(upload_to='news/', blank=True, null=True, validators=[validate_image_pixels])
+    image_variants = ImageVariantsField(source='image')
     is_public = models.BooleanField(default=False)
     is_featured = models.BooleanField(default=False)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -17,6 +20,9 @@ class News(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'News'
+        indexes = [
+            models.Index(fields=['updated_at'], name='news_updated_idx'),
+        ]
     
     def __str__(self):
         return self.title
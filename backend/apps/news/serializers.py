@@ -1,18 +1,24 @@
 from rest_framework import serializers
 from .models import News, NewsAttachment
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.fragments import FragmentCacheMixin, FragmentListSerializer
+from apps.core.images import ResponsiveImageField
 
-class NewsAttachmentSerializer(serializers.ModelSerializer):
+class NewsAttachmentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = NewsAttachment
         fields = ['id', 'file', 'filename', 'uploaded_at']
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(FragmentCacheMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     attachments = NewsAttachmentSerializer(many=True, read_only=True)
     author_name = serializers.CharField(source='author.full_name', read_only=True)
+    image_srcset = ResponsiveImageField(source='image_variants')
     
     class Meta:
         model = News
-        fields = ['id', 'title', 'content', 'excerpt', 'image', 'is_public', 
+        fields = ['id', 'title', 'content', 'excerpt', 'image', 'image_srcset', 'is_public', 
                  'is_featured', 'author', 'author_name', 'attachments', 
                  'created_at', 'updated_at']
-        read_only_fields = ['id', 'author', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'author', 'created_at', 'updated_at']
+        list_serializer_class = FragmentListSerializer
+        expandable_fields = {'author': 'apps.users.serializers.UserSummarySerializer'}
\ No newline at end of file
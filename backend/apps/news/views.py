@@ -5,12 +5,18 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import News
 from .serializers import NewsSerializer
 from apps.users.permissions import IsAdmin
+from apps.core.cache import PublicCacheMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
 
-class NewsListView(generics.ListAPIView):
+class NewsListView(PublicCacheMixin, ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = NewsSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_public', 'is_featured']
     permission_classes = [permissions.AllowAny]
+    query_budget = 3
+    conditional_related = ['attachments']
+    cache_models = ['news.NewsAttachment', 'users.User']
     
     def get_queryset(self):
         queryset = News.objects.all()
@@ -18,9 +24,11 @@ class NewsListView(generics.ListAPIView):
             queryset = queryset.filter(is_public=True)
         return queryset
 
-class NewsDetailView(generics.RetrieveAPIView):
+class NewsDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = NewsSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = 3
+    conditional_related = ['attachments']
     
     def get_queryset(self):
         queryset = News.objects.all()
@@ -36,6 +36,12 @@ class Payment(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'status', '-created_at'], name='payment_user_status_idx'),
+            models.Index(fields=['user', '-created_at'], name='payment_user_created_idx'),
+            models.Index(fields=['-created_at', 'id'], name='payment_created_idx'),
+            models.Index(fields=['user', 'updated_at'], name='payment_user_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.full_name} - {self.payment_type.name} (₱{self.amount})"
\ No newline at end of file
@@ -1,13 +1,14 @@
 from rest_framework import serializers
 from .models import PaymentType, Payment
+from apps.core.dynamic_fields import DynamicFieldsMixin
 
-class PaymentTypeSerializer(serializers.ModelSerializer):
+class PaymentTypeSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PaymentType
         fields = ['id', 'name', 'description', 'amount', 'is_recurring', 
                  'due_date', 'created_at']
 
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user_name = serializers.CharField(source='user.full_name', read_only=True)
     payment_type_name = serializers.CharField(source='payment_type.name', read_only=True)
     
@@ -16,4 +17,5 @@ class PaymentSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'user_name', 'payment_type', 'payment_type_name',
                  'amount', 'status', 'payment_method', 'transaction_id', 
                  'notes', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        expandable_fields = {'payment_type': PaymentTypeSerializer, 'user': 'apps.users.serializers.UserSummarySerializer'}
\ No newline at end of file
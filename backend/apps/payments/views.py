@@ -5,31 +5,42 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import PaymentType, Payment
 from .serializers import PaymentTypeSerializer, PaymentSerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.decorators import use_primary
+from apps.core.fast_read import FastReadMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
-class PaymentTypeListView(generics.ListAPIView):
+class PaymentTypeListView(OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = PaymentType.objects.all()
     serializer_class = PaymentTypeSerializer
     permission_classes = [IsResident]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class PaymentListView(generics.ListAPIView):
+class PaymentListView(ConditionalGetMixin, FastReadMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = PaymentSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['payment_type', 'status']
     permission_classes = [IsResident]
+    query_budget = 2
     
     def get_queryset(self):
+        queryset = Payment.objects.all()
         if self.request.user.role == 'admin':
-            return Payment.objects.all()
-        return Payment.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
-class PaymentDetailView(generics.RetrieveAPIView):
+class PaymentDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = PaymentSerializer
     permission_classes = [IsResident]
+    query_budget = 2
     
     def get_queryset(self):
+        queryset = Payment.objects.all()
         if self.request.user.role == 'admin':
-            return Payment.objects.all()
-        return Payment.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
 class PaymentCreateView(generics.CreateAPIView):
     queryset = Payment.objects.all()
@@ -39,6 +50,7 @@ class PaymentCreateView(generics.CreateAPIView):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+@use_primary
 @api_view(['POST'])
 @permission_classes([IsResident])
 def process_payment(request):
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 class PollsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.polls'
+
+    def ready(self):
+        from apps.core.fragments import touch_parent
+        from .models import PollOption, PollVote
+
+        # Options and vote counts are part of the poll clients sync by updated_at
+        touch_parent(PollOption, 'poll')
+        touch_parent(PollVote, 'poll')
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poll',
+            index=models.Index(fields=['updated_at'], name='poll_updated_idx'),
+        ),
+    ]
@@ -16,6 +16,9 @@ class Poll(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['updated_at'], name='poll_updated_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -1,17 +1,22 @@
 from rest_framework import serializers
 from .models import Poll, PollOption, PollVote
+from apps.core.dynamic_fields import DynamicFieldsMixin
 
-class PollOptionSerializer(serializers.ModelSerializer):
+class PollOptionSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     vote_count = serializers.SerializerMethodField()
     
     class Meta:
         model = PollOption
         fields = ['id', 'text', 'order', 'vote_count']
+        relation_dependencies = {'vote_count': []}
     
     def get_vote_count(self, obj):
+        # Annotated by the poll list/detail querysets
+        if hasattr(obj, 'vote_total'):
+            return obj.vote_total
         return PollVote.objects.filter(option=obj).count()
 
-class PollVoteSerializer(serializers.ModelSerializer):
+class PollVoteSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user_name = serializers.CharField(source='user.full_name', read_only=True)
     option_text = serializers.CharField(source='option.text', read_only=True)
     
@@ -20,7 +25,7 @@ class PollVoteSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'user_name', 'option', 'option_text', 'created_at']
         read_only_fields = ['id', 'user', 'created_at']
 
-class PollSerializer(serializers.ModelSerializer):
+class PollSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     options = PollOptionSerializer(many=True, read_only=True)
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
     total_votes = serializers.SerializerMethodField()
@@ -32,11 +37,17 @@ class PollSerializer(serializers.ModelSerializer):
                  'start_date', 'end_date', 'created_by', 'created_by_name',
                  'options', 'total_votes', 'user_voted', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
+        expandable_fields = {'created_by': 'apps.users.serializers.UserSummarySerializer'}
+        relation_dependencies = {'total_votes': [], 'user_voted': []}
     
     def get_total_votes(self, obj):
+        if hasattr(obj, 'vote_total'):
+            return obj.vote_total
         return PollVote.objects.filter(poll=obj).count()
     
     def get_user_voted(self, obj):
+        if hasattr(obj, 'user_has_voted'):
+            return obj.user_has_voted
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return PollVote.objects.filter(poll=obj, user=request.user).exists()
@@ -2,30 +2,46 @@ from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Count, Exists, OuterRef, Prefetch
 from django.utils import timezone
 from .models import Poll, PollOption, PollVote
 from .serializers import PollSerializer, PollVoteSerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.decorators import use_primary
+from apps.core.optimizer import OptimizedQuerysetMixin
 
-class PollListView(generics.ListAPIView):
+def poll_queryset(user):
+    return Poll.objects.annotate(
+        vote_total=Count('pollvote'),
+        user_has_voted=Exists(PollVote.objects.filter(poll=OuterRef('pk'), user=user)),
+    ).prefetch_related(
+        Prefetch('options', queryset=PollOption.objects.annotate(vote_total=Count('pollvote')))
+    )
+
+class PollListView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = PollSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_active']
     permission_classes = [IsResident]
+    query_budget = 3
+    conditional_related = ['options', 'pollvote']
     
     def get_queryset(self):
-        return Poll.objects.filter(
+        return poll_queryset(self.request.user).filter(
             is_active=True,
             start_date__lte=timezone.now(),
             end_date__gte=timezone.now()
         )
 
-class PollDetailView(generics.RetrieveAPIView):
+class PollDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = PollSerializer
     permission_classes = [IsResident]
+    query_budget = 3
+    conditional_related = ['options', 'pollvote']
     
     def get_queryset(self):
-        return Poll.objects.filter(is_active=True)
+        return poll_queryset(self.request.user).filter(is_active=True)
 
 class PollCreateView(generics.CreateAPIView):
     queryset = Poll.objects.all()
@@ -44,6 +60,7 @@ class PollDeleteView(generics.DestroyAPIView):
     queryset = Poll.objects.all()
     permission_classes = [IsAdmin]
 
+@use_primary
 @api_view(['POST'])
 @permission_classes([IsResident])
 def vote_poll(request, pk):
@@ -2,4 +2,11 @@ from django.apps import AppConfig
 
 class TicketsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.tickets'
\ No newline at end of file
+    name = 'apps.tickets'
+
+    def ready(self):
+        from apps.core.fragments import touch_parent
+        from .models import TicketComment
+
+        # Nested in the parent's representation, which clients sync by updated_at
+        touch_parent(TicketComment, 'ticket')
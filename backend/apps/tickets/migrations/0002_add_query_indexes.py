@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['submitted_by', '-created_at'], name='ticket_submitter_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', '-created_at'], name='ticket_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['-created_at', 'id'], name='ticket_created_idx'),
+        ),
+    ]
@@ -43,6 +43,12 @@ class Ticket(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['submitted_by', '-created_at'], name='ticket_submitter_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='ticket_status_created_idx'),
+            models.Index(fields=['-created_at', 'id'], name='ticket_created_idx'),
+            models.Index(fields=['submitted_by', 'updated_at'], name='ticket_submitter_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.submitted_by.full_name}"
@@ -1,12 +1,13 @@
 from rest_framework import serializers
 from .models import TicketCategory, Ticket, TicketComment
+from apps.core.dynamic_fields import DynamicFieldsMixin
 
-class TicketCategorySerializer(serializers.ModelSerializer):
+class TicketCategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TicketCategory
         fields = ['id', 'name', 'description', 'created_at']
 
-class TicketCommentSerializer(serializers.ModelSerializer):
+class TicketCommentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.full_name', read_only=True)
     
     class Meta:
@@ -14,7 +15,7 @@ class TicketCommentSerializer(serializers.ModelSerializer):
         fields = ['id', 'author', 'author_name', 'content', 'is_internal', 'created_at']
         read_only_fields = ['id', 'author', 'created_at']
 
-class TicketSerializer(serializers.ModelSerializer):
+class TicketSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     submitted_by_name = serializers.CharField(source='submitted_by.full_name', read_only=True)
     assigned_to_name = serializers.CharField(source='assigned_to.full_name', read_only=True)
@@ -26,4 +27,9 @@ class TicketSerializer(serializers.ModelSerializer):
                  'priority', 'status', 'submitted_by', 'submitted_by_name',
                  'assigned_to', 'assigned_to_name', 'location', 'comments',
                  'created_at', 'updated_at']
-        read_only_fields = ['id', 'submitted_by', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'submitted_by', 'created_at', 'updated_at']
+        expandable_fields = {
+            'category': TicketCategorySerializer,
+            'submitted_by': 'apps.users.serializers.UserSummarySerializer',
+            'assigned_to': 'apps.users.serializers.UserSummarySerializer',
+        }
\ No newline at end of file
@@ -5,26 +5,36 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import TicketCategory, Ticket, TicketComment
 from .serializers import TicketCategorySerializer, TicketSerializer, TicketCommentSerializer
 from apps.users.permissions import IsAdmin, IsResident
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.fast_read import FastReadMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
-class TicketCategoryListView(generics.ListAPIView):
+class TicketCategoryListView(OptimizedQuerysetMixin, generics.ListAPIView):
     queryset = TicketCategory.objects.all()
     serializer_class = TicketCategorySerializer
     permission_classes = [IsResident]
+    query_budget = 1
+    pagination_class = OffsetPagination
 
-class TicketListView(generics.ListAPIView):
+class TicketListView(ConditionalGetMixin, FastReadMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = TicketSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'status', 'priority']
     permission_classes = [IsResident]
+    query_budget = 3
+    conditional_related = ['comments']
     
     def get_queryset(self):
         if self.request.user.role == 'admin':
             return Ticket.objects.all()
         return Ticket.objects.filter(submitted_by=self.request.user)
 
-class TicketDetailView(generics.RetrieveAPIView):
+class TicketDetailView(ConditionalGetMixin, OptimizedQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = TicketSerializer
     permission_classes = [IsResident]
+    query_budget = 3
+    conditional_related = ['comments']
     
     def get_queryset(self):
         if self.request.user.role == 'admin':
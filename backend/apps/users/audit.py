@@ -0,0 +1,186 @@
+"""
+Buffered writer for ``ProfileChangeLog`` entries.
+
+``AuditLogMiddleware`` opens a buffer per request; ``log_profile_change``
+appends to it and the whole request is written with one ``bulk_create``
+once the surrounding transaction commits. Outside a request (shell,
+management commands) entries are written straight away.
+
+With ``AUDIT_LOG_ASYNC`` the buffered entries are handed to a background
+thread instead, which writes them in batches of ``AUDIT_LOG_BATCH_SIZE`` at
+least every ``AUDIT_LOG_FLUSH_INTERVAL`` seconds. ``shutdown()`` drains the
+queue; it runs at interpreter exit and from gunicorn's ``worker_exit`` hook
+(see ``gunicorn.conf.py``).
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_buffer = ContextVar('profile_change_buffer', default=None)
+
+
+def record(entry):
+    """Queue an unsaved ``ProfileChangeLog`` for writing."""
+    buffer = _buffer.get()
+    if buffer is None:
+        flush([entry])
+    else:
+        buffer.append(entry)
+
+
+@contextmanager
+def collect():
+    """Buffer every entry recorded inside the block and flush them on exit."""
+    token = _buffer.set([])
+    try:
+        yield
+    finally:
+        entries = _buffer.get()
+        _buffer.reset(token)
+        flush(entries)
+
+
+def flush(entries):
+    if not entries:
+        return
+    if getattr(settings, 'AUDIT_LOG_ASYNC', False):
+        get_writer().put(entries)
+    else:
+        transaction.on_commit(lambda: write(entries))
+
+
+def write(entries):
+    from .models import ProfileChangeLog
+
+    ProfileChangeLog.objects.bulk_create(entries, batch_size=getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 100))
+
+
+class BackgroundWriter:
+    """Daemon thread that drains a queue of entries into ``write`` in batches."""
+
+    _stop = object()
+
+    def __init__(self, write, batch_size=100, interval=2.0):
+        self.write = write
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def put(self, entries):
+        self.start()
+        for entry in entries:
+            self.queue.put(entry)
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='audit-log-writer', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            try:
+                item = self.queue.get(timeout=self.interval)
+            except queue.Empty:
+                continue
+            batch = []
+            deadline = time.monotonic() + self.interval
+            while item is not self._stop:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            else:
+                stopping = True
+            self.write_batch(batch)
+        close_old_connections()
+
+    def write_batch(self, batch):
+        if not batch:
+            return
+        try:
+            self.write(batch)
+        except Exception:
+            logger.exception('Failed to write %d profile change log entries', len(batch))
+
+    def stop(self, timeout=10):
+        """Flush everything queued so far and stop the thread."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None and thread.is_alive():
+            self.queue.put(self._stop)
+            thread.join(timeout)
+        # Anything queued after the stop marker (or if the thread died)
+        leftover = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._stop:
+                leftover.append(item)
+        for start in range(0, len(leftover), self.batch_size):
+            self.write_batch(leftover[start:start + self.batch_size])
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BackgroundWriter(
+                write,
+                batch_size=getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 100),
+                interval=getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 2.0),
+            )
+            atexit.register(shutdown)
+        return _writer
+
+
+def shutdown():
+    if _writer is not None:
+        _writer.stop()
+
+
+class AuditLogMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with collect():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        token = _buffer.set([])
+        try:
+            return await self.get_response(request)
+        finally:
+            entries = _buffer.get()
+            _buffer.reset(token)
+            await sync_to_async(flush)(entries)
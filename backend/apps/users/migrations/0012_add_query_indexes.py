@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_user_theme_preference'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profilechangelog',
+            index=models.Index(fields=['user', 'change_type', '-timestamp'], name='changelog_user_type_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profilechangelog',
+            index=models.Index(fields=['user', '-timestamp'], name='changelog_user_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['block', 'lot'], name='user_block_lot_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:58
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profilechangelog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:39
+
+import apps.core.images
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_profilechangelog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='photo_variants',
+            field=apps.core.images.ImageVariantsField(blank=True, default=dict, editable=False, source='photo'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='house_front_view_variants',
+            field=apps.core.images.ImageVariantsField(blank=True, default=dict, editable=False, source='house_front_view'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_photo_variants',
+            field=apps.core.images.ImageVariantsField(blank=True, default=dict, editable=False, source='profile_photo'),
+        ),
+        migrations.AlterField(
+            model_name='pet',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, upload_to='pet_photos/', validators=[apps.core.images.validate_image_pixels]),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='house_front_view',
+            field=models.ImageField(blank=True, null=True, upload_to='house_photos/', validators=[apps.core.images.validate_image_pixels]),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='profile_photo',
+            field=models.ImageField(blank=True, null=True, upload_to='profile_photos/', validators=[apps.core.images.validate_image_pixels]),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0014_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='householdmember',
+            index=models.Index(fields=['user', 'updated_at'], name='household_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['user', 'updated_at'], name='pet_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vehicle',
+            index=models.Index(fields=['user', 'updated_at'], name='vehicle_user_updated_idx'),
+        ),
+    ]
@@ -4,6 +4,8 @@ from django.db import models
 from django.utils import timezone
 from django.core.validators import RegexValidator
 
+from apps.core.images import ImageVariantsField, validate_image_pixels
+
 class User(AbstractUser):
     
     ROLE_CHOICES = [
@@ -34,7 +36,10 @@ class User(AbstractUser):
     phone = models.CharField(max_length=20, blank=True)
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='guest')
     
-    profile_photo = models.ImageField(upload_to='profile_photos/', blank=True, null=True)
+    profile_photo = models.ImageField(
+        upload_to='profile_photos/', blank=True, null=True, validators=[validate_image_pixels]
+    )
+    profile_photo_variants = ImageVariantsField(source='profile_photo')
     
     preferred_contact_method = models.CharField(
         max_length=10, 
@@ -61,7 +66,10 @@ class User(AbstractUser):
     block = models.CharField(max_length=20, blank=True)
     lot = models.CharField(max_length=20, blank=True)
     move_in_date = models.DateField(blank=True, null=True)
-    house_front_view = models.ImageField(upload_to='house_photos/', blank=True, null=True)
+    house_front_view = models.ImageField(
+        upload_to='house_photos/', blank=True, null=True, validators=[validate_image_pixels]
+    )
+    house_front_view_variants = ImageVariantsField(source='house_front_view')
     parking_spaces = models.PositiveIntegerField(default=0)
     mailbox_number = models.CharField(max_length=10, blank=True)
     
@@ -136,6 +144,9 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['block', 'lot'], name='user_block_lot_idx'),
+        ]
     
     def __str__(self):
         return self.email
@@ -185,6 +196,9 @@ class HouseholdMember(models.Model):
         verbose_name = 'Household Member'
         verbose_name_plural = 'Household Members'
         unique_together = ['user', 'full_name']
+        indexes = [
+            models.Index(fields=['user', 'updated_at'], name='household_user_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.full_name} ({self.relationship} of {self.user.full_name})"
@@ -214,13 +228,17 @@ class Pet(models.Model):
     vaccination_current = models.BooleanField(default=False)
     vaccination_expiry = models.DateField(blank=True, null=True)
     special_needs = models.TextField(blank=True)
-    photo = models.ImageField(upload_to='pet_photos/', blank=True, null=True)
+    photo = models.ImageField(upload_to='pet_photos/', blank=True, null=True, validators=[validate_image_pixels])
+    photo_variants = ImageVariantsField(source='photo')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = 'Pet'
         verbose_name_plural = 'Pets'
+        indexes = [
+            models.Index(fields=['user', 'updated_at'], name='pet_user_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.pet_type}) - {self.user.full_name}"
@@ -258,6 +276,9 @@ class Vehicle(models.Model):
         verbose_name = 'Vehicle'
         verbose_name_plural = 'Vehicles'
         unique_together = ['license_plate', 'user']
+        indexes = [
+            models.Index(fields=['user', 'updated_at'], name='vehicle_user_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.year} {self.make} {self.model} ({self.license_plate})"
@@ -283,12 +304,17 @@ class ProfileChangeLog(models.Model):
     new_value = models.TextField(blank=True)
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     user_agent = models.TextField(blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the change is recorded; the row may be written later in a batch
+    timestamp = models.DateTimeField(default=timezone.now)
     
     class Meta:
         verbose_name = 'Profile Change Log'
         verbose_name_plural = 'Profile Change Logs'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['user', 'change_type', '-timestamp'], name='changelog_user_type_ts_idx'),
+            models.Index(fields=['user', '-timestamp'], name='changelog_user_ts_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.email} - {self.change_type} - {self.timestamp}"
\ No newline at end of file
@@ -4,8 +4,13 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .models import User, HouseholdMember, Pet, Vehicle, ProfileChangeLog
+from apps.core.dynamic_fields import DynamicFieldsMixin
+from apps.core.images import ResponsiveImageField
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     
@@ -60,7 +65,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         }
 
 
-class HouseholdMemberSerializer(serializers.ModelSerializer):
+class UserSummarySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Public identity of a user, for ``?expand=`` of author and organizer fields."""
+
+    class Meta:
+        model = User
+        fields = ['id', 'full_name']
+        read_only_fields = fields
+
+
+class HouseholdMemberSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = HouseholdMember
@@ -77,14 +91,15 @@ class HouseholdMemberSerializer(serializers.ModelSerializer):
         return value
 
 
-class PetSerializer(serializers.ModelSerializer):
+class PetSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    photo_srcset = ResponsiveImageField(source='photo_variants')
     
     class Meta:
         model = Pet
         fields = [
             'id', 'name', 'pet_type', 'breed', 'color', 'weight',
             'date_of_birth', 'microchip_number', 'vaccination_current',
-            'vaccination_expiry', 'special_needs', 'photo',
+            'vaccination_expiry', 'special_needs', 'photo', 'photo_srcset',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
@@ -95,7 +110,7 @@ class PetSerializer(serializers.ModelSerializer):
         return value
 
 
-class VehicleSerializer(serializers.ModelSerializer):
+class VehicleSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = Vehicle
@@ -118,7 +133,7 @@ class VehicleSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProfileChangeLogSerializer(serializers.ModelSerializer):
+class ProfileChangeLogSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = ProfileChangeLog
@@ -129,14 +144,15 @@ class ProfileChangeLogSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'timestamp']
 
 
-class UserBasicProfileSerializer(serializers.ModelSerializer):
+class UserBasicProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     profile_completion = serializers.SerializerMethodField()
+    profile_photo_srcset = ResponsiveImageField(source='profile_photo_variants')
     
     class Meta:
         model = User
         fields = [
-            'id', 'username', 'email', 'full_name', 'phone', 'profile_photo',
+            'id', 'username', 'email', 'full_name', 'phone', 'profile_photo', 'profile_photo_srcset',
             'preferred_contact_method', 'best_contact_time', 'language_preference',
             'timezone_setting', 'profile_completion', 'last_profile_update'
         ]
@@ -157,13 +173,14 @@ class UserBasicProfileSerializer(serializers.ModelSerializer):
         return value
 
 
-class UserResidenceSerializer(serializers.ModelSerializer):
+class UserResidenceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    house_front_view_srcset = ResponsiveImageField(source='house_front_view_variants')
 
     class Meta:
         model = User
         fields = [
             'block', 'lot', 'move_in_date', 'parking_spaces',
-            'mailbox_number', 'house_front_view'
+            'mailbox_number', 'house_front_view', 'house_front_view_srcset'
         ]
         extra_kwargs = {
             'move_in_date': {'required': False, 'allow_null': True},
@@ -175,17 +192,12 @@ class UserResidenceSerializer(serializers.ModelSerializer):
         }
 
     def validate(self, attrs):
-        print(f"[SERIALIZER] Serializer validate() called with attrs: {attrs}")
-
-        # Check the house_front_view field specifically
-        if 'house_front_view' in attrs:
-            house_front_view = attrs['house_front_view']
-            print(f"[SERIALIZER] house_front_view type: {type(house_front_view)}")
-            print(f"[SERIALIZER] house_front_view value: {house_front_view}")
-            if hasattr(house_front_view, 'name'):
-                print(f"[SERIALIZER] house_front_view name: {house_front_view.name}")
-            if hasattr(house_front_view, 'size'):
-                print(f"[SERIALIZER] house_front_view size: {house_front_view.size}")
+        house_front_view = attrs.get('house_front_view')
+        if house_front_view is not None:
+            logger.debug(
+                'Residence house_front_view upload: %s (%s bytes)',
+                getattr(house_front_view, 'name', house_front_view), getattr(house_front_view, 'size', None),
+            )
 
         # Check if at least block or lot is provided
         if 'block' in attrs or 'lot' in attrs:
@@ -217,7 +229,7 @@ class UserResidenceSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class UserEmergencySerializer(serializers.ModelSerializer):
+class UserEmergencySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = User
@@ -239,7 +251,7 @@ class UserEmergencySerializer(serializers.ModelSerializer):
         return value
 
 
-class UserPrivacySerializer(serializers.ModelSerializer):
+class UserPrivacySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = User
@@ -250,7 +262,7 @@ class UserPrivacySerializer(serializers.ModelSerializer):
         ]
 
 
-class UserSecuritySerializer(serializers.ModelSerializer):
+class UserSecuritySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     new_password = serializers.CharField(write_only=True, required=False)
     current_password = serializers.CharField(write_only=True, required=False)
@@ -290,7 +302,7 @@ class UserSecuritySerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class UserFinancialSerializer(serializers.ModelSerializer):
+class UserFinancialSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
 
     class Meta:
         model = User
@@ -338,7 +350,7 @@ class UserFinancialSerializer(serializers.ModelSerializer):
         return data
 
 
-class UserNotificationSerializer(serializers.ModelSerializer):
+class UserNotificationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = User
@@ -348,7 +360,7 @@ class UserNotificationSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserSystemPreferencesSerializer(serializers.ModelSerializer):
+class UserSystemPreferencesSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     class Meta:
         model = User
@@ -357,19 +369,21 @@ class UserSystemPreferencesSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserCompleteProfileSerializer(serializers.ModelSerializer):
+class UserCompleteProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     
     household_members = HouseholdMemberSerializer(many=True, read_only=True)
     pets = PetSerializer(many=True, read_only=True)
     vehicles = VehicleSerializer(many=True, read_only=True)
     profile_completion = serializers.SerializerMethodField()
+    profile_photo_srcset = ResponsiveImageField(source='profile_photo_variants')
+    house_front_view_srcset = ResponsiveImageField(source='house_front_view_variants')
     
     class Meta:
         model = User
         fields = [
-            'id', 'username', 'email', 'full_name', 'phone', 'profile_photo',
+            'id', 'username', 'email', 'full_name', 'phone', 'profile_photo', 'profile_photo_srcset',
             'preferred_contact_method', 'best_contact_time', 'language_preference',
-            'timezone_setting', 'block', 'lot', 'move_in_date', 'house_front_view',
+            'timezone_setting', 'block', 'lot', 'move_in_date', 'house_front_view', 'house_front_view_srcset',
             'parking_spaces', 'mailbox_number', 'emergency_contact', 'emergency_phone',
             'emergency_relationship', 'secondary_emergency_contact', 'secondary_emergency_phone',
             'secondary_emergency_relationship', 'medical_conditions', 'special_needs',
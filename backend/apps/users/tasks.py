@@ -0,0 +1,37 @@
+import logging
+import smtplib
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+# Transient delivery failures worth retrying: SMTP errors, connection
+# refused/reset and socket timeouts.
+RETRY_EXCEPTIONS = (smtplib.SMTPException, OSError)
+
+RETRY_OPTIONS = {
+    'autoretry_for': RETRY_EXCEPTIONS,
+    'retry_backoff': True,
+    'retry_backoff_max': 600,
+    'retry_jitter': True,
+    'max_retries': 5,
+}
+
+
+@shared_task(ignore_result=True, **RETRY_OPTIONS)
+def send_email(subject, message, recipient_list, from_email=None):
+    send_mail(
+        subject=subject,
+        message=message,
+        from_email=from_email or getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@hoa.com'),
+        recipient_list=recipient_list,
+        fail_silently=False
+    )
+
+
+@shared_task(ignore_result=True, **RETRY_OPTIONS)
+def send_sms(phone, message):
+    # No SMS gateway is configured yet; log the message instead.
+    logger.info('SMS to %s: %s', phone, message)
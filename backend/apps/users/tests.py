@@ -1 +1,104 @@
+import smtplib
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from . import audit
+from .models import ProfileChangeLog
+from .tasks import send_email
+
+User = get_user_model()
+
+
+class OutboundMessageTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_email_verification_is_sent_through_the_queue(self):
+        with mock.patch('apps.users.utils.send_email.delay', wraps=send_email.delay) as delay:
+            response = self.client.post('/api/users/security/request-email-verification/', {'new_email': 'new@test.com'})
+        self.assertEqual(response.status_code, 200)
+        delay.assert_called_once()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['new@test.com'])
+
+    def test_sms_is_sent_through_the_queue(self):
+        with mock.patch('apps.users.utils.send_sms.delay') as delay:
+            response = self.client.post('/api/users/security/request-phone-verification/', {'new_phone': '555-123-4567'})
+        self.assertEqual(response.status_code, 200)
+        phone, message = delay.call_args[0]
+        self.assertEqual(phone, '555-123-4567')
+        self.assertIn('verification code', message)
+
+    def test_smtp_failures_are_retried(self):
+        with mock.patch('apps.users.tasks.send_mail', side_effect=[smtplib.SMTPServerDisconnected(), 1]) as send_mail:
+            send_email.delay('Subject', 'Body', ['member@test.com'])
+        self.assertEqual(send_mail.call_count, 2)
+
+
+class AuditLogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='member@test.com', email='member@test.com',
+            password='pass12345', full_name='Member', role='member',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_request_entries_are_written_in_one_insert(self):
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch('/api/users/profile/emergency/', {
+                'emergency_contact': 'Sam',
+                'emergency_phone': '555-123-4567',
+                'emergency_relationship': 'Sibling',
+                'medical_conditions': 'None',
+            })
+        self.assertEqual(response.status_code, 200)
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT INTO "users_profilechangelog"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            set(ProfileChangeLog.objects.filter(user=self.user).values_list('field_name', flat=True)),
+            {'emergency_contact', 'emergency_phone', 'emergency_relationship', 'medical_conditions'},
+        )
+
+    def test_entries_wait_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with audit.collect():
+                audit.record(ProfileChangeLog(user=self.user, change_type='login'))
+                audit.record(ProfileChangeLog(user=self.user, change_type='update', field_name='phone'))
+            self.assertFalse(ProfileChangeLog.objects.exists())
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(ProfileChangeLog.objects.count(), 2)
+
+    def test_background_writer_batches_and_drains_on_stop(self):
+        batches = []
+        writer = audit.BackgroundWriter(batches.append, batch_size=2, interval=60)
+        writer.put(range(5))
+        writer.stop()
+        self.assertEqual(sorted(entry for batch in batches for entry in batch), list(range(5)))
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertIsNone(writer.thread)
+
+        # A write failure is logged and does not stop later batches.
+        def flaky(batch):
+            if batch == [0]:
+                raise RuntimeError('database away')
+            batches.append(batch)
+
+        batches.clear()
+        writer = audit.BackgroundWriter(flaky, batch_size=1, interval=60)
+        with self.assertLogs('apps.users.audit', 'ERROR'):
+            writer.put([0, 1])
+            writer.stop()
+        self.assertEqual(batches, [[1]])
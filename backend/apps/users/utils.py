@@ -1,4 +1,3 @@
-from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
@@ -8,6 +7,9 @@ import html
 import re
 import secrets
 
+from . import audit
+from .tasks import send_email, send_sms
+
 
 def get_client_ip(request):
     if not request:
@@ -23,7 +25,8 @@ def get_client_ip(request):
 def log_profile_change(user, change_type, field_name, old_value, new_value, request=None):
     from .models import ProfileChangeLog
     
-    ProfileChangeLog.objects.create(
+    # Written in one batch at the end of the request (see audit.py)
+    audit.record(ProfileChangeLog(
         user=user,
         change_type=change_type,
         field_name=field_name,
@@ -31,7 +34,7 @@ def log_profile_change(user, change_type, field_name, old_value, new_value, requ
         new_value=str(new_value) if new_value else '',
         ip_address=get_client_ip(request) if request else None,
         user_agent=request.META.get('HTTP_USER_AGENT', '') if request else ''
-    )
+    ))
 
 
 def send_verification_email(email, token):
@@ -53,25 +56,15 @@ def send_verification_email(email, token):
     HOA Management Team
     """
     
-    try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@hoa.com'),
-            recipient_list=[email],
-            fail_silently=False
-        )
-        return True
-    except Exception as e:
-        print(f"Failed to send verification email: {e}")
-        return False
+    send_email.delay(subject, message, [email])
+    return True
 
 
 def send_verification_sms(phone, code):
     
     message = f"Your HOA Portal verification code is: {code}. Valid for 10 minutes."
     
-    print(f"SMS to {phone}: {message}")
+    send_sms.delay(phone, message)
     
     return True
 
@@ -92,16 +85,7 @@ def send_profile_change_notification(user, change_summary):
     HOA Management Team
     """
     
-    try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@hoa.com'),
-            recipient_list=[user.email],
-            fail_silently=False
-        )
-    except Exception as e:
-        print(f"Failed to send profile change notification: {e}")
+    send_email.delay(subject, message, [user.email])
 
 
 def get_profile_completion_requirements(user):
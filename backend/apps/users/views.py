@@ -12,11 +12,8 @@ from django.utils import timezone
 from django.db import transaction
 import secrets
 import uuid
-import pyotp
-import qrcode
-import io
-import base64
 import json
+import logging
 from .models import HouseholdMember, Pet, Vehicle, ProfileChangeLog
 from .serializers import (
     CustomTokenObtainPairSerializer, UserBasicProfileSerializer, UserResidenceSerializer, 
@@ -27,8 +24,13 @@ from .serializers import (
     EmailVerificationSerializer, PhoneVerificationSerializer
 )
 from .utils import log_profile_change, send_verification_email, send_verification_sms
+from apps.core.decorators import query_budget
+from apps.core.fast_read import FastReadMixin
+from apps.core.optimizer import OptimizedQuerysetMixin
+from apps.core.pagination import OffsetPagination
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 # Authentication Views
@@ -160,6 +162,7 @@ class LogoutView(APIView):
 class ProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserCompleteProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3
     
     def get_object(self):
         return self.request.user
@@ -178,6 +181,7 @@ class ProfileView(generics.RetrieveUpdateAPIView):
 class ProfileBasicView(generics.RetrieveUpdateAPIView):
     serializer_class = UserBasicProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     parser_classes = [MultiPartParser, FormParser]
     
     def get_object(self):
@@ -204,23 +208,19 @@ class ProfileBasicView(generics.RetrieveUpdateAPIView):
 class ProfileResidenceView(generics.RetrieveUpdateAPIView):
     serializer_class = UserResidenceSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     parser_classes = [parsers.MultiPartParser, parsers.FormParser, parsers.JSONParser]
 
     def get_object(self):
         return self.request.user
 
     def update(self, request, *args, **kwargs):
-        # Debug logging
-        print(f"[DEBUG] Request content type: {request.content_type}")
-        print(f"[DEBUG] Request method: {request.method}")
-        print(f"[DEBUG] Request data keys: {list(request.data.keys())}")
-        print(f"[DEBUG] Request FILES keys: {list(request.FILES.keys())}")
-
-        for key, value in request.data.items():
-            print(f"[DEBUG] Data field '{key}': {type(value)} - {value}")
-
+        logger.debug(
+            'Residence update: content type %s, data keys %s, file keys %s',
+            request.content_type, list(request.data.keys()), list(request.FILES.keys()),
+        )
         for key, file_obj in request.FILES.items():
-            print(f"[DEBUG] File field '{key}': {type(file_obj)} - {file_obj.name} ({file_obj.size} bytes)")
+            logger.debug('Residence update file %r: %s (%s bytes)', key, file_obj.name, file_obj.size)
 
         return super().update(request, *args, **kwargs)
 
@@ -245,6 +245,7 @@ class ProfileResidenceView(generics.RetrieveUpdateAPIView):
 class ProfileEmergencyView(generics.RetrieveUpdateAPIView):
     serializer_class = UserEmergencySerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -270,6 +271,7 @@ class ProfileEmergencyView(generics.RetrieveUpdateAPIView):
 class ProfilePrivacyView(generics.RetrieveUpdateAPIView):
     serializer_class = UserPrivacySerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -295,6 +297,7 @@ class ProfilePrivacyView(generics.RetrieveUpdateAPIView):
 class ProfileSecurityView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSecuritySerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -327,6 +330,7 @@ class ProfileSecurityView(generics.RetrieveUpdateAPIView):
 class ProfileFinancialView(generics.RetrieveUpdateAPIView):
     serializer_class = UserFinancialSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -352,6 +356,7 @@ class ProfileFinancialView(generics.RetrieveUpdateAPIView):
 class ProfileNotificationView(generics.RetrieveUpdateAPIView):
     serializer_class = UserNotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -377,6 +382,7 @@ class ProfileNotificationView(generics.RetrieveUpdateAPIView):
 class ProfileSystemPreferencesView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSystemPreferencesSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 0
     
     def get_object(self):
         return self.request.user
@@ -402,15 +408,18 @@ class ProfileSystemPreferencesView(generics.RetrieveUpdateAPIView):
 class ProfileCompleteView(generics.RetrieveAPIView):
     serializer_class = UserCompleteProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3
     
     def get_object(self):
         return self.request.user
 
 
 # Household Members Management
-class HouseholdMemberListCreateView(generics.ListCreateAPIView):
+class HouseholdMemberListCreateView(FastReadMixin, OptimizedQuerysetMixin, generics.ListCreateAPIView):
     serializer_class = HouseholdMemberSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
+    pagination_class = OffsetPagination
     
     def get_queryset(self):
         return HouseholdMember.objects.filter(user=self.request.user)
@@ -427,9 +436,10 @@ class HouseholdMemberListCreateView(generics.ListCreateAPIView):
         )
 
 
-class HouseholdMemberDetailView(generics.RetrieveUpdateDestroyAPIView):
+class HouseholdMemberDetailView(OptimizedQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = HouseholdMemberSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
     
     def get_queryset(self):
         return HouseholdMember.objects.filter(user=self.request.user)
@@ -459,9 +469,11 @@ class HouseholdMemberDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # Pet Management
-class PetListCreateView(generics.ListCreateAPIView):
+class PetListCreateView(OptimizedQuerysetMixin, generics.ListCreateAPIView):
     serializer_class = PetSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
+    pagination_class = OffsetPagination
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     
     def get_queryset(self):
@@ -479,9 +491,10 @@ class PetListCreateView(generics.ListCreateAPIView):
         )
 
 
-class PetDetailView(generics.RetrieveUpdateDestroyAPIView):
+class PetDetailView(OptimizedQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = PetSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     
     def get_queryset(self):
@@ -512,9 +525,11 @@ class PetDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # Vehicle Management
-class VehicleListCreateView(generics.ListCreateAPIView):
+class VehicleListCreateView(FastReadMixin, OptimizedQuerysetMixin, generics.ListCreateAPIView):
     serializer_class = VehicleSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
+    pagination_class = OffsetPagination
     
     def get_queryset(self):
         return Vehicle.objects.filter(user=self.request.user)
@@ -531,9 +546,10 @@ class VehicleListCreateView(generics.ListCreateAPIView):
         )
 
 
-class VehicleDetailView(generics.RetrieveUpdateDestroyAPIView):
+class VehicleDetailView(OptimizedQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = VehicleSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
     
     def get_queryset(self):
         return Vehicle.objects.filter(user=self.request.user)
@@ -564,9 +580,11 @@ class VehicleDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # Profile Change Logs
-class ProfileChangeLogView(generics.ListAPIView):
+class ProfileChangeLogView(FastReadMixin, OptimizedQuerysetMixin, generics.ListAPIView):
     serializer_class = ProfileChangeLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 1
+    pagination_class = None  # Already capped to the latest entries below
     
     def get_queryset(self):
         return ProfileChangeLog.objects.filter(user=self.request.user)[:50]  # Last 50 changes
@@ -771,6 +789,7 @@ def export_profile_data(request):
     return Response(profile_data, status=status.HTTP_200_OK)
 
 
+@query_budget(1)
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def profile_completion_status(request):
@@ -813,6 +832,12 @@ def profile_completion_status(request):
 @permission_classes([permissions.IsAuthenticated])
 def setup_totp(request):
     """Generate TOTP secret and QR code for 2FA setup"""
+    # Imported here: QR generation pulls in Pillow and is only needed for 2FA setup.
+    import base64
+    import io
+    import pyotp
+    import qrcode
+
     try:
         user = request.user
 
@@ -862,6 +887,8 @@ def setup_totp(request):
 @permission_classes([permissions.IsAuthenticated])
 def verify_totp_setup(request):
     """Verify TOTP code and enable 2FA"""
+    import pyotp
+
     try:
         user = request.user
         secret = request.data.get('secret')
@@ -1011,6 +1038,8 @@ def generate_backup_codes(request):
 @permission_classes([permissions.IsAuthenticated])
 def verify_totp_code(request):
     """Verify a TOTP code (for testing or validation)"""
+    import pyotp
+
     try:
         user = request.user
         code = request.data.get('code')
@@ -0,0 +1,178 @@
+"""
+Compare the sync (WSGI) and async (ASGI) deployments on the read endpoints.
+
+Builds a throwaway SQLite database, seeds it, then starts gunicorn twice on
+the same code: once with sync workers on ``hoa_backend.wsgi`` and once with
+``uvicorn.workers.UvicornWorker`` on ``hoa_backend.asgi``. Each server is hit
+with a small asyncio HTTP/1.1 load generator and the results (requests per
+second, p50 and p99 latency, errors) are printed as JSON.
+
+    python benchmarks/async_vs_sync.py --concurrency 50 --duration 10
+
+Requires ``uvicorn`` (see requirements.txt). Run from the ``backend`` dir.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import common
+
+ENDPOINTS = [
+    '/api/news/',
+    '/api/events/',
+    '/api/documents/',
+    '/api/documents/categories/',
+    '/api/cms/pages/',
+    '/api/cms/board/',
+]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, port, workers, env):
+    command = [sys.executable, '-m', 'gunicorn', '--bind', '127.0.0.1:%d' % port, '--workers', str(workers)]
+    if mode == 'async':
+        command += ['-k', 'uvicorn.workers.UvicornWorker', 'hoa_backend.asgi:application']
+    else:
+        command += ['hoa_backend.wsgi:application']
+    process = subprocess.Popen(
+        command, cwd=common.BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('%s server exited: %s' % (mode, process.stderr.read().decode()))
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('%s server did not start' % mode)
+
+
+def stop_server(process):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+async def fetch(reader, writer, path):
+    writer.write(('GET %s HTTP/1.1\r\nHost: localhost\r\nAccept: application/json\r\n\r\n' % path).encode())
+    await writer.drain()
+    status_line = await reader.readline()
+    length, keep_alive = 0, True
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+        elif name.lower() == 'connection' and value.strip().lower() == 'close':
+            keep_alive = False
+    await reader.readexactly(length)
+    return int(status_line.split()[1]), keep_alive
+
+
+async def client(port, deadline, latencies, errors, offset):
+    reader = writer = None
+    n = offset
+    try:
+        while time.monotonic() < deadline:
+            path = ENDPOINTS[n % len(ENDPOINTS)]
+            n += 1
+            started = time.perf_counter()
+            try:
+                if reader is None:
+                    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                status, keep_alive = await fetch(reader, writer, path)
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+                errors.append(path)
+                keep_alive = False
+            else:
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors.append(path)
+            if not keep_alive:
+                # gunicorn's sync workers close the connection after each response
+                if writer is not None:
+                    writer.close()
+                reader = writer = None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def run_load(port, concurrency, duration):
+    latencies, errors = [], []
+    started = time.monotonic()
+    await asyncio.gather(*[
+        client(port, started + duration, latencies, errors, offset) for offset in range(concurrency)
+    ])
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p99_ms': round(quantiles[98] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--modes', nargs='+', choices=['sync', 'async'], default=['sync', 'async'])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = 'sqlite:///%s' % os.path.join(directory, 'bench.sqlite3')
+        common.setup_django(database_url)
+        common.seed(residents=20, rows=args.rows)
+
+        # Measure the views, not the public response cache.
+        env = dict(os.environ, DATABASE_URL=database_url, DEBUG='False', PUBLIC_CACHE_TIMEOUT='0')
+        env.pop('REDIS_URL', None)
+        results = {}
+        for mode in args.modes:
+            env['ASYNC_READ_VIEWS'] = 'true' if mode == 'async' else 'false'
+            port = free_port()
+            process = start_server(mode, port, args.workers, env)
+            try:
+                asyncio.run(run_load(port, args.concurrency, args.warmup))
+                results[mode] = asyncio.run(run_load(port, args.concurrency, args.duration))
+            finally:
+                stop_server(process)
+
+    print(json.dumps({
+        'concurrency': args.concurrency,
+        'duration': args.duration,
+        'workers': args.workers,
+        'rows': args.rows,
+        'results': results,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
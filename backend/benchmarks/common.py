@@ -0,0 +1,168 @@
+"""
+Shared setup for the benchmark scripts: point Django at a throwaway
+database, migrate it and fill it with a community of a given size.
+"""
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PASSWORD = 'pass12345'
+
+
+def setup_django(database_url, **env):
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.update(env)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hoa_backend.settings')
+    sys.path.insert(0, str(BACKEND_DIR))
+    import django
+
+    django.setup()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def seed(residents=100, rows=100, admins=2, seed=1):
+    """
+    Migrate and fill the database: ``residents`` members, ``admins`` admins
+    and ``rows`` rows of every content type, with children spread over the
+    residents. Everyone's password is ``PASSWORD``.
+
+    Returns the ids the scenarios need.
+    """
+    from datetime import timedelta
+    from decimal import Decimal
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.core.management import call_command
+    from django.utils import timezone
+
+    from apps.bookings.models import Booking, Facility
+    from apps.cms.models import BoardMember, ContactInfo, Page
+    from apps.documents.models import Document, DocumentCategory
+    from apps.events.models import Event, EventRSVP
+    from apps.forum.models import ForumCategory, ForumPost, ForumReply
+    from apps.news.models import News
+    from apps.payments.models import Payment, PaymentType
+    from apps.polls.models import Poll, PollOption
+    from apps.tickets.models import Ticket, TicketCategory, TicketComment
+
+    User = get_user_model()
+    rng = random.Random(seed)
+    now = timezone.now()
+    call_command('migrate', verbosity=0)
+
+    # Hash once: PBKDF2 per user would dominate seeding time.
+    password = make_password(PASSWORD)
+    users = User.objects.bulk_create(
+        [
+            User(username='admin%d@bench.test' % n, email='admin%d@bench.test' % n, password=password,
+                 full_name='Admin %d' % n, role='admin', is_staff=True)
+            for n in range(admins)
+        ] + [
+            User(username='resident%d@bench.test' % n, email='resident%d@bench.test' % n, password=password,
+                 full_name='Resident %d' % n, role='member', block='B%d' % (n // 20), lot='L%d' % (n % 20))
+            for n in range(residents)
+        ]
+    )
+    admin_users, resident_users = users[:admins], users[admins:]
+
+    News.objects.bulk_create(
+        News(title='News %d' % n, content='Lorem ipsum ' * 60, author=rng.choice(admin_users), is_public=n % 4 != 0)
+        for n in range(rows)
+    )
+    events = Event.objects.bulk_create(
+        Event(
+            title='Event %d' % n, description='...', location='Clubhouse', organizer=rng.choice(admin_users),
+            start_date=now + timedelta(days=n), end_date=now + timedelta(days=n, hours=2),
+        )
+        for n in range(rows)
+    )
+    EventRSVP.objects.bulk_create(
+        EventRSVP(event=event, user=user, status='attending')
+        for event in events[:10] for user in rng.sample(resident_users, min(10, residents))
+    )
+    document_categories = DocumentCategory.objects.bulk_create(
+        DocumentCategory(name='Category %d' % n) for n in range(8)
+    )
+    Document.objects.bulk_create(
+        Document(title='Document %d' % n, file='documents/%d.pdf' % n, category=rng.choice(document_categories),
+                 uploaded_by=rng.choice(admin_users), is_public=n % 3 != 0)
+        for n in range(rows)
+    )
+    Page.objects.bulk_create(Page(slug='page-%d' % n, title='Page %d' % n, content='...') for n in range(20))
+    ContactInfo.objects.bulk_create(ContactInfo(name='Contact %d' % n, phone='555-01%02d' % n) for n in range(10))
+    BoardMember.objects.bulk_create(BoardMember(name='Board %d' % n, position='Member') for n in range(7))
+
+    facilities = Facility.objects.bulk_create(
+        Facility(name='Facility %d' % n, description='...', capacity=20) for n in range(5)
+    )
+    Booking.objects.bulk_create(
+        Booking(
+            facility=rng.choice(facilities), user=rng.choice(resident_users), purpose='Party', expected_guests=10,
+            start_datetime=now + timedelta(days=n, hours=10), end_datetime=now + timedelta(days=n, hours=12),
+        )
+        for n in range(rows)
+    )
+    payment_types = PaymentType.objects.bulk_create(
+        PaymentType(name='Dues %d' % n, amount=Decimal('50.00')) for n in range(3)
+    )
+    Payment.objects.bulk_create(
+        Payment(user=user, payment_type=rng.choice(payment_types), amount=Decimal('50.00'))
+        for user in resident_users for _ in range(3)
+    )
+    ticket_categories = TicketCategory.objects.bulk_create(
+        TicketCategory(name='Category %d' % n) for n in range(5)
+    )
+    tickets = Ticket.objects.bulk_create(
+        Ticket(title='Ticket %d' % n, description='...', category=rng.choice(ticket_categories),
+               submitted_by=rng.choice(resident_users))
+        for n in range(rows)
+    )
+    TicketComment.objects.bulk_create(
+        TicketComment(ticket=ticket, author=rng.choice(resident_users), content='...')
+        for ticket in tickets for _ in range(3)
+    )
+    forum_categories = ForumCategory.objects.bulk_create(
+        ForumCategory(name='Category %d' % n) for n in range(5)
+    )
+    posts = ForumPost.objects.bulk_create(
+        ForumPost(title='Post %d' % n, content='...', category=rng.choice(forum_categories),
+                  author=rng.choice(resident_users))
+        for n in range(rows)
+    )
+    ForumReply.objects.bulk_create(
+        ForumReply(post=post, author=rng.choice(resident_users), content='...')
+        for post in posts for _ in range(5)
+    )
+    polls = Poll.objects.bulk_create(
+        Poll(title='Poll %d' % n, description='...', created_by=rng.choice(admin_users),
+             start_date=now - timedelta(days=1), end_date=now + timedelta(days=7))
+        for n in range(5)
+    )
+    options = PollOption.objects.bulk_create(
+        PollOption(poll=poll, text='Option %d' % n) for poll in polls for n in range(4)
+    )
+
+    return {
+        'admins': [user.email for user in admin_users],
+        'residents': [user.email for user in resident_users],
+        'news': [str(pk) for pk in News.objects.filter(is_public=True).values_list('pk', flat=True)[:20]],
+        'events': [str(event.pk) for event in events[:20]],
+        'pages': ['page-%d' % n for n in range(20)],
+        'tickets': [str(ticket.pk) for ticket in tickets],
+        'posts': [str(post.pk) for post in posts[:20]],
+        'poll': str(polls[0].pk),
+        'poll_options': [str(option.pk) for option in options if option.poll_id == polls[0].pk],
+    }
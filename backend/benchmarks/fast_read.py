@@ -0,0 +1,81 @@
+"""
+Microbenchmark listing through the serializers against rendering the same
+lists from ``.values()`` rows with ``apps.core.fast_read``.
+
+Seeds a throwaway SQLite database with ``--rows`` payments and tickets (three
+comments each), then times loading and representing all of them both ways:
+the serializer over the queryset ``OptimizedQuerysetMixin`` would build, and
+a ``ValuesReader`` over the values rows. Checks that both give the same data
+and prints the best of ``--repeat`` runs as JSON.
+
+    python benchmarks/fast_read.py --rows 10000
+
+Run from the ``backend`` dir.
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import common
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=10000, help='Payments and tickets to list.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        common.setup_django('sqlite:///%s' % Path(directory, 'bench.sqlite3'))
+        from apps.core.fast_read import ValuesReader
+        from apps.core.optimizer import build_plan, optimize_queryset
+        from apps.core.renderers import FastJSONRenderer
+        from apps.payments.models import Payment
+        from apps.payments.serializers import PaymentSerializer
+        from apps.tickets.models import Ticket
+        from apps.tickets.serializers import TicketSerializer
+
+        # seed() creates three payments per resident.
+        common.seed(residents=-(-args.rows // 3), rows=args.rows)
+
+        renderer = FastJSONRenderer()
+        results = {'rows': args.rows}
+        for name, model, serializer_class in [
+            ('payments', Payment, PaymentSerializer),
+            ('tickets', Ticket, TicketSerializer),
+        ]:
+            serializer = serializer_class()
+            queryset = optimize_queryset(model.objects.all(), build_plan(serializer))[:args.rows]
+            reader = ValuesReader(serializer)
+
+            def serialize():
+                return serializer_class(queryset.all(), many=True).data
+
+            def fast():
+                return reader.render(reader.values(queryset.all()))
+
+            if renderer.render(fast()) != renderer.render(serialize()):
+                raise SystemExit('The %s lists disagree.' % name)
+            serializer_time = best_of(args.repeat, serialize)
+            fast_time = best_of(args.repeat, fast)
+            results[name] = {
+                'serializer_ms': round(serializer_time * 1000, 2),
+                'values_ms': round(fast_time * 1000, 2),
+                'speedup': round(serializer_time / fast_time, 1),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
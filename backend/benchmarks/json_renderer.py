@@ -0,0 +1,76 @@
+"""
+Microbenchmark the stock DRF JSON renderer/parser against the orjson-backed
+ones in ``apps.core``.
+
+Seeds a throwaway SQLite database with ``--rows`` payments, serializes them
+once with ``PaymentSerializer`` and then times rendering that data (and
+parsing the result back) with each implementation, checking that both
+render the same bytes. Prints the best of ``--repeat`` runs as JSON.
+
+    python benchmarks/json_renderer.py --rows 10000
+
+Run from the ``backend`` dir.
+"""
+import argparse
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import common
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=10000, help='Payments to serialize.')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        common.setup_django('sqlite:///%s' % Path(directory, 'bench.sqlite3'))
+        from rest_framework.parsers import JSONParser
+        from rest_framework.renderers import JSONRenderer
+
+        from apps.core.parsers import FastJSONParser
+        from apps.core.renderers import FastJSONRenderer
+        from apps.payments.models import Payment
+        from apps.payments.serializers import PaymentSerializer
+
+        # seed() creates three payments per resident.
+        common.seed(residents=-(-args.rows // 3), rows=1)
+        payments = Payment.objects.select_related('user', 'payment_type')[:args.rows]
+        data = PaymentSerializer(payments, many=True).data
+
+    body = JSONRenderer().render(data)
+    if FastJSONRenderer().render(data) != body:
+        raise SystemExit('The renderers disagree.')
+
+    results = {'rows': len(data), 'bytes': len(body)}
+    for name, renderer, json_parser in [
+        ('stock', JSONRenderer(), JSONParser()),
+        ('orjson', FastJSONRenderer(), FastJSONParser()),
+    ]:
+        render = best_of(args.repeat, lambda: renderer.render(data))
+        parse = best_of(args.repeat, lambda: json_parser.parse(io.BytesIO(body), 'application/json', {}))
+        results[name] = {
+            'render_ms': round(render * 1000, 2),
+            'parse_ms': round(parse * 1000, 2),
+            'render_mb_s': round(len(body) / render / 1e6, 1),
+        }
+    results['render_speedup'] = round(results['stock']['render_ms'] / results['orjson']['render_ms'], 1)
+    results['parse_speedup'] = round(results['stock']['parse_ms'] / results['orjson']['parse_ms'], 1)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
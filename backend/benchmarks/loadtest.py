@@ -0,0 +1,311 @@
+"""
+Load test the whole API in-process, through the real URLconf and middleware.
+
+Seeds a throwaway SQLite database (or ``--database-url``, which must point at
+an empty database), then runs a weighted mix of user sessions:
+
+    guest      browses news, events, documents and the CMS pages
+    resident   logs in and loads the dashboard: profile, bookings, payments,
+               tickets, forum and polls
+    admin      logs in and triages open tickets: list, open, update, comment
+    poll       the voting rush: residents vote on the same poll and reload it
+
+and reports throughput plus p50/p95/p99 latency and queries per request for
+every endpoint (keyed by URL pattern). Results are written as JSON so runs
+can be compared across commits:
+
+    python benchmarks/loadtest.py --sessions 300 --output before.json
+    python benchmarks/loadtest.py --sessions 300 --output after.json --compare before.json
+
+Run from the ``backend`` dir.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import common
+
+DEFAULT_MIX = 'guest=50,resident=30,admin=5,poll=15'
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.scenarios = defaultdict(lambda: {'sessions': 0, 'requests': 0, 'errors': 0, 'elapsed': 0.0})
+
+    def add(self, scenario, endpoint, elapsed, queries, status):
+        with self.lock:
+            self.samples[endpoint].append((elapsed, queries, status))
+            self.scenarios[scenario]['requests'] += 1
+            self.scenarios[scenario]['errors'] += status >= 400
+
+    def session_done(self, scenario, elapsed):
+        with self.lock:
+            self.scenarios[scenario]['sessions'] += 1
+            self.scenarios[scenario]['elapsed'] += elapsed
+
+
+class QueryCounter:
+    """Counts the queries run on this thread's connections."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Session:
+    def __init__(self, scenario, recorder, counter):
+        from django.test import Client
+
+        self.scenario = scenario
+        self.recorder = recorder
+        self.counter = counter
+        self.client = Client(HTTP_HOST='localhost')
+        self.headers = {}
+
+    def request(self, method, path, data=None, expect=(200, 201)):
+        kwargs = dict(self.headers)
+        if data is not None:
+            kwargs.update(data=json.dumps(data), content_type='application/json')
+        before = self.counter.count
+        started = time.perf_counter()
+        response = getattr(self.client, method)(path, **kwargs)
+        elapsed = time.perf_counter() - started
+        match = response.resolver_match
+        endpoint = '%s /%s' % (method.upper(), match.route if match else path)
+        status = response.status_code if response.status_code in expect else max(response.status_code, 400)
+        self.recorder.add(self.scenario, endpoint, elapsed, self.counter.count - before, status)
+        return response
+
+    def login(self, email):
+        response = self.request('post', '/api/users/login/', {'email': email, 'password': common.PASSWORD})
+        self.authenticate(response.json()['access'])
+
+    def authenticate(self, token):
+        self.headers = {'HTTP_AUTHORIZATION': 'Bearer %s' % token}
+
+
+def guest(session, data, rng):
+    session.request('get', '/api/news/')
+    session.request('get', '/api/news/%s/' % rng.choice(data['news']))
+    session.request('get', '/api/events/')
+    session.request('get', '/api/events/%s/' % rng.choice(data['events']))
+    session.request('get', '/api/documents/categories/')
+    session.request('get', '/api/documents/')
+    session.request('get', '/api/cms/pages/')
+    session.request('get', '/api/cms/pages/%s/' % rng.choice(data['pages']))
+    session.request('get', '/api/cms/board/')
+    session.request('get', '/api/cms/contacts/')
+
+
+def resident(session, data, rng):
+    session.login(rng.choice(data['residents']))
+    session.request('get', '/api/users/profile/')
+    session.request('get', '/api/users/profile/completion-status/')
+    session.request('get', '/api/news/')
+    session.request('get', '/api/events/')
+    session.request('get', '/api/bookings/')
+    session.request('get', '/api/payments/')
+    session.request('get', '/api/tickets/')
+    session.request('get', '/api/forum/posts/')
+    session.request('get', '/api/forum/posts/%s/' % rng.choice(data['posts']))
+    session.request('get', '/api/polls/')
+
+
+def admin(session, data, rng):
+    session.login(rng.choice(data['admins']))
+    session.request('get', '/api/tickets/?status=open')
+    for ticket in rng.sample(data['tickets'], 3):
+        session.request('get', '/api/tickets/%s/' % ticket)
+        session.request('patch', '/api/tickets/%s/update/' % ticket, {'status': 'in_progress', 'priority': 'high'})
+        session.request('post', '/api/tickets/%s/comment/' % ticket, {'content': 'Looking into it.'})
+
+
+def poll(session, data, rng):
+    # Tokens are minted directly: the rush is about voting, not logging in.
+    session.authenticate(data['tokens'].pop())
+    session.request('get', '/api/polls/%s/' % data['poll'])
+    session.request('post', '/api/polls/%s/vote/' % data['poll'], {'option': rng.choice(data['poll_options'])})
+    session.request('get', '/api/polls/%s/' % data['poll'])
+
+
+SCENARIOS = {'guest': guest, 'resident': resident, 'admin': admin, 'poll': poll}
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError('unknown scenario %r' % name)
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values, q):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def summarize(recorder, elapsed):
+    endpoints = {}
+    total = 0
+    for endpoint, samples in sorted(recorder.samples.items()):
+        latencies = sorted(sample[0] * 1000 for sample in samples)
+        queries = [sample[1] for sample in samples]
+        total += len(samples)
+        endpoints[endpoint] = {
+            'requests': len(samples),
+            'errors': sum(1 for sample in samples if sample[2] >= 400),
+            'rps': round(len(samples) / elapsed, 1),
+            'mean_ms': round(statistics.fmean(latencies), 2),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'queries_mean': round(statistics.fmean(queries), 2),
+            'queries_max': max(queries),
+        }
+    scenarios = {
+        name: dict(stats, elapsed=round(stats['elapsed'], 3)) for name, stats in sorted(recorder.scenarios.items())
+    }
+    return {
+        'requests': total,
+        'errors': sum(stats['errors'] for stats in scenarios.values()),
+        'elapsed_s': round(elapsed, 3),
+        'rps': round(total / elapsed, 1),
+        'scenarios': scenarios,
+        'endpoints': endpoints,
+    }
+
+
+def run(args, data):
+    from django.db import connections
+
+    rng = random.Random(args.seed)
+    names, weights = zip(*args.mix.items())
+    plan = rng.choices(names, weights, k=args.sessions)
+    # One fresh resident per vote so the rush doesn't hit "already voted".
+    if plan.count('poll') > len(data['residents']):
+        raise SystemExit('The poll rush needs a resident per vote; raise --residents.')
+    data['tokens'] = mint_tokens(data['residents'][:plan.count('poll')])
+
+    recorder = Recorder()
+    queue = list(enumerate(plan))
+    lock = threading.Lock()
+
+    def worker():
+        counter = QueryCounter()
+        for connection in connections.all():
+            connection.execute_wrappers.append(counter)
+        try:
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    index, name = queue.pop(0)
+                session_rng = random.Random('%s-%d' % (args.seed, index))
+                started = time.perf_counter()
+                SCENARIOS[name](Session(name, recorder, counter), data, session_rng)
+                recorder.session_done(name, time.perf_counter() - started)
+        finally:
+            for connection in connections.all():
+                connection.execute_wrappers.remove(counter)
+                connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(recorder, time.perf_counter() - started)
+
+
+def mint_tokens(emails):
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    users = get_user_model().objects.filter(email__in=emails)
+    return [str(RefreshToken.for_user(user).access_token) for user in users]
+
+
+def compare(result, baseline):
+    print('%-55s %18s %18s %14s' % ('endpoint', 'p50 ms', 'p95 ms', 'queries'))
+    for endpoint, stats in result['endpoints'].items():
+        before = baseline['endpoints'].get(endpoint)
+        if before is None:
+            print('%-55s %18s %18s %14s' % (endpoint, stats['p50_ms'], stats['p95_ms'], stats['queries_mean']))
+            continue
+        print('%-55s %18s %18s %14s' % (
+            endpoint,
+            '%s -> %s' % (before['p50_ms'], stats['p50_ms']),
+            '%s -> %s' % (before['p95_ms'], stats['p95_ms']),
+            '%s -> %s' % (before['queries_mean'], stats['queries_mean']),
+        ))
+    print('throughput: %s -> %s req/s (%s vs %s)' % (
+        baseline['summary']['rps'], result['rps'], baseline['commit'], common.git_commit(),
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sessions', type=int, default=200, help='Number of user sessions to run.')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX, help='Scenario weights (default: %(default)s).')
+    parser.add_argument('--concurrency', type=int, default=1, help='Sessions run in parallel (threads).')
+    parser.add_argument('--residents', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=200, help='Rows of each content type to seed.')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for the data and the session plan.')
+    parser.add_argument('--database-url', help='Empty database to use instead of a temporary SQLite file.')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the public response cache.')
+    parser.add_argument('--output', type=Path, help='Write the results to this JSON file.')
+    parser.add_argument('--compare', type=Path, help='Compare against a previous results file.')
+    args = parser.parse_args()
+    if isinstance(args.mix, str):
+        args.mix = parse_mix(args.mix)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or 'sqlite:///%s' % Path(directory, 'loadtest.sqlite3')
+        env = {'PUBLIC_CACHE_TIMEOUT': '0'} if args.no_cache else {}
+        common.setup_django(database_url, **env)
+        data = common.seed(residents=args.residents, rows=args.rows, seed=args.seed)
+        summary = run(args, data)
+
+    import django
+    from django.conf import settings
+
+    result = {
+        'commit': common.git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': settings.DATABASES['default']['ENGINE'],
+        'options': {
+            'sessions': args.sessions, 'mix': args.mix, 'concurrency': args.concurrency,
+            'residents': args.residents, 'rows': args.rows, 'seed': args.seed, 'cache': not args.no_cache,
+        },
+        'summary': {key: value for key, value in summary.items() if key != 'endpoints'},
+        'endpoints': summary['endpoints'],
+    }
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+    if args.compare:
+        compare(summary, json.loads(args.compare.read_text()))
+    else:
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
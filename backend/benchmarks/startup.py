@@ -0,0 +1,83 @@
+"""
+Measure how long a worker takes to boot: ``django.setup()`` plus importing
+the URLconf, each in a fresh interpreter (as gunicorn and the autoreloader
+do), and check it against a budget.
+
+Also checks that the dependencies only a few endpoints need (QR codes, TOTP,
+the Swagger/ReDoc docs) are still loaded lazily. Prints the median and best
+of ``--repeat`` runs as JSON and exits with an error if the median exceeds
+``--budget-ms`` or a lazy module was imported at boot.
+
+    python benchmarks/startup.py --repeat 10 --budget-ms 1200
+
+Run from the ``backend`` dir.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import common
+
+# Modules that must not be imported until a request needs them.
+LAZY_MODULES = ['drf_yasg', 'pkg_resources', 'qrcode', 'PIL', 'pyotp']
+
+CHILD = '''
+import json, os, sys, time
+sys.path.insert(0, %(backend)r)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hoa_backend.settings')
+started = time.perf_counter()
+import django
+django.setup()
+setup = time.perf_counter() - started
+started = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+urlconf = time.perf_counter() - started
+print(json.dumps({
+    'setup_ms': setup * 1000, 'urlconf_ms': urlconf * 1000,
+    'modules': len(sys.modules), 'lazy_loaded': [name for name in %(lazy)r if name in sys.modules],
+}))
+'''
+
+
+def boot():
+    code = CHILD % {'backend': str(common.BACKEND_DIR), 'lazy': LAZY_MODULES}
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=common.BACKEND_DIR, env=os.environ)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--budget-ms', type=float, default=float(os.environ.get('STARTUP_BUDGET_MS', 1200)),
+        help='Maximum median boot time (default: $STARTUP_BUDGET_MS or %(default)s).',
+    )
+    args = parser.parse_args()
+
+    runs = [boot() for _ in range(args.repeat)]
+    totals = [run['setup_ms'] + run['urlconf_ms'] for run in runs]
+    results = {
+        'commit': common.git_commit(),
+        'runs': args.repeat,
+        'setup_ms': round(statistics.median(run['setup_ms'] for run in runs), 1),
+        'urlconf_ms': round(statistics.median(run['urlconf_ms'] for run in runs), 1),
+        'total_ms': round(statistics.median(totals), 1),
+        'best_total_ms': round(min(totals), 1),
+        'modules': runs[-1]['modules'],
+        'lazy_loaded': runs[-1]['lazy_loaded'],
+        'budget_ms': args.budget_ms,
+    }
+    print(json.dumps(results, indent=2))
+
+    if results['lazy_loaded']:
+        raise SystemExit('Imported at boot but should be lazy: %s' % ', '.join(results['lazy_loaded']))
+    if results['total_ms'] > args.budget_ms:
+        raise SystemExit('Boot took %.0f ms, over the %.0f ms budget.' % (results['total_ms'], args.budget_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import os
+import shutil
+import tempfile
+
+# Workers write their request metrics here; /api/metrics/ adds them up.
+os.environ.setdefault('METRICS_ROOT', os.path.join(tempfile.gettempdir(), 'hoa-metrics-%d' % os.getpid()))
+
+
+def on_starting(server):
+    # Counters start from zero with every master process.
+    shutil.rmtree(os.environ['METRICS_ROOT'], ignore_errors=True)
+
+
+def worker_exit(server, worker):
+    from apps.core import metrics
+    from apps.core.db import log_connection_stats
+    from apps.users import audit
+
+    # Write any queued audit log entries before the worker goes away.
+    audit.shutdown()
+    log_connection_stats()
+    metrics.flush()
@@ -3,5 +3,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hoa_backend.settings')
+# Route the read endpoints to their async views when served over ASGI.
+os.environ.setdefault('ASYNC_READ_VIEWS', 'true')
+# Persistent connections aren't reused reliably across async requests; use
+# DB_POOL_SIZE for pooling under ASGI instead.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
-application = get_asgi_application()
\ No newline at end of file
+application = get_asgi_application()
@@ -1,6 +1,7 @@
+import importlib.util
 import os
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 from datetime import timedelta
 import dj_database_url
 
@@ -23,9 +24,9 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'corsheaders',  
     'django_filters',
-    'drf_yasg',
     
     # Local apps
+    'apps.core',
     'apps.users',
     'apps.news',
     'apps.events',
@@ -41,6 +42,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'apps.core.middleware.MetricsMiddleware',
+    'apps.core.middleware.CompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -48,14 +51,23 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.core.middleware.ReplicaMiddleware',
+    'apps.users.audit.AuditLogMiddleware',
+    'apps.core.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'hoa_backend.urls'
 
+# drf_yasg is not an installed app: importing it costs more worker boot time
+# than the rest of the URLconf, so hoa_backend.urls loads it on the first
+# request for /swagger/ or /redoc/. Its templates and static files are found
+# without importing it.
+DRF_YASG_DIR = os.path.dirname(importlib.util.find_spec('drf_yasg').origin)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
+        'DIRS': [os.path.join(DRF_YASG_DIR, 'templates')],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -69,14 +81,131 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'hoa_backend.wsgi.application'
+ASGI_APPLICATION = 'hoa_backend.asgi.application'
+
+# Serve the high-traffic read endpoints with native async views (see
+# apps/core/async_views.py). hoa_backend/asgi.py turns this on by default.
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
 
 # Database
+# Keep connections open between requests (seconds; 0 closes them after every
+# request) and ping a reused connection once per request before using it.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+# Size of the per-process PostgreSQL connection pool; 0 disables the pool.
+# Every gunicorn worker holds up to this many connections to the server.
+DB_POOL_SIZE = config('DB_POOL_SIZE', default=0, cast=int)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=float)
+
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL', default='sqlite:///db.sqlite3')
+        default=config('DATABASE_URL', default='sqlite:///db.sqlite3'),
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=DB_CONN_HEALTH_CHECKS,
     )
 }
 
+# Read replicas: comma-separated URLs, added as "replica1", "replica2", ...
+# Safe-method requests read from them (apps.core.db.routers); a user is pinned
+# to the primary for REPLICA_PIN_SECONDS after each write they make.
+DATABASE_REPLICAS = []
+for index, url in enumerate(config('DATABASE_REPLICA_URLS', default='', cast=Csv()), start=1):
+    alias = 'replica%d' % index
+    DATABASES[alias] = dj_database_url.parse(
+        url, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    )
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(alias)
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ['apps.core.db.routers.ReplicaRouter']
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
+for database in DATABASES.values():
+    if DB_POOL_SIZE and database['ENGINE'] == 'django.db.backends.postgresql':
+        database.update({
+            'ENGINE': 'apps.core.db.backends.postgresql_pool',
+            # Connections go back to the pool at the end of each request.
+            'CONN_MAX_AGE': 0,
+        })
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'max_size': DB_POOL_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+        }
+
+# Cache: Redis when REDIS_URL is set, otherwise a per-process local memory cache
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'hoa',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'hoa-default',
+            'KEY_PREFIX': 'hoa',
+        }
+    }
+
+# Celery. Without a broker, tasks run eagerly in-process against the
+# in-memory transport, so development and tests need no Redis or worker.
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL or 'memory://')
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=CELERY_BROKER_URL == 'memory://', cast=bool)
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+
+# Profile change audit log: written with one bulk INSERT per request, or
+# queued to a background thread and written in batches when async.
+AUDIT_LOG_ASYNC = config('AUDIT_LOG_ASYNC', default=False, cast=bool)
+AUDIT_LOG_BATCH_SIZE = config('AUDIT_LOG_BATCH_SIZE', default=100, cast=int)
+AUDIT_LOG_FLUSH_INTERVAL = config('AUDIT_LOG_FLUSH_INTERVAL', default=2.0, cast=float)
+
+# Seconds guest responses of PublicCacheMixin views are cached (0 disables)
+PUBLIC_CACHE_TIMEOUT = config('PUBLIC_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds each object's serialized representation is cached for GETs, keyed
+# by its updated_at (0 disables)
+FRAGMENT_CACHE_TIMEOUT = config('FRAGMENT_CACHE_TIMEOUT', default=300, cast=int)
+
+# POST /api/batch/ (apps.core.batch): GET sub-requests per batch, threads
+# for a concurrent batch, and seconds before unfinished ones answer 504 (0: no limit)
+BATCH_MAX_REQUESTS = config('BATCH_MAX_REQUESTS', default=10, cast=int)
+BATCH_MAX_CONCURRENCY = config('BATCH_MAX_CONCURRENCY', default=4, cast=int)
+BATCH_TIMEOUT = config('BATCH_TIMEOUT', default=10.0, cast=float)
+
+# GET /api/sync/ (apps.core.sync): seconds each sync token reaches back for
+# rows still being written, and days deleted rows are remembered (older
+# tokens sync from scratch; prune with manage.py prune_tombstones)
+SYNC_OVERLAP = config('SYNC_OVERLAP', default=5.0, cast=float)
+SYNC_TOMBSTONE_DAYS = config('SYNC_TOMBSTONE_DAYS', default=90, cast=int)
+
+# Response compression (gzip, plus br/zstd when Brotli/zstandard are installed)
+COMPRESSION_ENABLED = config('COMPRESSION_ENABLED', default=True, cast=bool)
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_CONTENT_TYPES = (
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml', 'text/',
+)
+
+# Request metrics for /api/metrics/ (Prometheus text format). Under gunicorn
+# each worker writes its numbers to METRICS_ROOT (see gunicorn.conf.py).
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_ROOT = config('METRICS_ROOT', default='')
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=5.0, cast=float)
+
+# Statements slower than SLOW_QUERY_THRESHOLD_MS (0 disables) are logged with
+# their view, calling code and EXPLAIN plan; summarize with manage.py slow_queries.
+SLOW_QUERY_THRESHOLD_MS = config('SLOW_QUERY_THRESHOLD_MS', default=500.0, cast=float)
+SLOW_QUERY_EXPLAIN = config('SLOW_QUERY_EXPLAIN', default=True, cast=bool)
+SLOW_QUERY_LOG = config('SLOW_QUERY_LOG', default=os.path.join(BASE_DIR, 'logs', 'slow_queries.log'))
+SLOW_QUERY_LOG_MAX_BYTES = config('SLOW_QUERY_LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int)
+SLOW_QUERY_LOG_BACKUPS = config('SLOW_QUERY_LOG_BACKUPS', default=5, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -102,12 +231,29 @@ USE_TZ = True
 # Static files
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STATICFILES_DIRS = [os.path.join(DRF_YASG_DIR, 'static')]
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Uploads larger than this are streamed to a temporary file instead of being
+# held in memory while the request is handled.
+FILE_UPLOAD_MAX_MEMORY_SIZE = config('FILE_UPLOAD_MAX_MEMORY_SIZE', default=512 * 1024, cast=int)
+
+# Resized WebP/JPEG copies of uploaded images, made in the background (see
+# apps.core.images). Larger images are rejected on upload.
+IMAGE_VARIANT_WIDTHS = config('IMAGE_VARIANT_WIDTHS', default='160,320,640,1280', cast=Csv(int))
+IMAGE_VARIANT_FORMATS = config('IMAGE_VARIANT_FORMATS', default='webp,jpeg', cast=Csv())
+IMAGE_VARIANT_QUALITY = config('IMAGE_VARIANT_QUALITY', default=80, cast=int)
+IMAGE_MAX_PIXELS = config('IMAGE_MAX_PIXELS', default=50000000, cast=int)
+
+# On-demand request profiling (admins only, via X-Profile: 1 or ?_profile=1)
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=True, cast=bool)
+PROFILING_ROOT = config('PROFILING_ROOT', default=os.path.join(BASE_DIR, 'profiles'))
+PROFILING_MAX_FILES = config('PROFILING_MAX_FILES', default=200, cast=int)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -122,15 +268,19 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed, same output as the stock JSON renderer and parser
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.core.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'apps.core.parsers.FastJSONParser',
         'rest_framework.parsers.MultiPartParser',
         'rest_framework.parsers.FormParser',
     ],
     'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
+    # Opt-in: lists stay unpaginated unless the client sends ?cursor= or ?page_size=
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.KeysetPagination',
+    'PAGE_SIZE': 25,
 }
 
 # JWT Settings
@@ -198,8 +348,11 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'x-profile',
 ]
 
+CORS_EXPOSE_HEADERS = ['X-Profile-Id', 'Server-Timing']
+
 CORS_ALLOW_METHODS = [
     'DELETE',
     'GET',
@@ -209,6 +362,29 @@ CORS_ALLOW_METHODS = [
     'PUT',
 ]
 
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'},
+        'json_lines': {'()': 'apps.core.db.slow_queries.JSONLineFormatter'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simple'},
+        'slow_queries': {'class': 'apps.core.db.slow_queries.SlowQueryFileHandler', 'formatter': 'json_lines'},
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': config('LOG_LEVEL', default='INFO'),
+        },
+        'apps.core.db.slow_queries': {
+            'handlers': ['slow_queries'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
 
 DEBUG = True  # Set to False in production
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0'] 
@@ -1,23 +1,41 @@
+from functools import lru_cache
+
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="HOA Management API",
-        default_version='v1',
-        description="API for HOA Management System",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="contact@hoa.local"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+
+
+@lru_cache(maxsize=None)
+def docs_view(renderer):
+    # drf_yasg takes longer to import than the rest of the URLconf, so it is
+    # loaded on the first request for the docs instead of at worker boot.
+    from drf_yasg.views import get_schema_view
+    from drf_yasg import openapi
+
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="HOA Management API",
+            default_version='v1',
+            description="API for HOA Management System",
+            terms_of_service="https://www.google.com/policies/terms/",
+            contact=openapi.Contact(email="contact@hoa.local"),
+            license=openapi.License(name="BSD License"),
+        ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+    return schema_view.with_ui(renderer, cache_timeout=0)
+
+
+def swagger_ui(request, *args, **kwargs):
+    return docs_view('swagger')(request, *args, **kwargs)
+
+
+def redoc(request, *args, **kwargs):
+    return docs_view('redoc')(request, *args, **kwargs)
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -32,10 +50,11 @@ urlpatterns = [
     path('api/forum/', include('apps.forum.urls')),
     path('api/polls/', include('apps.polls.urls')),
     path('api/cms/', include('apps.cms.urls')),
+    path('api/', include('apps.core.urls')),
     
     # API Documentation
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('swagger/', swagger_ui, name='schema-swagger-ui'),
+    path('redoc/', redoc, name='schema-redoc'),
 ]
 
 if settings.DEBUG:
@@ -13,7 +13,8 @@ def create_test_users():
             'full_name': 'HOA Administrator',
             'phone': '555-123-4567',
             'role': 'admin',
-            'unit_number': '',
+            'block': '',
+            'lot': '',
             'password': 'admin123',
             'is_staff': True,
             'is_superuser': True
@@ -24,7 +25,8 @@ def create_test_users():
             'full_name': 'John Smith',
             'phone': '555-234-5678',
             'role': 'admin',
-            'unit_number': '101',
+            'block': '1',
+            'lot': '01',
             'password': 'president123'
         },
         {
@@ -33,7 +35,8 @@ def create_test_users():
             'full_name': 'Jane Doe',
             'phone': '555-345-6789',
             'role': 'member',
-            'unit_number': '205',
+            'block': '2',
+            'lot': '05',
             'password': 'password123'
         },
         {
@@ -42,7 +45,8 @@ def create_test_users():
             'full_name': 'Mike Johnson',
             'phone': '555-456-7890',
             'role': 'member',
-            'unit_number': '310',
+            'block': '3',
+            'lot': '10',
             'password': 'password123'
         },
         {
@@ -51,7 +55,8 @@ def create_test_users():
             'full_name': 'Guest User',
             'phone': '555-567-8901',
             'role': 'guest',
-            'unit_number': '',
+            'block': '',
+            'lot': '',
             'password': 'guest123'
         }
     ]
@@ -13,7 +13,7 @@ def fix_user_roles():
         guest_users = User.objects.filter(role='guest').exclude(email__contains='guest')
         
         for user in guest_users:
-            if user.unit_number:  # If they have a unit number, they should be members
+            if user.block or user.lot:  # If they have a residence, they should be members
                 user.role = 'member'
                 user.save()
                 print(f"✅ Updated {user.email} from guest to member")
@@ -36,7 +36,7 @@ def fix_user_roles():
             status.append('STAFF')
         
         status_str = f" [{', '.join(status)}]" if status else ""
-        unit_str = f" (Unit: {user.unit_number})" if user.unit_number else ""
+        unit_str = f" (Block {user.block}, Lot {user.lot})" if user.block or user.lot else ""
         
         print(f"📧 {user.email} - Role: {user.role.upper()}{unit_str}{status_str}")
     
@@ -76,7 +76,8 @@ def create_additional_test_users():
             'full_name': 'Jane Smith',
             'phone': '555-111-2222',
             'role': 'member',
-            'unit_number': '101',
+            'block': '1',
+            'lot': '01',
             'password': 'member123'
         },
         {
@@ -85,7 +86,8 @@ def create_additional_test_users():
             'full_name': 'Bob Johnson',
             'phone': '555-333-4444',
             'role': 'member',
-            'unit_number': '205',
+            'block': '2',
+            'lot': '05',
             'password': 'member123'
         },
         {
@@ -94,7 +96,8 @@ def create_additional_test_users():
             'full_name': 'Sarah Wilson',
             'phone': '555-555-6666',
             'role': 'admin',
-            'unit_number': '301',
+            'block': '3',
+            'lot': '01',
             'password': 'admin123',
             'is_staff': True
         }
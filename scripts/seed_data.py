@@ -23,7 +23,8 @@ def create_users():
             'full_name': 'HOA Administrator',
             'role': 'admin',
             'phone': '(555) 123-4567',
-            'unit_number': 'Office',
+            'block': '',
+            'lot': '',
             'is_directory_visible': True,
         }
     )
@@ -39,7 +40,8 @@ def create_users():
             'username': 'president',
             'full_name': 'John Smith',
             'role': 'admin',
-            'unit_number': '101',
+            'block': '1',
+            'lot': '01',
             'phone': '(555) 234-5678',
         },
         {
@@ -47,7 +49,8 @@ def create_users():
             'username': 'treasurer',
             'full_name': 'Sarah Johnson',
             'role': 'admin',
-            'unit_number': '205',
+            'block': '2',
+            'lot': '05',
             'phone': '(555) 345-6789',
         }
     ]
@@ -70,7 +73,8 @@ def create_users():
             'username': 'resident1',
             'full_name': 'Michael Davis',
             'role': 'member',
-            'unit_number': '102',
+            'block': '1',
+            'lot': '02',
             'phone': '(555) 456-7890',
         },
         {
@@ -78,7 +82,8 @@ def create_users():
             'username': 'resident2', 
             'full_name': 'Emily Wilson',
             'role': 'member',
-            'unit_number': '203',
+            'block': '2',
+            'lot': '03',
             'phone': '(555) 567-8901',
         },
         {
@@ -86,7 +91,8 @@ def create_users():
             'username': 'resident3',
             'full_name': 'David Brown',
             'role': 'member',
-            'unit_number': '104',
+            'block': '1',
+            'lot': '04',
             'phone': '(555) 678-9012',
         }
     ]